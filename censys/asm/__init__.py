@@ -14,12 +14,14 @@ from .client import AsmClient
 from .clouds import Clouds
 from .inventory import InventorySearch
 from .logbook import Events, Logbook
+from .mirror import AssetMirror
 from .risks import Risks
 from .saved_queries import SavedQueries
 from .seeds import Seeds
 
 __all__ = [
     "AsmClient",
+    "AssetMirror",
     "Assets",
     "Beta",
     "CertificatesAssets",
@@ -1,9 +1,15 @@
 """Interact with the Censys Web Entities Assets API."""
 
-from typing import Iterator, Optional
+import itertools
+import queue
+import threading
+from typing import Any, Iterable, Iterator, Optional, Tuple
 
+from ...common.concurrency import worker_pool
 from .assets import Assets
 
+_DONE = object()
+
 
 class WebEntitiesAssets(Assets):
     """Web Entities Assets API class."""
@@ -57,3 +63,74 @@ class WebEntitiesAssets(Assets):
             if not cursor:
                 break
             args["cursor"] = cursor
+
+    def bulk_get_instances(
+        self,
+        names_and_ports: Iterable[str],
+        page_size: Optional[int] = None,
+        max_workers: int = 10,
+    ) -> Iterator[Tuple[str, dict]]:
+        """List the instances of many web entities concurrently.
+
+        Each web entity is paged through by one worker, and instances are
+        yielded as soon as their page arrives, so a slow web entity does not
+        hold back the others. At most two pages per worker wait to be
+        consumed, so workers pause while the caller is busy. Failed pages are
+        retried by the client, within its ``max_retries`` and retry budget.
+
+        Args:
+            names_and_ports (Iterable[str]): Web entities to query, such as ``example.com:443``.
+            page_size (int): Optional; Page size for retrieving instances.
+            max_workers (int): Optional; The number of workers to use. Defaults to 10.
+
+        Yields:
+            Tuple[str, dict]: Each web entity and one of its instances, or ``{"error": ...}`` if the web entity failed.
+        """
+        results: "queue.Queue[Tuple[str, Any]]" = queue.Queue(max_workers * 2)
+        stopped = threading.Event()
+
+        def put(item: Tuple[str, Any]):
+            # Give up waiting for a free slot once the caller has stopped
+            while not stopped.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def fetch(name_and_port: str):
+            args = {"pageSize": page_size, "cursor": None}
+            try:
+                while not stopped.is_set():
+                    res = self._get(
+                        f"{self.base_path}/{name_and_port}/instances", args=args
+                    )
+                    put((name_and_port, res.get("instances", [])))
+                    args["cursor"] = res.get("cursor")
+                    if not args["cursor"]:
+                        break
+            except Exception as e:
+                put((name_and_port, [{"error": str(e)}]))
+            finally:
+                put((name_and_port, _DONE))
+
+        entities = iter(names_and_ports)
+        with worker_pool(max_workers, self.executor) as executor:
+            try:
+                running = 0
+                for name_and_port in itertools.islice(entities, max_workers):
+                    executor.submit(fetch, name_and_port)
+                    running += 1
+                while running:
+                    name_and_port, page = results.get()
+                    if page is not _DONE:
+                        for instance in page:
+                            yield name_and_port, instance
+                        continue
+                    running -= 1
+                    for next_entity in itertools.islice(entities, 1):
+                        executor.submit(fetch, next_entity)
+                        running += 1
+            finally:
+                # Let running workers finish their current page if the caller stops early
+                stopped.set()
@@ -1,10 +1,11 @@
 """Interact with miscellaneous Censys Beta APIs."""
 
-from typing import List, Optional
+from typing import Iterable, List, MutableMapping, Optional
 
 from ..common.types import Datetime
 from ..common.utils import format_iso8601
 from .api import CensysAsmAPI
+from .timeseries import TimeSeries, backfill_counts, date_range
 
 
 class Beta(CensysAsmAPI):
@@ -102,6 +103,53 @@ class Beta(CensysAsmAPI):
             params=params,
         )
 
+    def backfill_asset_counts(
+        self,
+        start: Datetime,
+        environment: str,
+        asset_types: Iterable[str],
+        end: Optional[Datetime] = None,
+        include_countries: bool = False,
+        step: int = 1,
+        max_workers: int = 10,
+        cache: Optional[MutableMapping[str, dict]] = None,
+    ) -> TimeSeries:
+        """Retrieve asset counts for every date in a range.
+
+        The counts since each date are requested concurrently and returned
+        as one column per count, such as ``HOST.totalCount`` or
+        ``HOST.CLOUD.totalNewCount`` for a sub-environment.
+
+        Args:
+            start (Datetime): First date.
+            environment (str): Environment to include assets from.
+            asset_types (Iterable[str]): Asset types to count.
+            end (Datetime): Optional; Last date. Defaults to today (UTC).
+            include_countries (bool): Optional; Whether to add host counts by country in ``countries.*`` columns. Defaults to False.
+            step (int): Optional; Days between dates. Defaults to 1.
+            max_workers (int): Optional; The number of workers to use. Defaults to 10.
+            cache (MutableMapping[str, dict]): Optional; Cache of results for past dates, such as a ``shelve`` database. The counts since a date grow over time, so cached results are snapshots from the first request and are not refreshed.
+
+        Returns:
+            TimeSeries: Counts by column and date.
+        """
+
+        def fetcher(asset_type: str):
+            return lambda since: self.get_asset_counts(since, environment, asset_type)
+
+        fetchers = {asset_type: fetcher(asset_type) for asset_type in asset_types}
+        if include_countries:
+            fetchers["countries"] = lambda since: self.get_host_counts_by_country(
+                since, environment
+            )
+        return backfill_counts(
+            fetchers,
+            date_range(start, end, step),
+            max_workers,
+            cache,
+            f"beta/{environment}/",
+        )
+
     def get_user_workspaces(self, user_uuid: str):
         """Retrieve user workspaces.
 
@@ -1,8 +1,19 @@
 """Interact with the Censys Clouds API."""
 
+from typing import Iterable, MutableMapping, Optional
+
 from ..common.types import Datetime
 from ..common.utils import format_iso8601
 from .api import CensysAsmAPI
+from .timeseries import TimeSeries, backfill_counts, date_range
+
+COUNT_ASSET_TYPES = {
+    "hosts": "get_host_counts",
+    "domains": "get_domain_counts",
+    "object-stores": "get_object_store_counts",
+    "subdomains": "get_subdomain_counts",
+}
+"""Count method of each asset type."""
 
 
 class Clouds(CensysAsmAPI):
@@ -70,3 +81,48 @@ class Clouds(CensysAsmAPI):
             dict: Unknown count result.
         """
         return self._get(f"{self.base_path}/unknownCounts")
+
+    def backfill_counts(
+        self,
+        start: Datetime,
+        end: Optional[Datetime] = None,
+        asset_types: Optional[Iterable[str]] = None,
+        step: int = 1,
+        max_workers: int = 10,
+        cache: Optional[MutableMapping[str, dict]] = None,
+    ) -> TimeSeries:
+        """Retrieve counts by cloud for every date in a range.
+
+        The counts since each date are requested concurrently and returned
+        as one column per count, such as ``hosts.totalAssetCount`` or
+        ``hosts.AWS.assetCount``.
+
+        Args:
+            start (Datetime): First date.
+            end (Datetime): Optional; Last date. Defaults to today (UTC).
+            asset_types (Iterable[str]): Optional; Asset types to count. Defaults to all of hosts, domains, object-stores and subdomains.
+            step (int): Optional; Days between dates. Defaults to 1.
+            max_workers (int): Optional; The number of workers to use. Defaults to 10.
+            cache (MutableMapping[str, dict]): Optional; Cache of results for past dates, such as a ``shelve`` database. The counts since a date grow over time, so cached results are snapshots from the first request and are not refreshed.
+
+        Raises:
+            ValueError: If an asset type is not supported.
+
+        Returns:
+            TimeSeries: Counts by column and date.
+        """
+        asset_types = list(asset_types or COUNT_ASSET_TYPES)
+        for asset_type in asset_types:
+            if asset_type not in COUNT_ASSET_TYPES:
+                raise ValueError(f"Unsupported asset type: {asset_type}")
+
+        return backfill_counts(
+            {
+                asset_type: getattr(self, COUNT_ASSET_TYPES[asset_type])
+                for asset_type in asset_types
+            },
+            date_range(start, end, step),
+            max_workers,
+            cache,
+            "clouds/",
+        )
@@ -3,6 +3,7 @@
 import datetime
 from typing import Iterator, List, Optional, Union
 
+from ..common.utils import format_rfc3339
 from .api import CensysAsmAPI
 
 
@@ -13,13 +14,13 @@ class Logbook(CensysAsmAPI):
 
     def get_cursor(
         self,
-        start: Optional[Union[datetime.datetime, int]] = None,
+        start: Optional[Union[datetime.datetime, str, int]] = None,
         filters: Optional[List[str]] = None,
     ) -> str:
         """Requests a logbook cursor.
 
         Args:
-            start ([datetime.datetime, int]): Optional; Timestamp or event ID to begin searching.
+            start ([datetime.datetime, str, int]): Optional; Timestamp or event ID to begin searching.
             filters (list): Optional; List of filters applied to logbook search results.
 
         Returns:
@@ -70,13 +71,13 @@ class Filters:
 
 
 def format_data(
-    start: Optional[Union[datetime.datetime, int]] = None,
+    start: Optional[Union[datetime.datetime, str, int]] = None,
     filters: Optional[List[str]] = None,
 ) -> dict:
     """Formats cursor request data into a start date/id and filter list.
 
     Args:
-        start ([datetime.datetime, int]): Optional; Timestamp or event ID to begin searching.
+        start ([datetime.datetime, str, int]): Optional; Timestamp or event ID to begin searching.
         filters (list): Optional; List of filters applied to logbook search results.
 
     Returns:
@@ -89,6 +90,6 @@ def format_data(
     if isinstance(start, int):
         data["idFrom"] = start
     elif start:
-        data["dateFrom"] = start
+        data["dateFrom"] = format_rfc3339(start)
 
     return data
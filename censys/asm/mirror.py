@@ -0,0 +1,455 @@
+"""Keep a local SQLite copy of the Censys ASM inventory."""
+
+import datetime
+import json
+import sqlite3
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..common.concurrency import bounded_map
+from ..common.exceptions import (
+    CensysAssetNotFoundException,
+    CensysCertificateNotFoundException,
+    CensysDomainNotFoundException,
+    CensysException,
+    CensysHostNotFoundException,
+    CensysSubdomainNotFoundException,
+)
+from .client import AsmClient
+
+ASSET_TYPES = ["hosts", "domains", "certificates", "subdomains", "web-entities"]
+"""Asset types stored in the mirror."""
+
+EVENT_ASSET_TYPES = {
+    "HOST": ("hosts", "ipAddress"),
+    "DOMAIN": ("domains", "domain"),
+    "DOMAIN_SUBDOMAIN": ("subdomains", "subdomain"),
+    "CERT": ("certificates", "sha256"),
+}
+"""Asset type and entity key of each logbook event type prefix."""
+
+REMOVE_OPERATIONS = {"DISASSOCIATE", "REMOVE"}
+
+NOT_FOUND_EXCEPTIONS = (
+    CensysAssetNotFoundException,
+    CensysCertificateNotFoundException,
+    CensysDomainNotFoundException,
+    CensysHostNotFoundException,
+    CensysSubdomainNotFoundException,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (type, id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS asset_tags (
+    tag TEXT NOT NULL,
+    type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    PRIMARY KEY (tag, type, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS asset_tags_asset ON asset_tags (type, id);
+CREATE TABLE IF NOT EXISTS state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+) WITHOUT ROWID;
+"""
+
+
+def asset_id(asset: dict) -> Optional[str]:
+    """Finds the ID of an asset.
+
+    Args:
+        asset (dict): Asset returned by the API.
+
+    Returns:
+        Optional[str]: The asset ID.
+    """
+    for key in ("assetId", "id", "_id", "name", "subdomain"):
+        if asset.get(key):
+            return str(asset[key])
+    web_entity = asset.get("web_entity")
+    if isinstance(web_entity, dict) and web_entity.get("name"):
+        port = web_entity.get("port")
+        return f"{web_entity['name']}:{port}" if port else web_entity["name"]
+    return None
+
+
+def asset_tags(asset: dict) -> List[str]:
+    """Gets the tag names of an asset.
+
+    Args:
+        asset (dict): Asset returned by the API.
+
+    Returns:
+        List[str]: Tag names.
+    """
+    tags = asset.get("tags") or []
+    return [tag["name"] if isinstance(tag, dict) else str(tag) for tag in tags]
+
+
+def event_asset(event: dict) -> Optional[Tuple[str, str]]:
+    """Finds the asset changed by a logbook event.
+
+    Args:
+        event (dict): Logbook event.
+
+    Returns:
+        Optional[Tuple[str, str]]: Asset type and ID.
+    """
+    event_type = event.get("type") or ""
+    entity = event.get("entity") or {}
+    if event_type in EVENT_ASSET_TYPES:
+        asset_type, key = EVENT_ASSET_TYPES[event_type]
+    else:
+        prefix = event_type.split("_", 1)[0]
+        if prefix not in EVENT_ASSET_TYPES:
+            return None
+        asset_type, key = EVENT_ASSET_TYPES[prefix]
+    value = entity.get(key)
+    if not value:
+        return None
+    return asset_type, str(value)
+
+
+class AssetMirror:
+    """Local SQLite copy of the ASM inventory kept current from the logbook.
+
+    ``bootstrap`` downloads every asset once. ``sync`` then reads the
+    logbook from a cursor persisted in the database, deletes removed assets
+    and downloads changed ones again. Queries are answered from the
+    database without any API calls.
+
+    Web entities are not part of the logbook, so they are only updated by
+    ``bootstrap``.
+
+    Examples:
+        >>> from censys.asm import AssetMirror
+        >>> with AssetMirror("inventory.db") as mirror:
+        ...     mirror.bootstrap()
+        ...     mirror.sync()
+        ...     mirror.get("hosts", "1.1.1.1")
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        api_key: Optional[str] = None,
+        client: Optional[AsmClient] = None,
+        web_entities_query: str = "web_entity.name: *",
+        **kwargs: Any,
+    ):
+        """Inits AssetMirror.
+
+        Args:
+            path (str): Optional; Path of the SQLite database. Defaults to an in-memory database.
+            api_key (str): Optional; The API Key provided by Censys.
+            client (AsmClient): Optional; Client used to call the API.
+            web_entities_query (str): Optional; Inventory query returning web entities.
+            **kwargs: Arbitrary keyword arguments passed to the client.
+        """
+        self.client = client or AsmClient(api_key, **kwargs)
+        self.web_entities_query = web_entities_query
+        self._db = sqlite3.connect(path)
+        self._db.executescript(SCHEMA)
+
+    def __enter__(self) -> "AssetMirror":
+        """Enters the runtime context.
+
+        Returns:
+            AssetMirror: The mirror.
+        """
+        return self
+
+    def __exit__(self, *_: Any):
+        """Closes the database."""
+        self.close()
+
+    def close(self):
+        """Closes the database."""
+        self._db.close()
+
+    def _get_state(self, key: str) -> Optional[str]:
+        row = self._db.execute(
+            "SELECT value FROM state WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value: Any):
+        self._db.execute(
+            "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)",
+            (key, None if value is None else str(value)),
+        )
+
+    @property
+    def cursor(self) -> Optional[str]:
+        """Logbook cursor of the next events to apply.
+
+        Returns:
+            Optional[str]: The cursor, or None before ``bootstrap``.
+        """
+        return self._get_state("cursor")
+
+    @property
+    def last_event_id(self) -> Optional[int]:
+        """ID of the last applied logbook event.
+
+        Returns:
+            Optional[int]: The event ID.
+        """
+        value = self._get_state("last_event_id")
+        return int(value) if value else None
+
+    def _fetch_all(self, asset_type: str) -> Iterator[dict]:
+        if asset_type == "web-entities":
+            return iter(
+                self.client.inventory.search(
+                    query=self.web_entities_query, page_size=500, pages=-1
+                ).get("hits", [])
+            )
+        assets: Dict[str, Callable[[], Iterator[dict]]] = {
+            "hosts": self.client.hosts.get_assets,
+            "domains": self.client.domains.get_assets,
+            "certificates": self.client.certificates.get_assets,
+            "subdomains": self.client.subdomains.get_assets,
+        }
+        return assets[asset_type]()
+
+    def _rows(
+        self, asset_type: str, assets: Iterable[dict]
+    ) -> List[Tuple[str, str, str, List[str]]]:
+        rows = []
+        for asset in assets:
+            id_ = asset_id(asset)
+            if id_ is not None:
+                rows.append(
+                    (
+                        asset_type,
+                        id_,
+                        json.dumps(asset, separators=(",", ":")),
+                        asset_tags(asset),
+                    )
+                )
+        return rows
+
+    def _upsert(self, rows: List[Tuple[str, str, str, List[str]]]):
+        now = time.time()
+        self._db.executemany(
+            "INSERT OR REPLACE INTO assets (type, id, data, updated_at) VALUES (?, ?, ?, ?)",
+            [(type_, id_, data, now) for type_, id_, data, _ in rows],
+        )
+        self._db.executemany(
+            "DELETE FROM asset_tags WHERE type = ? AND id = ?",
+            [(type_, id_) for type_, id_, _, _ in rows],
+        )
+        self._db.executemany(
+            "INSERT OR IGNORE INTO asset_tags (tag, type, id) VALUES (?, ?, ?)",
+            [(tag, type_, id_) for type_, id_, _, tags in rows for tag in tags],
+        )
+
+    def _delete(self, keys: Iterable[Tuple[str, str]]):
+        keys = list(keys)
+        self._db.executemany("DELETE FROM assets WHERE type = ? AND id = ?", keys)
+        self._db.executemany("DELETE FROM asset_tags WHERE type = ? AND id = ?", keys)
+
+    def bootstrap(
+        self, asset_types: Optional[List[str]] = None, max_workers: int = 5
+    ) -> Dict[str, int]:
+        """Downloads every asset, replacing the stored assets.
+
+        Asset types are downloaded concurrently. A logbook cursor starting
+        at the time of the download is stored for ``sync``.
+
+        Args:
+            asset_types (List[str]): Optional; Asset types to download. Defaults to all.
+            max_workers (int): Optional; The number of workers to use. Defaults to 5.
+
+        Returns:
+            Dict[str, int]: Number of assets stored per asset type.
+        """
+        asset_types = asset_types or ASSET_TYPES
+        started = datetime.datetime.now(datetime.timezone.utc)
+        cursor = None if self.cursor else self.client.logbook.get_cursor(start=started)
+
+        counts = {}
+        for asset_type, task in bounded_map(
+            lambda type_: self._rows(type_, self._fetch_all(type_)),
+            asset_types,
+            max_workers,
+        ):
+            rows = task.result()
+            with self._db:
+                self._db.execute("DELETE FROM assets WHERE type = ?", (asset_type,))
+                self._db.execute("DELETE FROM asset_tags WHERE type = ?", (asset_type,))
+                self._upsert(rows)
+            counts[asset_type] = len(rows)
+
+        if cursor:
+            with self._db:
+                self._set_state("cursor", cursor)
+        return counts
+
+    def sync(self, max_workers: int = 10) -> Dict[str, int]:
+        """Applies logbook events since the last bootstrap or sync.
+
+        Removed assets are deleted and changed assets are downloaded again,
+        once per asset however many events changed it. Applying an event
+        twice is harmless, so an interrupted sync can simply be repeated.
+
+        Args:
+            max_workers (int): Optional; The number of workers to use. Defaults to 10.
+
+        Raises:
+            CensysException: If the mirror was never bootstrapped.
+
+        Returns:
+            Dict[str, int]: Number of events read, assets updated and assets deleted.
+        """
+        cursor = self.cursor
+        if not cursor:
+            raise CensysException("The mirror must be bootstrapped before syncing.")
+
+        changed: Dict[Tuple[str, str], bool] = {}
+        last_event_id = None
+        event_count = 0
+        for event in self.client.logbook.get_events(cursor):
+            event_count += 1
+            last_event_id = event.get("id", last_event_id)
+            key = event_asset(event)
+            if key is None:
+                continue
+            removed = event.get("type") in EVENT_ASSET_TYPES and (
+                event.get("operation") in REMOVE_OPERATIONS
+            )
+            changed[key] = removed
+
+        deleted = [key for key, removed in changed.items() if removed]
+        rows = []
+        for key, task in bounded_map(
+            lambda key: self._fetch_one(*key),
+            [key for key, removed in changed.items() if not removed],
+            max_workers,
+        ):
+            asset = task.result()
+            if asset is None:
+                deleted.append(key)
+            else:
+                rows.extend(self._rows(key[0], [asset]))
+
+        with self._db:
+            self._delete(deleted)
+            self._upsert(rows)
+            if last_event_id is not None:
+                self._set_state("last_event_id", last_event_id)
+                self._set_state(
+                    "cursor",
+                    self.client.logbook.get_cursor(start=int(last_event_id) + 1),
+                )
+        return {"events": event_count, "updated": len(rows), "deleted": len(deleted)}
+
+    def _fetch_one(self, asset_type: str, id_: str) -> Optional[dict]:
+        assets = {
+            "hosts": self.client.hosts,
+            "domains": self.client.domains,
+            "certificates": self.client.certificates,
+            "subdomains": self.client.subdomains,
+        }
+        try:
+            return assets[asset_type].get_asset_by_id(id_)
+        except NOT_FOUND_EXCEPTIONS:
+            return None
+
+    def get(self, asset_type: str, id_: str) -> Optional[dict]:
+        """Gets a stored asset.
+
+        Args:
+            asset_type (str): Asset type, such as ``hosts``.
+            id_ (str): Asset ID.
+
+        Returns:
+            Optional[dict]: The asset, or None if it is not stored.
+        """
+        row = self._db.execute(
+            "SELECT data FROM assets WHERE type = ? AND id = ?", (asset_type, id_)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def ids(self, asset_type: str) -> List[str]:
+        """Lists the IDs of stored assets.
+
+        Args:
+            asset_type (str): Asset type, such as ``hosts``.
+
+        Returns:
+            List[str]: Asset IDs.
+        """
+        return [
+            row[0]
+            for row in self._db.execute(
+                "SELECT id FROM assets WHERE type = ? ORDER BY id", (asset_type,)
+            )
+        ]
+
+    def assets(self, asset_type: str, tag: Optional[str] = None) -> Iterator[dict]:
+        """Iterates over stored assets.
+
+        Args:
+            asset_type (str): Asset type, such as ``hosts``.
+            tag (str): Optional; Only return assets with this tag.
+
+        Yields:
+            dict: Each asset.
+        """
+        if tag is None:
+            rows = self._db.execute(
+                "SELECT data FROM assets WHERE type = ? ORDER BY id", (asset_type,)
+            )
+        else:
+            rows = self._db.execute(
+                "SELECT a.data FROM asset_tags t JOIN assets a "
+                "ON a.type = t.type AND a.id = t.id "
+                "WHERE t.tag = ? AND t.type = ? ORDER BY a.id",
+                (tag, asset_type),
+            )
+        for row in rows:
+            yield json.loads(row[0])
+
+    def find(self, asset_type: str, field: str, value: Any) -> Iterator[dict]:
+        """Iterates over stored assets with a field equal to a value.
+
+        Args:
+            asset_type (str): Asset type, such as ``hosts``.
+            field (str): Dotted field path, such as ``data.ipAddress``.
+            value (Any): Value to match.
+
+        Yields:
+            dict: Each matching asset.
+        """
+        rows = self._db.execute(
+            "SELECT data FROM assets WHERE type = ? AND json_extract(data, ?) = ? "
+            "ORDER BY id",
+            (asset_type, f"$.{field}", value),
+        )
+        for row in rows:
+            yield json.loads(row[0])
+
+    def count(self, asset_type: Optional[str] = None) -> int:
+        """Counts stored assets.
+
+        Args:
+            asset_type (str): Optional; Only count assets of this type.
+
+        Returns:
+            int: Number of assets.
+        """
+        if asset_type is None:
+            row = self._db.execute("SELECT COUNT(*) FROM assets").fetchone()
+        else:
+            row = self._db.execute(
+                "SELECT COUNT(*) FROM assets WHERE type = ?", (asset_type,)
+            ).fetchone()
+        return row[0]
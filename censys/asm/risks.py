@@ -1,8 +1,12 @@
 """Interact with the Censys Risks API."""
 
+import itertools
 import urllib.parse
-from typing import Any, Dict, List, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+from ..common.concurrency import bounded_map, chunked
 from .api import CensysAsmAPI
 
 
@@ -72,11 +76,11 @@ class Risks(CensysAsmAPI):
             headers={"Accept": accept} if accept else None,
         )
 
-    def patch_risk_instances(self, data: dict) -> dict:
+    def patch_risk_instances(self, data: Union[dict, List[dict]]) -> dict:
         """Patch risk instances.
 
         Args:
-            data (dict): Risk instances data.
+            data (Union[dict, List[dict]]): Risk instances data.
 
         Returns:
             dict: Risk instances result.
@@ -99,6 +103,106 @@ class Risks(CensysAsmAPI):
             headers={"Accept": accept} if accept else None,
         )
 
+    def search_all_risk_instances(
+        self,
+        data: dict,
+        limit: int = 1000,
+        prefetch: int = 1,
+    ) -> Iterator[dict]:
+        """Search risk instances, following pagination.
+
+        The number of pages is taken from the ``total`` of the first page and
+        the number of risk instances it actually returned, so a server that
+        caps the page size below ``limit`` is still followed to the end. If
+        the response has no ``total``, pages are requested until one is
+        empty. While a page is being consumed, the next ``prefetch`` pages
+        are already requested in the background.
+
+        Args:
+            data (dict): Query data, without ``page`` and ``limit``.
+            limit (int): Optional; Number of risk instances per page. Defaults to 1000.
+            prefetch (int): Optional; Number of pages requested ahead. Defaults to 1.
+
+        Yields:
+            dict: Risk instance.
+        """
+
+        def search_page(page: int) -> List[dict]:
+            result = self.search_risk_instances({**data, "limit": limit, "page": page})
+            return result.get("risks") or []
+
+        first = self.search_risk_instances({**data, "limit": limit, "page": 1})
+        risks = first.get("risks") or []
+        total = first.get("total")
+        if not risks or (total is not None and len(risks) >= total):
+            yield from risks
+            return
+        pages: Iterator[int] = (
+            iter(range(2, -(-total // len(risks)) + 1))
+            if total is not None
+            else itertools.count(2)
+        )
+
+        if prefetch < 1:
+            yield from risks
+            for page in pages:
+                risks = search_page(page)
+                if not risks:
+                    return
+                yield from risks
+            return
+
+        with ThreadPoolExecutor(prefetch) as executor:
+            pending: Deque["Future[List[dict]]"] = deque(
+                executor.submit(search_page, page)
+                for page in itertools.islice(pages, prefetch)
+            )
+            try:
+                yield from risks
+                while pending:
+                    risks = pending.popleft().result()
+                    if not risks:
+                        return
+                    for page in itertools.islice(pages, 1):
+                        pending.append(executor.submit(search_page, page))
+                    yield from risks
+            finally:
+                # Pages past the last one are not needed
+                for future in pending:
+                    future.cancel()
+
+    def bulk_patch_risk_instances(
+        self,
+        patches: Iterable[dict],
+        chunk_size: int = 100,
+        max_workers: int = 4,
+    ) -> Iterator[Tuple[List[dict], dict]]:
+        """Patch many risk instances in concurrent chunks.
+
+        Patches are read lazily, and each chunk is sent as one request, so a
+        failure only affects its own chunk. Failed chunks are retried by the
+        client, within its ``max_retries`` and retry budget.
+
+        Args:
+            patches (Iterable[dict]): Risk instance patches, each with the risk instance ``id``.
+            chunk_size (int): Optional; Number of patches per request. Defaults to 100.
+            max_workers (int): Optional; The number of workers to use. Defaults to 4.
+
+        Yields:
+            Tuple[List[dict], dict]: Each chunk of patches and its result, or ``{"error": ...}`` if the chunk failed.
+        """
+        for chunk, task in bounded_map(
+            self.patch_risk_instances,
+            chunked(patches, chunk_size),
+            max_workers,
+            executor=self.executor,
+        ):
+            try:
+                result = task.result()
+            except Exception as e:
+                result = {"error": str(e)}
+            yield chunk, result
+
     def get_risk_instance(
         self, risk_instance_id: int, include_events: Optional[bool] = None
     ) -> dict:
@@ -1,14 +1,35 @@
 """Interact with the Censys Saved Queries API."""
 
-from typing import Optional
+import threading
+import time
+from typing import Dict, Iterator, Optional
 
 from .api import CensysAsmAPI
 
 
 class SavedQueries(CensysAsmAPI):
-    """Saved Queries API class."""
+    """Saved Queries API class.
+
+    Saved queries can be looked up by name with ``get_saved_query_by_name``.
+    To look up many names, ``refresh_saved_query_index`` first builds an
+    index of all saved queries, which is used for ``index_ttl`` seconds.
+    """
 
     base_path = "/inventory/v1/saved-query"
+    index_ttl: float = 300
+    """Seconds the saved query name index is used for."""
+
+    def __init__(self, api_key: Optional[str] = None, **kwargs):
+        """Inits SavedQueries.
+
+        Args:
+            api_key (str): Optional; The API Key provided by Censys.
+            **kwargs: Arbitrary keyword arguments.
+        """
+        super().__init__(api_key, **kwargs)
+        self._index: Dict[str, dict] = {}
+        self._index_loaded_at: Optional[float] = None
+        self._index_lock = threading.Lock()
 
     def get_saved_queries(
         self,
@@ -44,6 +65,71 @@ class SavedQueries(CensysAsmAPI):
 
         return self._get(self.base_path, args=args)
 
+    def get_all_saved_queries(
+        self, page_size: int = 100, query_name_prefix: Optional[str] = None
+    ) -> Iterator[dict]:
+        """Get every saved query, one page at a time.
+
+        Args:
+            page_size (int): Optional; Number of results per request. Defaults to 100.
+            query_name_prefix (str): Optional; Prefix for the saved query name.
+
+        Yields:
+            dict: Saved query.
+        """
+        page = 1
+        seen = 0
+        while True:
+            res = self.get_saved_queries(query_name_prefix, page_size, page)
+            results = res.get("results") or []
+            yield from results
+            seen += len(results)
+            total = res.get("totalResults")
+            if len(results) < page_size or (total and seen >= total):
+                break
+            page += 1
+
+    def refresh_saved_query_index(self) -> Dict[str, dict]:
+        """Fetch the saved query name index again.
+
+        Returns:
+            Dict[str, dict]: Saved queries by name.
+        """
+        with self._index_lock:
+            return self._refresh_index()
+
+    def _refresh_index(self) -> Dict[str, dict]:
+        self._index = {
+            query["queryName"]: query for query in self.get_all_saved_queries()
+        }
+        self._index_loaded_at = time.monotonic()
+        return self._index
+
+    def get_saved_query_by_name(self, query_name: str) -> Optional[dict]:
+        """Get a saved query by its name.
+
+        Names are first looked up in the index built by
+        ``refresh_saved_query_index``, so looking up many names costs a
+        single listing, and a name missing from a fresh index is not found.
+        Without a fresh index, the saved queries starting with the name are
+        requested until one has exactly that name.
+
+        Args:
+            query_name (str): The saved query's name.
+
+        Returns:
+            Optional[dict]: Saved query, or None if no saved query has the name.
+        """
+        with self._index_lock:
+            loaded_at = self._index_loaded_at
+            if loaded_at is not None and time.monotonic() - loaded_at <= self.index_ttl:
+                return self._index.get(query_name)
+        for query in self.get_all_saved_queries(query_name_prefix=query_name):
+            # The prefix filter also returns longer names
+            if query.get("queryName") == query_name:
+                return query
+        return None
+
     def add_saved_query(
         self,
         query: str,
@@ -1,11 +1,104 @@
 """Interact with the Censys Seeds API."""
 
-from typing import List, Optional
+import math
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from ..common.concurrency import bounded_map, chunked
 from .api import CensysAsmAPI
 
 SEED_TYPES = ["IP_ADDRESS", "DOMAIN_NAME", "CIDR", "ASN"]
 
+SeedKey = Tuple[str, str, str]
+
+
+def seed_key(seed: dict) -> SeedKey:
+    """Identifies a seed by its type, value and label.
+
+    Args:
+        seed (dict): Seed object.
+
+    Returns:
+        SeedKey: Seed type, value and label.
+    """
+    return seed.get("type", ""), str(seed.get("value", "")), seed.get("label") or ""
+
+
+def diff_seeds(
+    current: Iterable[dict],
+    desired: Iterable[dict],
+    labels: Optional[Iterable[str]] = None,
+    chunk_size: int = 1000,
+) -> Dict[str, Any]:
+    """Computes the changes needed to turn the current seeds into the desired seeds.
+
+    Only seeds with a label of a desired seed, or one of ``labels``, are
+    considered, so seeds managed elsewhere are left untouched. For each
+    label, the number of API calls needed to add and delete seeds one by
+    one is compared with replacing the whole label in a single call.
+    Unlabeled seeds are never replaced.
+
+    Args:
+        current (Iterable[dict]): Seeds in the ASM platform, with their IDs.
+        desired (Iterable[dict]): Seeds that should exist.
+        labels (Iterable[str]): Optional; Additional labels to synchronize.
+        chunk_size (int): Optional; Number of seeds added per request. Defaults to 1000.
+
+    Returns:
+        Dict[str, Any]: Seeds to add and to remove, labels to replace and the number of API calls.
+    """
+    desired_index: Dict[SeedKey, dict] = {}
+    for seed in desired:
+        desired_index.setdefault(seed_key(seed), seed)
+    scope = {key[2] for key in desired_index}
+    scope.update(labels or [])
+
+    current_index: Dict[SeedKey, dict] = {}
+    for seed in current:
+        key = seed_key(seed)
+        if key[2] in scope:
+            current_index.setdefault(key, seed)
+
+    to_add: Dict[str, List[dict]] = {label: [] for label in scope}
+    to_remove: Dict[str, List[dict]] = {label: [] for label in scope}
+    desired_by_label: Dict[str, List[dict]] = {label: [] for label in scope}
+    for key, seed in desired_index.items():
+        desired_by_label[key[2]].append(seed)
+        if key not in current_index:
+            to_add[key[2]].append(seed)
+    for key, seed in current_index.items():
+        if key not in desired_index:
+            to_remove[key[2]].append(seed)
+
+    seeds_to_add: List[dict] = []
+    seeds_to_remove: List[dict] = []
+    labels_to_replace: Dict[str, List[dict]] = {}
+    api_calls = 0
+    incremental_adds = 0
+    for label in sorted(scope):
+        adds, removes = to_add[label], to_remove[label]
+        incremental_calls = len(removes) + math.ceil(len(adds) / chunk_size)
+        if (
+            label
+            and removes
+            and incremental_calls > 1
+            and len(desired_by_label[label]) <= chunk_size
+        ):
+            labels_to_replace[label] = desired_by_label[label]
+            api_calls += 1
+        else:
+            incremental_adds += len(adds)
+            api_calls += len(removes)
+        seeds_to_add.extend(adds)
+        seeds_to_remove.extend(removes)
+
+    return {
+        "seedsToAdd": seeds_to_add,
+        "seedsToRemove": seeds_to_remove,
+        "labelsToReplace": labels_to_replace,
+        "unchangedCount": len(desired_index.keys() & current_index.keys()),
+        "apiCalls": api_calls + math.ceil(incremental_adds / chunk_size),
+    }
+
 
 class Seeds(CensysAsmAPI):
     """Seeds API class."""
@@ -60,6 +153,111 @@ class Seeds(CensysAsmAPI):
 
         return self._post(self.base_path, args=args, data=data)
 
+    def bulk_add_seeds(
+        self,
+        seeds: Iterable[dict],
+        force: Optional[bool] = None,
+        chunk_size: int = 1000,
+        max_workers: int = 4,
+    ) -> Iterator[Tuple[List[dict], dict]]:
+        """Add many seeds to the ASM platform in concurrent chunks.
+
+        Seeds are read lazily, so they can be streamed from a large file.
+        Failed chunks are retried by the client, within its ``max_retries``
+        and retry budget.
+
+        Args:
+            seeds (Iterable[dict]): Seed objects to add.
+            force (bool, optional): Forces replace operation.
+            chunk_size (int): Optional; Number of seeds per request. Defaults to 1000.
+            max_workers (int): Optional; The number of workers to use. Defaults to 4.
+
+        Yields:
+            Tuple[List[dict], dict]: Each chunk of seeds and its added seeds results, or ``{"error": ...}`` if the chunk failed.
+        """
+
+        def add_chunk(chunk: List[dict]) -> dict:
+            return self.add_seeds(chunk, force)
+
+        for chunk, task in bounded_map(
+            add_chunk, chunked(seeds, chunk_size), max_workers
+        ):
+            try:
+                result = task.result()
+            except Exception as e:
+                result = {"error": str(e)}
+            yield chunk, result
+
+    def sync(
+        self,
+        seeds: Iterable[dict],
+        labels: Optional[Iterable[str]] = None,
+        dry_run: bool = False,
+        force: Optional[bool] = None,
+        chunk_size: int = 1000,
+        max_workers: int = 10,
+    ) -> Dict[str, Any]:
+        """Synchronize seeds in the ASM platform with a list of desired seeds.
+
+        Current seeds are fetched once and compared locally with the desired
+        seeds. Seeds whose label is not used by any desired seed (or listed
+        in ``labels``) are not changed. Labels are replaced in a single call
+        when that is cheaper than adding and deleting seeds one by one;
+        other seeds are added in chunks and deleted concurrently.
+
+        Args:
+            seeds (Iterable[dict]): Seeds that should exist, including their labels.
+            labels (Iterable[str]): Optional; Additional labels to synchronize, such as labels whose seeds should all be removed.
+            dry_run (bool): Optional; Only compute the changes. Defaults to False.
+            force (bool, optional): Forces replace operation.
+            chunk_size (int): Optional; Number of seeds added per request. Defaults to 1000.
+            max_workers (int): Optional; The number of workers to use. Defaults to 10.
+
+        Returns:
+            Dict[str, Any]: Changes, as returned by ``diff_seeds``, and any errors.
+        """
+        plan = diff_seeds(self.get_seeds(), seeds, labels, chunk_size)
+        plan["errors"] = []
+        if dry_run:
+            return plan
+
+        errors: List[dict] = plan["errors"]
+        for label, label_seeds in plan["labelsToReplace"].items():
+            try:
+                if label_seeds:
+                    self.replace_seeds_by_label(
+                        label,
+                        [
+                            {"type": seed["type"], "value": seed["value"]}
+                            for seed in label_seeds
+                        ],
+                        force,
+                    )
+                else:
+                    self.delete_seeds_by_label(label)
+            except Exception as e:
+                errors.append({"label": label, "error": str(e)})
+
+        def is_incremental(seed: dict) -> bool:
+            return seed_key(seed)[2] not in plan["labelsToReplace"]
+
+        for chunk, res in self.bulk_add_seeds(
+            filter(is_incremental, plan["seedsToAdd"]), force, chunk_size, max_workers
+        ):
+            if "error" in res:
+                errors.extend({"seed": seed, "error": res["error"]} for seed in chunk)
+
+        for seed, task in bounded_map(
+            lambda seed: self.delete_seed_by_id(seed["id"]),
+            filter(is_incremental, plan["seedsToRemove"]),
+            max_workers,
+        ):
+            try:
+                task.result()
+            except Exception as e:
+                errors.append({"seed": seed, "error": str(e)})
+        return plan
+
     def replace_seeds_by_label(
         self, label: str, seeds: list, force: Optional[bool] = None
     ) -> dict:
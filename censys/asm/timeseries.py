@@ -0,0 +1,279 @@
+"""Backfill ASM asset counts into columnar time series."""
+
+import datetime
+import math
+from array import array
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
+
+from ..common.concurrency import bounded_map
+from ..common.exceptions import CensysException
+from ..common.types import Datetime
+
+LABEL_KEYS = ("cloudProvider", "environment", "countryCode", "country")
+"""Fields naming the items of count breakdown lists."""
+
+
+def to_date(value: Datetime) -> datetime.date:
+    """Converts a date, datetime or ``YYYY-MM-DD`` string to a date.
+
+    Args:
+        value (Datetime): Value to convert.
+
+    Returns:
+        datetime.date: The date.
+    """
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(value[:10])
+
+
+def date_range(
+    start: Datetime, end: Optional[Datetime] = None, step: int = 1
+) -> List[datetime.date]:
+    """Lists the dates from start to end, both included.
+
+    Args:
+        start (Datetime): First date.
+        end (Datetime): Optional; Last date. Defaults to today (UTC).
+        step (int): Optional; Days between dates. Defaults to 1.
+
+    Raises:
+        ValueError: If step is smaller than 1.
+
+    Returns:
+        List[datetime.date]: The dates.
+    """
+    if step < 1:
+        raise ValueError("Step must be at least 1 day.")
+    first = to_date(start)
+    last = (
+        to_date(end)
+        if end is not None
+        else datetime.datetime.now(datetime.timezone.utc).date()
+    )
+    days = (last - first).days
+    return [first + datetime.timedelta(days=day) for day in range(0, days + 1, step)]
+
+
+def flatten_counts(result: dict, prefix: str = "") -> Dict[str, float]:
+    """Flattens a count result into named numbers.
+
+    Numbers become ``prefix.field`` columns, and breakdown lists such as
+    counts by cloud provider become ``prefix.label.field`` columns.
+
+    Examples:
+        >>> flatten_counts(
+        ...     {"totalAssetCount": 3, "assetCountByProvider": [
+        ...         {"cloudProvider": "AWS", "assetCount": 2}
+        ...     ]},
+        ...     "hosts",
+        ... )
+        {'hosts.totalAssetCount': 3, 'hosts.AWS.assetCount': 2}
+
+    Args:
+        result (dict): Count result returned by the API.
+        prefix (str): Optional; Column name prefix.
+
+    Returns:
+        Dict[str, float]: Numbers by column name.
+    """
+    counts: Dict[str, float] = {}
+    for key, value in result.items():
+        if isinstance(value, bool):
+            continue
+        if isinstance(value, (int, float)):
+            counts[f"{prefix}.{key}" if prefix else key] = value
+        elif isinstance(value, list):
+            for item in value:
+                if not isinstance(item, dict):
+                    continue
+                label = next(
+                    (str(item[k]) for k in LABEL_KEYS if item.get(k) is not None),
+                    None,
+                )
+                if label is None:
+                    continue
+                counts.update(
+                    flatten_counts(item, f"{prefix}.{label}" if prefix else label)
+                )
+    return counts
+
+
+class TimeSeries:
+    """Dense columnar time series of counts.
+
+    Each column is an ``array("d")`` with one value per date. Dates whose
+    request failed are ``nan`` in the columns of that request, and counts
+    missing from a successful result, such as a cloud provider without
+    assets yet, are 0.
+
+    Examples:
+        >>> series = clouds.backfill_counts("2024-01-01", "2024-01-31")
+        >>> series["hosts.totalAssetCount"]
+        array('d', [...])
+        >>> df = series.to_pandas()
+    """
+
+    def __init__(
+        self,
+        dates: List[datetime.date],
+        columns: Dict[str, array],
+        errors: Optional[Dict[str, str]] = None,
+    ):
+        """Inits TimeSeries.
+
+        Args:
+            dates (List[datetime.date]): Date of each row.
+            columns (Dict[str, array]): Values of each column.
+            errors (Dict[str, str]): Optional; Error of each failed request.
+        """
+        self.dates = dates
+        self.columns = columns
+        self.errors = errors or {}
+
+    def __len__(self) -> int:
+        """Number of dates.
+
+        Returns:
+            int: Row count.
+        """
+        return len(self.dates)
+
+    def __getitem__(self, name: str) -> array:
+        """Gets a column.
+
+        Args:
+            name (str): Column name.
+
+        Returns:
+            array: Column values.
+        """
+        return self.columns[name]
+
+    def __iter__(self) -> Iterator[Tuple[datetime.date, Dict[str, float]]]:
+        """Iterates over rows.
+
+        Yields:
+            Tuple[datetime.date, Dict[str, float]]: Each date and its values.
+        """
+        for index, date in enumerate(self.dates):
+            yield date, {name: values[index] for name, values in self.columns.items()}
+
+    def __repr__(self) -> str:
+        """Representation of TimeSeries.
+
+        Returns:
+            str: Printable representation.
+        """
+        return f"TimeSeries({len(self.dates)} dates, {len(self.columns)} columns)"
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """Converts the series to lists, with ISO dates in the ``date`` column.
+
+        Returns:
+            Dict[str, List[Any]]: Values by column name.
+        """
+        data: Dict[str, List[Any]] = {"date": [d.isoformat() for d in self.dates]}
+        for name, values in self.columns.items():
+            data[name] = values.tolist()
+        return data
+
+    def to_pandas(self) -> Any:
+        """Converts the series to a pandas DataFrame indexed by date.
+
+        Requires the optional ``pandas`` package.
+
+        Raises:
+            CensysException: If pandas is not installed.
+
+        Returns:
+            pandas.DataFrame: The time series.
+        """
+        try:
+            import pandas
+        except ImportError as error:
+            raise CensysException(
+                "Converting to a DataFrame requires pandas. "
+                "Install it with: pip install pandas"
+            ) from error
+        return pandas.DataFrame(
+            {name: values for name, values in self.columns.items()},
+            index=pandas.DatetimeIndex(self.dates, name="date"),
+        )
+
+
+def backfill_counts(
+    fetchers: Dict[str, Callable[[datetime.date], dict]],
+    dates: List[datetime.date],
+    max_workers: int = 10,
+    cache: Optional[MutableMapping[str, dict]] = None,
+    cache_namespace: str = "",
+) -> TimeSeries:
+    """Calls count endpoints for every date concurrently.
+
+    Results for dates before today (UTC) are stored in ``cache`` and are not
+    requested again. Today's counts are always requested. Counts *since* a
+    date keep growing as new assets are seen, so a cached result is a
+    snapshot taken when it was first requested; use a new cache (or
+    namespace) when the counts need to be current.
+
+    Args:
+        fetchers (Dict[str, Callable[[datetime.date], dict]]): Function returning the counts since a date, by column prefix.
+        dates (List[datetime.date]): Dates to request.
+        max_workers (int): Optional; The number of workers to use. Defaults to 10.
+        cache (MutableMapping[str, dict]): Optional; Cache of historical results, such as a ``shelve`` database. Cached counts are not refreshed.
+        cache_namespace (str): Optional; Prefix of the cache keys.
+
+    Returns:
+        TimeSeries: Counts by column and date.
+    """
+    today = datetime.datetime.now(datetime.timezone.utc).date()
+    results: Dict[Tuple[str, int], Dict[str, float]] = {}
+    errors: Dict[str, str] = {}
+    pending: List[Tuple[str, int]] = []
+    for prefix in fetchers:
+        for index, date in enumerate(dates):
+            key = f"{cache_namespace}{prefix}/{date.isoformat()}"
+            if cache is not None and key in cache:
+                results[prefix, index] = flatten_counts(cache[key], prefix)
+            else:
+                pending.append((prefix, index))
+
+    def fetch(item: Tuple[str, int]) -> dict:
+        prefix, index = item
+        return fetchers[prefix](dates[index])
+
+    # The cache is only used from this thread, so it does not need to be thread-safe
+    for (prefix, index), task in bounded_map(fetch, pending, max_workers):
+        date = dates[index]
+        try:
+            result = task.result()
+        except Exception as e:
+            errors[f"{prefix}/{date.isoformat()}"] = str(e)
+            continue
+        if cache is not None and date < today:
+            cache[f"{cache_namespace}{prefix}/{date.isoformat()}"] = result
+        results[prefix, index] = flatten_counts(result, prefix)
+
+    names = sorted({name for counts in results.values() for name in counts})
+    columns = {name: array("d", [math.nan]) * len(dates) for name in names}
+    for prefix in fetchers:
+        prefix_names = [name for name in names if name.startswith(f"{prefix}.")]
+        for index in range(len(dates)):
+            counts = results.get((prefix, index))
+            if counts is None:
+                continue
+            for name in prefix_names:
+                columns[name][index] = counts.get(name, 0)
+    return TimeSeries(dates, columns, errors)
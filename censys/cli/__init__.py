@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 # PYTHON_ARGCOMPLETE_OK
 """Interact with the Censys Search API through the command line."""
+import cProfile
 import sys
 
 import argcomplete
 
 from .args import get_parser
+from .utils import err_console, print_stats
+from censys.common.stats import enable_process_stats
 from censys.common.version import __version__
 
 
@@ -23,10 +26,22 @@ def main():
         print(f"Censys Python Version: {__version__}")
         sys.exit(0)
 
+    stats = enable_process_stats() if args.stats else None
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler:
+        profiler.enable()
+
     try:
         args.func(args)
     except KeyboardInterrupt:  # pragma: no cover
         sys.exit(1)
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            err_console.print(f"Wrote profile to {args.profile}", soft_wrap=True)
+        if stats:
+            print_stats(stats.summary())
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -47,6 +47,17 @@ def get_parser() -> argparse.ArgumentParser:
         default=False,
         help="display version",
     )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        default=False,
+        help="print request counts, retries, latency percentiles and phase timings to stderr at exit",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="write a cProfile profile of the command to a file",
+    )
 
     def print_help(_: argparse.Namespace):
         """Prints help."""
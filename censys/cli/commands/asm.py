@@ -6,23 +6,26 @@ import csv
 import json
 import sys
 import threading
-from typing import Dict, List, Union
+import time
+from typing import Any, Dict, Iterator, List, Union
 from xml.etree import ElementTree
 
-from rich.progress import Progress, TaskID
+from rich.progress import Progress, TaskID, TextColumn, TimeElapsedColumn
 from rich.prompt import Confirm, Prompt
 
 from censys.asm.api import CensysAsmAPI
 from censys.asm.inventory import InventorySearch
 from censys.asm.saved_queries import SavedQueries
 from censys.asm.seeds import SEED_TYPES, Seeds
-from censys.cli.utils import console
+from censys.cli.utils import console, err_console
+from censys.common.concurrency import bounded_map
 from censys.common.config import DEFAULT, get_config, write_config
 from censys.common.exceptions import (
     CensysAsmException,
     CensysSeedNotFoundException,
     CensysUnauthorizedException,
 )
+from censys.common.stats import timed_phase
 
 
 def cli_asm_config(_: argparse.Namespace):  # pragma: no cover
@@ -72,6 +75,55 @@ def cli_asm_config(_: argparse.Namespace):  # pragma: no cover
         sys.exit(1)
 
 
+def iter_seeds_from_xml(file: str) -> Iterator[Dict[str, str]]:
+    """Stream seeds from nmap xml.
+
+    The file is parsed incrementally and each host is discarded once read.
+
+    Args:
+        file (str): Nmap xml file.
+
+    Yields:
+        Dict[str, str]: Each unique seed.
+    """
+    ips = set()
+    domains = set()
+    root = None
+    depth = 0
+    for event, element in ElementTree.iterparse(file, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+            depth += 1
+            continue
+        depth -= 1
+        if depth != 1 or root is None:
+            continue
+        if element.tag == "host":
+            address_element = element.find("address")
+            hostnames_element = element.find("hostnames")
+            if (
+                address_element is not None
+                and address_element.get("addrtype") == "ipv4"
+            ):
+                ip_address = address_element.get("addr")
+                if ip_address and ip_address not in ips:
+                    ips.add(ip_address)
+                    yield {"value": ip_address, "type": "IP_ADDRESS"}
+            if hostnames_element is not None:
+                hostname_elements = hostnames_element.findall("hostname")
+                for hostname_element in hostname_elements:
+                    hostname_type = hostname_element.get("type")
+                    if hostname_type != "user":
+                        continue
+                    hostname = hostname_element.get("name")
+                    if hostname and hostname not in domains:
+                        domains.add(hostname)
+                        yield {"value": hostname, "type": "DOMAIN_NAME"}
+        # Drop the elements read so far
+        root.clear()
+
+
 def get_seeds_from_xml(file: str) -> List[Dict[str, str]]:
     """Get seeds from nmap xml.
 
@@ -81,42 +133,20 @@ def get_seeds_from_xml(file: str) -> List[Dict[str, str]]:
     Returns:
         List[Dict[str, str]]: List of seeds.
     """
-    tree = ElementTree.parse(file)
-    root = tree.getroot()
-    ips = set()
-    domains = set()
-    for element in root.findall("host"):
-        address_element = element.find("address")
-        hostnames_element = element.find("hostnames")
-        if address_element is not None and address_element.get("addrtype") == "ipv4":
-            ip_address = address_element.get("addr")
-            if ip_address:
-                ips.add(ip_address)
-        if hostnames_element is not None:
-            hostname_elements = hostnames_element.findall("hostname")
-            for hostname_element in hostname_elements:
-                hostname_type = hostname_element.get("type")
-                if hostname_type != "user":
-                    continue
-                hostname = hostname_element.get("name")
-                if hostname:
-                    domains.add(hostname)
-    return [{"value": ip, "type": "IP_ADDRESS"} for ip in ips] + [
-        {"value": domain, "type": "DOMAIN_NAME"} for domain in domains
-    ]
+    seeds = list(iter_seeds_from_xml(file))
+    return sorted(seeds, key=lambda seed: seed["type"] != "IP_ADDRESS")
 
 
-def get_seeds_from_params(
-    args: argparse.Namespace, command_name: str
-) -> List[Dict[str, Union[str, int]]]:
-    """Get seeds from params.
+def _read_seeds(args: argparse.Namespace) -> Iterator[Any]:
+    """Read raw seeds from params.
+
+    CSV and nmap xml input is streamed. JSON input is decoded at once.
 
     Args:
         args (Namespace): Argparse Namespace.
-        command_name (str): The name of the command getting the seeds to be processed.
 
-    Returns:
-        List[Dict[str, str]]: List of seeds.
+    Yields:
+        Any: Each raw seed.
     """
     is_csv = args.csv
     if args.input_file or args.json:
@@ -129,18 +159,20 @@ def get_seeds_from_params(
                     is_csv = True
                 file = open(args.input_file)  # noqa: SIM115
 
-            if is_csv:
-                seeds = []
-                csv_reader = csv.DictReader(file, delimiter=",")
-                if csv_reader.fieldnames:
-                    # Lowercase the field names
-                    csv_reader.fieldnames = [
-                        string.lower() for string in csv_reader.fieldnames
-                    ]
-                for row in csv_reader:
-                    seeds.append(row)
-            else:
+            try:
+                if is_csv:
+                    csv_reader = csv.DictReader(file, delimiter=",")
+                    if csv_reader.fieldnames:
+                        # Lowercase the field names
+                        csv_reader.fieldnames = [
+                            string.lower() for string in csv_reader.fieldnames
+                        ]
+                    yield from csv_reader
+                    return
                 json_data = file.read()
+            finally:
+                if file is not sys.stdin:
+                    file.close()
         else:
             json_data = args.json
 
@@ -150,15 +182,28 @@ def get_seeds_from_params(
             except json.decoder.JSONDecodeError as e:
                 console.print(f"Invalid json {e}")
                 sys.exit(1)
+            yield from seeds
     elif args.nmap_xml:
         try:
-            seeds = get_seeds_from_xml(args.nmap_xml)
+            yield from iter_seeds_from_xml(args.nmap_xml)
         except ElementTree.ParseError as e:
             console.print(f"Invalid xml {e}")
             sys.exit(1)
 
-    seeds_to_add = []
-    for seed in seeds:
+
+def iter_seeds_from_params(
+    args: argparse.Namespace, command_name: str
+) -> Iterator[Dict[str, Union[str, int]]]:
+    """Stream seeds from params.
+
+    Args:
+        args (Namespace): Argparse Namespace.
+        command_name (str): The name of the command getting the seeds to be processed.
+
+    Yields:
+        Dict[str, Union[str, int]]: Each seed.
+    """
+    for seed in _read_seeds(args):
         if isinstance(seed, str):
             seed = {"value": seed}
 
@@ -181,14 +226,26 @@ def get_seeds_from_params(
         # we will strip the id, source, createdOn, and any other junk that might be there
         #
         valid_params = ["type", "value"]
-        if command_name == "add-seeds":
+        if command_name in ("add-seeds", "sync-seeds"):
             valid_params.append("label")
         elif command_name == "delete-seeds" and "value" not in seed:
             valid_params.append("id")
-        filtered_seeds = {key: seed[key] for key in seed if key in valid_params}
-        seeds_to_add.append(filtered_seeds)
+        yield {key: seed[key] for key in seed if key in valid_params}
 
-    return seeds_to_add
+
+def get_seeds_from_params(
+    args: argparse.Namespace, command_name: str
+) -> List[Dict[str, Union[str, int]]]:
+    """Get seeds from params.
+
+    Args:
+        args (Namespace): Argparse Namespace.
+        command_name (str): The name of the command getting the seeds to be processed.
+
+    Returns:
+        List[Dict[str, str]]: List of seeds.
+    """
+    return list(iter_seeds_from_params(args, command_name))
 
 
 def console_clear_line():
@@ -200,16 +257,45 @@ def console_clear_line():
 def cli_add_seeds(args: argparse.Namespace):
     """Add seed subcommand.
 
+    Seeds are streamed from the input and added in concurrent chunks.
+
     Args:
         args (Namespace): Argparse Namespace.
     """
-    seeds_to_add = get_seeds_from_params(args, "add-seeds")
+    seeds_to_add = iter_seeds_from_params(args, "add-seeds")
 
     s = Seeds(args.api_key)
-    to_add_count = len(seeds_to_add)
-    res = s.add_seeds(seeds_to_add)
-    added_seeds = res["addedSeeds"]
-    added_count = len(added_seeds)
+    to_add_count = 0
+    added_count = 0
+    failed_count = 0
+    not_added_seeds: List[dict] = []
+    start = time.monotonic()
+    with Progress(
+        TextColumn("[cyan]Adding[/cyan]"),
+        TextColumn("{task.completed:,.0f} seeds"),
+        TimeElapsedColumn(),
+        console=err_console,
+        transient=True,
+    ) as progress:
+        progress_task_id = progress.add_task("Adding", total=None)
+        for chunk, res in s.bulk_add_seeds(
+            seeds_to_add, chunk_size=args.chunk_size, max_workers=args.workers
+        ):
+            to_add_count += len(chunk)
+            progress.update(progress_task_id, advance=len(chunk))
+            if "error" in res:
+                failed_count += len(chunk)
+                console.print(f"Failed to add {len(chunk)} seeds: {res['error']}")
+                continue
+            added_seeds = res["addedSeeds"]
+            added_count += len(added_seeds)
+            if args.verbose and len(added_seeds) < len(chunk):  # pragma: no cover
+                added_values = {seed["value"] for seed in added_seeds}
+                not_added_seeds.extend(
+                    seed for seed in chunk if seed["value"] not in added_values
+                )
+    elapsed = time.monotonic() - start
+
     if not added_count:
         console.print("No seeds were added. (Run with -v to get more info)")
         if not args.verbose:
@@ -218,13 +304,19 @@ def cli_add_seeds(args: argparse.Namespace):
         console.print(f"Added {added_count} seeds.")
     if added_count < to_add_count:
         console.print(f"Seeds not added: {to_add_count - added_count}")
-        if args.verbose:  # pragma: no cover
+        if not_added_seeds:  # pragma: no cover
             console.print(
                 "The following seed(s) were not able to be added as they already exist or are reserved."
             )
-            for seed in seeds_to_add:
-                if not any(s for s in added_seeds if seed["value"] == s["value"]):
-                    console.print(f"{seed}")
+            for seed in not_added_seeds:
+                console.print(f"{seed}")
+    if args.verbose and elapsed > 0:
+        console.print(
+            f"Processed {to_add_count} seeds in {elapsed:.2f}s "
+            f"({to_add_count / elapsed:,.0f} seeds/s)."
+        )
+    if failed_count:
+        sys.exit(1)
 
 
 def cli_delete_seeds(args: argparse.Namespace):
@@ -402,6 +494,59 @@ def cli_replace_seeds_with_label(args: argparse.Namespace):
                 console.print(f"    {skipped_seed}")
 
 
+def cli_sync_seeds(args: argparse.Namespace):
+    """Sync seeds subcommand.
+
+    Args:
+        args (Namespace): Argparse Namespace.
+    """
+    desired_seeds = iter_seeds_from_params(args, "sync-seeds")
+    s = Seeds(args.api_key)
+
+    res = s.sync(
+        desired_seeds,
+        dry_run=args.dry_run,
+        chunk_size=args.chunk_size,
+        max_workers=args.workers,
+    )
+    seeds_to_add = res["seedsToAdd"]
+    seeds_to_remove = res["seedsToRemove"]
+
+    if args.dry_run or args.verbose:
+        for seed in seeds_to_add:
+            console.print(
+                f"+ {seed['type']} {seed['value']} ({seed.get('label', '')})",
+                style="green",
+                markup=False,
+            )
+        for seed in seeds_to_remove:
+            console.print(
+                f"- {seed['type']} {seed['value']} ({seed.get('label', '')})",
+                style="red",
+                markup=False,
+            )
+        for label, label_seeds in res["labelsToReplace"].items():
+            console.print(
+                f'Label "{label}" is replaced with {len(label_seeds)} seeds.',
+                markup=False,
+            )
+
+    if args.dry_run:
+        summary = f"Would add {len(seeds_to_add)} seeds and remove {len(seeds_to_remove)} seeds"
+    else:
+        summary = (
+            f"Added {len(seeds_to_add)} seeds and removed {len(seeds_to_remove)} seeds"
+        )
+    console.print(
+        f"{summary} ({res['unchangedCount']} unchanged, {res['apiCalls']} API calls)."
+    )
+    if res["errors"]:
+        console.print(f"Failed to apply {len(res['errors'])} changes:")
+        for error in res["errors"]:
+            console.print(f"    {error}", markup=False)
+        sys.exit(1)
+
+
 def cli_list_seeds(args: argparse.Namespace):
     """List seeds subcommand.
 
@@ -556,13 +701,11 @@ def cli_execute_saved_query_by_name(args: argparse.Namespace):
         sys.exit(1)
     s = InventorySearch(args.api_key)
     q = SavedQueries(args.api_key)
-    # get query from name
-    queries = q.get_saved_queries(args.query_name, 1, 1)
-    results = queries.get("results")
-    if not results:
+    saved_query = q.get_saved_query_by_name(args.query_name)
+    if not saved_query:
         console.print("No saved query found with that name.")
         sys.exit(1)
-    query = results[0]["query"]
+    query = saved_query["query"]
 
     try:
         res = s.search(
@@ -605,6 +748,66 @@ def cli_execute_saved_query_by_id(args: argparse.Namespace):
         sys.exit(1)
 
 
+def cli_execute_saved_queries(args: argparse.Namespace):
+    """Execute saved queries subcommand.
+
+    Args:
+        args (Namespace): Argparse Namespace.
+    """
+    # do some sanity checking on page size before anything else
+    if args.page_size > 1000:
+        console.print(
+            "page size must be within [0,1000]. To fetch all pages, specify --pages -1 with any legal page size"
+        )
+
+        sys.exit(1)
+    s = InventorySearch(args.api_key)
+    q = SavedQueries(args.api_key)
+    # Resolve every name from a single listing of all saved queries
+    index = q.refresh_saved_query_index()
+    query_names = list(index) if args.all else args.query_names
+
+    def execute(query_name: str) -> Dict[str, Any]:
+        start = time.perf_counter()
+        line: Dict[str, Any] = {"queryName": query_name}
+        try:
+            saved_query = q.get_saved_query_by_name(query_name)
+            if not saved_query:
+                line["error"] = "No saved query found with that name."
+                return line
+            line["queryId"] = saved_query.get("queryId")
+            line["query"] = saved_query["query"]
+            line["results"] = s.search(
+                None,
+                saved_query["query"],
+                args.page_size,
+                None,
+                args.sort,
+                args.fields,
+                args.pages,
+            )
+        except CensysAsmException as e:
+            line["error"] = str(e)
+        finally:
+            line["seconds"] = round(time.perf_counter() - start, 3)
+        return line
+
+    failed = 0
+    start = time.perf_counter()
+    # Each line is written as soon as its query finishes
+    for _, task in bounded_map(execute, query_names, args.workers):
+        line = task.result()
+        failed += "error" in line
+        console.print_json(json.dumps(line), indent=None)
+    if args.verbose:
+        err_console.print(
+            f"Executed {len(query_names)} saved queries in {time.perf_counter() - start:.2f}s."
+        )
+    if failed:
+        err_console.print(f"Failed to execute {failed} saved queries.")
+        sys.exit(1)
+
+
 def cli_search(args: argparse.Namespace):
     """Inventory search subcommand.
 
@@ -623,7 +826,8 @@ def cli_search(args: argparse.Namespace):
             args.fields,
             args.pages,
         )
-        console.print_json(json.dumps(res))
+        with timed_phase("render"):
+            console.print_json(json.dumps(res))
     except CensysAsmException:
         console.print("Failed to execute query.")
         sys.exit(1)
@@ -673,6 +877,18 @@ def include(parent_parser: argparse._SubParsersAction, parents: dict):
         type=str,
         default="",
     )
+    add_parser.add_argument(
+        "--chunk-size",
+        help="number of seeds added per request (default: %(default)s)",
+        type=int,
+        default=1000,
+    )
+    add_parser.add_argument(
+        "--workers",
+        help="number of concurrent requests (default: %(default)s)",
+        type=int,
+        default=4,
+    )
     add_parser.set_defaults(func=cli_add_seeds)
 
     delete_parser = asm_subparser.add_parser(
@@ -735,6 +951,40 @@ def include(parent_parser: argparse._SubParsersAction, parents: dict):
     add_seed_arguments(replace_with_label_parser)
     replace_with_label_parser.set_defaults(func=cli_replace_seeds_with_label)
 
+    sync_parser = asm_subparser.add_parser(
+        "sync-seeds",
+        description="Make the ASM seeds with the labels of the given seeds match them",
+        help="synchronize seeds",
+        parents=[parents["asm_auth"]],
+    )
+    add_verbose(sync_parser)
+    add_seed_arguments(sync_parser)
+    sync_parser.add_argument(
+        "-l",
+        "--label",
+        help='label to apply to seeds without label (default: "")',
+        type=str,
+        default="",
+    )
+    sync_parser.add_argument(
+        "--dry-run",
+        help="only print the changes",
+        action="store_true",
+    )
+    sync_parser.add_argument(
+        "--chunk-size",
+        help="number of seeds added per request (default: %(default)s)",
+        type=int,
+        default=1000,
+    )
+    sync_parser.add_argument(
+        "--workers",
+        help="number of concurrent requests (default: %(default)s)",
+        type=int,
+        default=10,
+    )
+    sync_parser.set_defaults(func=cli_sync_seeds)
+
     list_parser = asm_subparser.add_parser(
         "list-seeds",
         description="List all ASM seeds, optionally filtered by label and type",
@@ -918,6 +1168,61 @@ def include(parent_parser: argparse._SubParsersAction, parents: dict):
         func=cli_execute_saved_query_by_name
     )
 
+    execute_saved_queries_parser = asm_subparser.add_parser(
+        "execute-saved-queries",
+        description="Execute many saved queries concurrently in inventory search, writing one JSON line per query",
+        help="execute saved queries",
+        parents=[parents["asm_auth"]],
+    )
+    queries_group = execute_saved_queries_parser.add_mutually_exclusive_group(
+        required=True
+    )
+    queries_group.add_argument(
+        "--query-names",
+        help="Query names",
+        type=str,
+        nargs="+",
+    )
+    queries_group.add_argument(
+        "--all",
+        help="Execute every saved query",
+        action="store_true",
+    )
+    execute_saved_queries_parser.add_argument(
+        "--page-size",
+        help="Number of results to return. Defaults to 50.",
+        type=int,
+        default=50,
+    )
+    execute_saved_queries_parser.add_argument(
+        "--sort",
+        help="Sort order for results",
+        type=str,
+        nargs="+",
+        default=[],
+    )
+    execute_saved_queries_parser.add_argument(
+        "--fields",
+        help="Fields to include in results",
+        type=str,
+        nargs="+",
+        default=[],
+    )
+    execute_saved_queries_parser.add_argument(
+        "--pages",
+        help="Number of pages to return. Defaults to 1.",
+        type=int,
+        default=1,
+    )
+    execute_saved_queries_parser.add_argument(
+        "--workers",
+        help="Number of queries to execute concurrently. Defaults to 4.",
+        type=int,
+        default=4,
+    )
+    add_verbose(execute_saved_queries_parser)
+    execute_saved_queries_parser.set_defaults(func=cli_execute_saved_queries)
+
     execute_saved_query_by_id_parser = asm_subparser.add_parser(
         "execute-saved-query-by-id",
         description="Execute a saved query by id in inventory search",
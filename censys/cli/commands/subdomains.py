@@ -3,9 +3,11 @@
 import argparse
 import json
 import sys
-from typing import List, Set
+import time
+from typing import Dict, Iterator, List, Optional, Set
 
 from censys.cli.utils import console, err_console
+from censys.common.concurrency import bounded_map
 from censys.common.exceptions import (
     CensysException,
     CensysRateLimitExceededException,
@@ -14,6 +16,105 @@ from censys.common.exceptions import (
 from censys.search import CensysCerts
 
 
+class DomainTrie:
+    """Trie of domains keyed by their labels in reverse order.
+
+    A name is matched against every inserted domain it belongs to in a
+    single walk from its top-level label, so the names of one certificate
+    can be attributed to many domains at once.
+
+    Examples:
+        >>> trie = DomainTrie(["censys.io", "io"])
+        >>> trie.match("search.censys.io")
+        ['io', 'censys.io']
+    """
+
+    def __init__(self, domains: Optional[List[str]] = None):
+        """Inits DomainTrie.
+
+        Args:
+            domains (List[str]): Optional; Domains to insert.
+        """
+        self._root: dict = {}
+        for domain in domains or []:
+            self.insert(domain)
+
+    @staticmethod
+    def _labels(name: str) -> List[str]:
+        return name.lower().rstrip(".").split(".")[::-1]
+
+    def insert(self, domain: str):
+        """Inserts a domain.
+
+        Args:
+            domain (str): The domain.
+        """
+        node = self._root
+        for label in self._labels(domain):
+            node = node.setdefault(label, {})
+        node[""] = domain
+
+    def match(self, name: str) -> List[str]:
+        """Finds the inserted domains a name is equal to or a subdomain of.
+
+        Args:
+            name (str): The name to match.
+
+        Returns:
+            List[str]: Matching domains, from the shortest to the longest.
+        """
+        matches = []
+        node = self._root
+        for label in self._labels(name):
+            node = node.get(label)  # type: ignore[assignment]
+            if node is None:
+                break
+            if "" in node:
+                matches.append(node[""])
+        return matches
+
+
+def read_domains(file_name: str) -> Iterator[str]:
+    """Reads domains from a file, one per line.
+
+    Blank lines and lines starting with ``#`` are ignored.
+
+    Args:
+        file_name (str): The file name, or ``-`` for stdin.
+
+    Yields:
+        str: Each domain.
+    """
+    file = sys.stdin if file_name == "-" else open(file_name)  # noqa: SIM115
+    try:
+        for line in file:
+            domain = line.strip()
+            if domain and not domain.startswith("#"):
+                yield domain
+    finally:
+        if file is not sys.stdin:
+            file.close()
+
+
+def query_certificate_names(client: CensysCerts, domain: str, pages: int) -> Set[str]:
+    """Collects the names of the certificates matching a domain.
+
+    Args:
+        client (CensysCerts): Certificates client.
+        domain (str): The domain.
+        pages (int): The number of pages to query.
+
+    Returns:
+        Set[str]: Names of the matching certificates.
+    """
+    names: Set[str] = set()
+    # 100 is the max per page
+    for hits in client.search(f"names: {domain}", per_page=100, pages=pages):
+        for cert in hits:
+            names.update(cert.get("names", []))
+    return names
+
+
 def print_subdomains(subdomains: Set[str], as_json: bool = False):
     """Print subdomains.
 
@@ -34,6 +135,10 @@ def cli_subdomains(args: argparse.Namespace):  # pragma: no cover
     Args:
         args: Argparse Namespace.
     """
+    if args.input_file:
+        cli_subdomains_bulk(args)
+        return
+
     subdomains = set()
     try:
         client = CensysCerts(api_id=args.api_id, api_secret=args.api_secret)
@@ -81,6 +186,90 @@ def cli_subdomains(args: argparse.Namespace):  # pragma: no cover
         sys.exit(1)
 
 
+def cli_subdomains_bulk(args: argparse.Namespace):
+    """Subdomain subcommand for many domains.
+
+    Domains are queried concurrently. Every name of every returned
+    certificate is attributed to all requested domains it belongs to, and
+    each new subdomain of a domain is printed as soon as it is found, so a
+    name found by a later query is printed under every domain it belongs
+    to. Names attributed to a domain whose own query failed are reported
+    as partial results at the end.
+
+    Args:
+        args: Argparse Namespace.
+    """
+    domains = list(dict.fromkeys(d.lower() for d in read_domains(args.input_file)))
+    trie = DomainTrie(domains)
+    subdomains: Dict[str, Set[str]] = {domain: set() for domain in domains}
+    failed: Set[str] = set()
+    client = CensysCerts(api_id=args.api_id, api_secret=args.api_secret)
+    started = time.monotonic()
+
+    try:
+        for domain, task in bounded_map(
+            lambda domain: query_certificate_names(client, domain, args.pages),
+            domains,
+            args.workers,
+        ):
+            try:
+                names = task.result()
+            except CensysUnauthorizedException:
+                err_console.print("Invalid Censys API ID or secret")
+                sys.exit(1)
+            except CensysException as e:
+                failed.add(domain)
+                if args.json:
+                    console.print_json(
+                        json.dumps({"domain": domain, "error": str(e)}), indent=None
+                    )
+                else:
+                    err_console.print(f"{domain}: {e}")
+                continue
+
+            # Names are routed in this thread, so the sets need no locking
+            for name in sorted(names):
+                for match in trie.match(name):
+                    if name in subdomains[match]:
+                        continue
+                    subdomains[match].add(name)
+                    if args.json:
+                        console.print_json(
+                            json.dumps({"domain": match, "subdomain": name}),
+                            indent=None,
+                        )
+                    else:
+                        console.print(f"{match}: {name}")
+    except KeyboardInterrupt:
+        err_console.print("Caught Ctrl-C, exiting...")
+        sys.exit(1)
+
+    for domain in domains:
+        if domain in failed and subdomains[domain]:
+            if args.json:
+                console.print_json(
+                    json.dumps(
+                        {
+                            "domain": domain,
+                            "partial": True,
+                            "subdomains": sorted(subdomains[domain]),
+                        }
+                    ),
+                    indent=None,
+                )
+            else:
+                err_console.print(
+                    f"{domain}: {len(subdomains[domain])} subdomain(s) found by"
+                    " other queries are partial results"
+                )
+    err_console.print(
+        f"Queried {len(domains)} domain(s) in {time.monotonic() - started:.1f}s"
+        f" with {len(failed)} failure(s)"
+    )
+    if failed:
+        sys.exit(1)
+
+
 def include(parent_parser: argparse._SubParsersAction, parents: dict):
     """Include this subcommand into the parent parser.
 
@@ -94,11 +283,26 @@ def include(parent_parser: argparse._SubParsersAction, parents: dict):
         help="enumerate subdomains",
         parents=[parents["auth"]],
     )
-    subdomains_parser.add_argument("domain", help="The base domain to search for")
+    domain_group = subdomains_parser.add_mutually_exclusive_group(required=True)
+    domain_group.add_argument("domain", nargs="?", help="The base domain to search for")
+    domain_group.add_argument(
+        "--input-file",
+        "-i",
+        help="file containing one base domain per line (use - for stdin)",
+    )
     subdomains_parser.add_argument(
         "--pages", type=int, default=1, help="Max records to query"
     )
     subdomains_parser.add_argument(
-        "-j", "--json", action="store_true", help="Output in JSON format"
+        "--workers",
+        type=int,
+        default=4,
+        help="number of domains queried concurrently with --input-file",
+    )
+    subdomains_parser.add_argument(
+        "-j",
+        "--json",
+        action="store_true",
+        help="Output in JSON format (one line per subdomain with --input-file)",
     )
     subdomains_parser.set_defaults(func=cli_subdomains)
@@ -2,8 +2,11 @@
 
 import argparse
 import ipaddress
+import json
 import sys
+import time
 import webbrowser
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
 
 from censys.cli.utils import (
     V2_INDEXES,
@@ -12,11 +15,158 @@ from censys.cli.utils import (
     valid_datetime_type,
     write_file,
 )
+from censys.common.concurrency import bounded_map
 from censys.common.exceptions import CensysCLIException
-from censys.search import SearchClient
+from censys.search import CensysCerts, CensysHosts, SearchClient
 from censys.search.v2.api import CensysSearchAPIv2
 
 
+def detect_index(document_id: str) -> Optional[str]:
+    """Detects the index of a document ID.
+
+    Args:
+        document_id (str): An IP address, optionally followed by ``+name``, or a SHA-256 certificate fingerprint.
+
+    Returns:
+        Optional[str]: ``hosts``, ``certificates`` or None if the ID is neither.
+    """
+    try:
+        ipaddress.ip_address(document_id.split("+", 1)[0])
+        return "hosts"
+    except ValueError:
+        pass
+    if len(document_id) == 64 and all(
+        c in "0123456789abcdefABCDEF" for c in document_id
+    ):
+        return "certificates"
+    return None
+
+
+def read_document_ids(file_name: str) -> Iterator[str]:
+    """Reads unique document IDs from a file, one per line.
+
+    Args:
+        file_name (str): The file name, or ``-`` for stdin.
+
+    Yields:
+        str: Each document ID.
+    """
+    seen = set()
+    file = sys.stdin if file_name == "-" else open(file_name)  # noqa: SIM115
+    try:
+        for line in file:
+            document_id = line.strip()
+            if document_id and document_id not in seen:
+                seen.add(document_id)
+                yield document_id
+    finally:
+        if file is not sys.stdin:
+            file.close()
+
+
+def view_tasks(
+    document_ids: Iterator[str], chunk_size: int
+) -> Iterator[Tuple[Optional[str], List[str]]]:
+    """Groups document IDs into view tasks.
+
+    Each host is its own task, while certificates are grouped into chunks
+    fetched with a single bulk request.
+
+    Args:
+        document_ids (Iterator[str]): Document IDs.
+        chunk_size (int): Maximum number of certificates per task.
+
+    Yields:
+        Tuple[Optional[str], List[str]]: The index, or None for invalid IDs, and the IDs of a task.
+    """
+    fingerprints: List[str] = []
+    for document_id in document_ids:
+        index_type = detect_index(document_id)
+        if index_type != "certificates":
+            yield index_type, [document_id]
+            continue
+        fingerprints.append(document_id.lower())
+        if len(fingerprints) >= chunk_size:
+            yield "certificates", fingerprints
+            fingerprints = []
+    if fingerprints:
+        yield "certificates", fingerprints
+
+
+def cli_view_bulk(args: argparse.Namespace, censys_args: Dict[str, Any]):
+    """View subcommand for many documents.
+
+    Document IDs are read from a file or stdin. Hosts are viewed
+    concurrently, certificates are fetched in chunks with ``bulk_post``, and
+    each result is written as a JSON line as soon as it is available.
+
+    Args:
+        args (Namespace): Argparse Namespace.
+        censys_args (Dict[str, Any]): Client arguments.
+    """
+    hosts = CensysHosts(**censys_args)
+    certs = CensysCerts(**censys_args)
+    view_args = {"at_time": args.at_time} if args.at_time else {}
+
+    def fetch(task: Tuple[Optional[str], List[str]]) -> Dict[str, dict]:
+        index_type, document_ids = task
+        if index_type is None:
+            raise CensysCLIException(
+                f"Invalid document ID: {document_ids[0]}. Please provide an IP address or a SHA-256 certificate fingerprint."
+            )
+        if index_type == "hosts":
+            return {document_ids[0]: hosts.view(document_ids[0], **view_args)}
+        results = {
+            cert.get("fingerprint_sha256"): cert
+            for cert in certs.bulk_post(document_ids)
+        }
+        return {
+            fingerprint: results.get(fingerprint, {"error": "Certificate not found"})
+            for fingerprint in document_ids
+        }
+
+    output: TextIO = sys.stdout
+    if args.output:
+        output = open(args.output, "w")  # noqa: SIM115
+    failures = documents = 0
+    started = time.monotonic()
+    try:
+        for (index_type, document_ids), task in bounded_map(
+            fetch,
+            view_tasks(read_document_ids(args.input_file), args.chunk_size),
+            args.workers,
+        ):
+            try:
+                results = task.result()
+            except Exception as e:
+                results = {
+                    document_id: {"error": str(e)} for document_id in document_ids
+                }
+            for document_id, result in results.items():
+                documents += 1
+                line: Dict[str, Any] = {"document_id": document_id, "index": index_type}
+                if "error" in result and len(result) == 1:
+                    failures += 1
+                    line["error"] = result["error"]
+                else:
+                    line["result"] = result
+                output.write(json.dumps(line) + "\n")
+                output.flush()
+    except KeyboardInterrupt:
+        err_console.print("Caught Ctrl-C, exiting...")
+        sys.exit(1)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    err_console.print(
+        f"Viewed {documents} document(s) in {time.monotonic() - started:.1f}s"
+        f" with {failures} failure(s)"
+    )
+    if failures:
+        sys.exit(1)
+
+
 def cli_view(args: argparse.Namespace):
     """Search subcommand.
 
@@ -26,6 +176,9 @@ def cli_view(args: argparse.Namespace):
     Raises:
         CensysCLIException: If invalid options are provided.
     """
+    if args.input_file and args.open:
+        raise CensysCLIException("The --open option cannot be used with --input-file.")
+
     if args.open:
         webbrowser.open(
             f"https://search.censys.io/{args.index_type}/{args.document_id}"  # noqa: E231
@@ -40,26 +193,28 @@ def cli_view(args: argparse.Namespace):
     if args.api_secret:
         censys_args["api_secret"] = args.api_secret
 
+    if args.input_file:
+        cli_view_bulk(args, censys_args)
+        return
+
     c = SearchClient(**censys_args)
 
     index_type = args.index_type
 
     if index_type == "hosts":
-        try:
-            ip_address = args.document_id
-            if "+" in ip_address:
-                ip_address, _ = args.document_id.split("+")
-            ipaddress.ip_address(ip_address)
-        except ValueError:
-            if len(args.document_id) == 64:
-                err_console.print(
-                    "This is a SHA-256 certificate fingerprint. Switching to certificates index."
-                )
-                index_type = "certificates"
-            else:
-                raise CensysCLIException(
-                    f"Invalid IP address: {args.document_id}. Please provide a valid IPv4 or IPv6 address."
-                )
+        detected_index = detect_index(args.document_id)
+        # Other 64 character IDs are also looked up as certificates
+        if detected_index == "certificates" or (
+            detected_index is None and len(args.document_id) == 64
+        ):
+            err_console.print(
+                "This is a SHA-256 certificate fingerprint. Switching to certificates index."
+            )
+            index_type = "certificates"
+        elif detected_index is None:
+            raise CensysCLIException(
+                f"Invalid IP address: {args.document_id}. Please provide a valid IPv4 or IPv6 address."
+            )
 
     index: CensysSearchAPIv2 = getattr(c.v2, index_type)
 
@@ -99,11 +254,19 @@ def include(parent_parser: argparse._SubParsersAction, parents: dict):
         help="view document",
         parents=[parents["auth"]],
     )
-    view_parser.add_argument(
+    document_group = view_parser.add_mutually_exclusive_group(required=True)
+    document_group.add_argument(
         "document_id",
         type=str,
+        nargs="?",
         help="a document id (IP address or SHA-256 certificate fingerprint) to view",
     )
+    document_group.add_argument(
+        "--input-file",
+        "-i",
+        type=str,
+        help="file containing one document id per line (use - for stdin), viewed concurrently and written as JSON lines",
+    )
     view_parser.add_argument(
         "--index-type",
         type=str,
@@ -125,6 +288,20 @@ def include(parent_parser: argparse._SubParsersAction, parents: dict):
         help="open document in browser",
     )
 
+    bulk_group = view_parser.add_argument_group("--input-file specific arguments")
+    bulk_group.add_argument(
+        "--workers",
+        type=int,
+        default=10,
+        help="number of concurrent requests",
+    )
+    bulk_group.add_argument(
+        "--chunk-size",
+        type=int,
+        default=100,
+        help="number of certificates fetched per request",
+    )
+
     hosts_group = view_parser.add_argument_group("hosts specific arguments")
     hosts_group.add_argument(
         "--at-time",
@@ -8,8 +8,10 @@ import sys
 from typing import Any, Dict, List, Optional, Union
 
 from rich.console import Console
+from rich.table import Table
 
 from censys.common.config import DEFAULT, get_config
+from censys.common.stats import timed_phase
 
 Results = Union[List[dict], Dict[str, Any]]
 
@@ -39,7 +41,7 @@ def _write_json(file_path: str, search_results: Results):
         file_path (str): Name of the file to write to on the disk.
         search_results (Results): A list of results from the query.
     """
-    with open(file_path, "w") as output_file:
+    with timed_phase("write"), open(file_path, "w") as output_file:
         # Since the results are already in JSON, just write them to a file.
         json.dump(search_results, output_file, indent=4)
 
@@ -53,10 +55,11 @@ def _write_screen(search_results: Results):  # pragma: no cover
         search_results (Results): A list of results from the query.
     """
     config = get_config()
-    if config.get(DEFAULT, "color"):
-        console.print_json(data=search_results)
-    else:
-        print(json.dumps(search_results, indent=4))
+    with timed_phase("render"):
+        if config.get(DEFAULT, "color"):
+            console.print_json(data=search_results)
+        else:
+            print(json.dumps(search_results, indent=4))
 
 
 def write_file(
@@ -85,6 +88,28 @@ def write_file(
         _write_screen(results_list)
 
 
+def print_stats(summary: Dict[str, Any]):
+    """Prints a request statistics summary to standard error.
+
+    Args:
+        summary (Dict[str, Any]): Summary returned by ``RequestStats.summary``.
+    """
+
+    def seconds(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value * 1000:.1f} ms"
+
+    table = Table("Statistic", "Value", title="Request Statistics")
+    table.add_row("Requests", str(summary["requests"]))
+    table.add_row("Retries", str(summary["retries"]))
+    table.add_row("Bytes transferred", str(summary["wire_bytes"]))
+    table.add_row("Bytes decoded", str(summary["body_bytes"]))
+    for name, value in summary["latency"].items():
+        table.add_row(f"Latency {name}", seconds(value))
+    for name, value in sorted(summary["phases"].items()):
+        table.add_row(f"Time in {name}", seconds(value))
+    err_console.print(table)
+
+
 def valid_datetime_type(datetime_str: str) -> datetime.datetime:
     """Custom argparse type for user datetime values from arg.
 
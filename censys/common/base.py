@@ -2,14 +2,18 @@
 
 import json
 import os
+import time
 import warnings
-from functools import wraps
+from concurrent.futures import Executor
+from functools import partial, wraps
 from typing import Any, Callable, Optional, Type
 
 import backoff
 import requests
 from requests.models import Response
+from urllib3.util.request import ACCEPT_ENCODING
 
+from .conditional import ConditionalCache, credentials_fingerprint
 from .exceptions import (
     CensysAPIException,
     CensysException,
@@ -19,28 +23,57 @@ from .exceptions import (
     CensysRateLimitExceededException,
     CensysTooManyRequestsException,
 )
+from .retry import CircuitBreaker, Hedger, RetryBudget, guarded_call
+from .stats import RequestStats, endpoint_template, get_process_stats
+from .transport import RequestsTransport, Transport
 from .version import __version__
 
+RETRYABLE_EXCEPTIONS = (
+    CensysInternalServerException,
+    CensysInternalServerErrorException,
+    CensysTooManyRequestsException,
+    CensysRateLimitExceededException,
+    requests.exceptions.Timeout,
+    requests.exceptions.ConnectionError,
+)
+"""Exceptions that are retried with exponential backoff."""
+
 
 # Wrapper to make max_retries configurable at runtime
 def _backoff_wrapper(method: Callable):
     @wraps(method)
     def _wrapper(self, *args, **kwargs):
+        retry_budget: Optional[RetryBudget] = self.retry_budget
+        if retry_budget is not None:
+            retry_budget.record_request()
+
+        started = time.monotonic()
+        failures = 0
+
+        def _giveup(_: Exception) -> bool:
+            nonlocal failures
+            failures += 1
+            # backoff asks before checking its own limits, so do not spend a
+            # token on an attempt that will not be retried anyway
+            if failures >= self.max_retries or (
+                self.timeout is not None and time.monotonic() - started >= self.timeout
+            ):
+                return True
+            return retry_budget is not None and not retry_budget.try_acquire()
+
+        def _on_backoff(_: dict):
+            self.stats.record_retry()
+
         @backoff.on_exception(
             backoff.expo,
-            (
-                CensysInternalServerException,
-                CensysInternalServerErrorException,
-                CensysTooManyRequestsException,
-                CensysRateLimitExceededException,
-                requests.exceptions.Timeout,
-                requests.exceptions.ConnectionError,
-            ),
+            RETRYABLE_EXCEPTIONS,
             max_tries=self.max_retries,
             max_time=self.timeout,
+            giveup=_giveup,
+            on_backoff=_on_backoff,
         )
         def _impl():
-            return method(self, *args, **kwargs)
+            return guarded_call(method, self.circuit_breaker, self, *args, **kwargs)
 
         return _impl()
 
@@ -65,6 +98,12 @@ class CensysAPIBase:
         user_agent: Optional[str] = DEFAULT_USER_AGENT,
         proxies: Optional[dict] = None,
         cookies: Optional[dict] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        transport: Optional[Transport] = None,
+        conditional_cache: Optional[ConditionalCache] = None,
+        executor: Optional[Executor] = None,
+        hedger: Optional[Hedger] = None,
         **kwargs,
     ):
         """Inits CensysAPIBase.
@@ -77,6 +116,18 @@ class CensysAPIBase:
             user_agent (str): Optional; Override User-Agent string.
             proxies (dict): Optional; Configure HTTP proxies.
             cookies (dict): Optional; Configure cookies.
+            circuit_breaker (CircuitBreaker):
+                Optional; Circuit breaker shared by all requests of the client.
+            retry_budget (RetryBudget):
+                Optional; Retry budget shared by all requests of the client.
+            transport (Transport):
+                Optional; Transport used to send requests. Defaults to requests.
+            conditional_cache (ConditionalCache):
+                Optional; Cache revalidating GET responses with conditional requests.
+            executor (Executor):
+                Optional; Executor shared by concurrent calls. Defaults to a thread pool per call.
+            hedger (Hedger):
+                Optional; Sends a duplicate of slow GET requests.
             **kwargs: Arbitrary keyword arguments.
 
         Raises:
@@ -85,13 +136,20 @@ class CensysAPIBase:
         # Get common request settings
         self.timeout = timeout
         self.max_retries = max_retries
+        self.circuit_breaker = circuit_breaker
+        self.retry_budget = retry_budget
+        self.conditional_cache = conditional_cache
+        self.executor = executor
+        self.hedger = hedger
+        self.stats = RequestStats(parent=get_process_stats())
         self._api_url = url or os.getenv("CENSYS_API_URL")
 
         if not self._api_url:
             raise CensysException("No API url configured.")
 
-        # Create a session and set credentials
-        self._session = requests.Session()
+        # Create a transport and set credentials on its session
+        self._transport = transport or RequestsTransport()
+        self._session = self._transport.session
         if proxies:
             if "http" in proxies:
                 warnings.warn("HTTP proxies will not be used.")
@@ -107,6 +165,9 @@ class CensysAPIBase:
         self._session.headers.update(
             {
                 "accept": "application/json, */8",
+                # Advertise every codec urllib3 can decode while streaming
+                # (brotli and zstd when their optional packages are installed)
+                "Accept-Encoding": ACCEPT_ENCODING,
                 "User-Agent": " ".join(
                     [
                         requests.utils.default_user_agent(),
@@ -221,13 +282,53 @@ class CensysAPIBase:
         if data:
             request_kwargs["json"] = data
 
-        res = self._call_method(method, url, request_kwargs)
+        cache = self.conditional_cache
+        cache_key = None
+        unconditional_kwargs = request_kwargs
+        if cache is not None and method == self._transport.get:
+            cache_key = cache.key(
+                url,
+                request_kwargs["params"],
+                request_kwargs.get("headers"),
+                credentials_fingerprint(self._session.auth, self._session.headers),
+            )
+            conditional_headers = cache.request_headers(cache_key)
+            if conditional_headers:
+                request_kwargs = {
+                    **request_kwargs,
+                    "headers": {
+                        **(request_kwargs.get("headers") or {}),
+                        **conditional_headers,
+                    },
+                }
+
+        send = method
+        if self.hedger is not None and method == self._transport.get:
+            # Each send is hedged on its own, below the retries
+            send = partial(self.hedger.call, endpoint_template(endpoint), method)
+
+        start = time.perf_counter()
+        res = self._call_method(send, url, request_kwargs)
+        self.stats.record_response(endpoint, res, time.perf_counter() - start)
+
+        if cache is not None and cache_key is not None and res.status_code == 304:
+            body = cache.revalidated(cache_key)
+            if body is not None:
+                with self.stats.phase("decode"):
+                    return json.loads(body)
+            # The entry was removed while the request was sent
+            start = time.perf_counter()
+            res = self._call_method(send, url, unconditional_kwargs)
+            self.stats.record_response(endpoint, res, time.perf_counter() - start)
 
         if res.ok:
             # Check for a returned json body
             try:
-                json_data = res.json()
+                with self.stats.phase("decode"):
+                    json_data = res.json()
                 if "error" not in json_data:
+                    if cache is not None and cache_key is not None:
+                        cache.store(cache_key, res)
                     return json_data
             # Successful request returned no json body in response
             except ValueError:
@@ -263,7 +364,7 @@ class CensysAPIBase:
         )
 
     def _get(self, endpoint: str, args: Optional[dict] = None, **kwargs) -> dict:
-        return self._make_call(self._session.get, endpoint, args, **kwargs)
+        return self._make_call(self._transport.get, endpoint, args, **kwargs)
 
     def _post(
         self,
@@ -272,7 +373,7 @@ class CensysAPIBase:
         data: Optional[dict] = None,
         **kwargs,
     ) -> dict:
-        return self._make_call(self._session.post, endpoint, args, data, **kwargs)
+        return self._make_call(self._transport.post, endpoint, args, data, **kwargs)
 
     def _put(
         self,
@@ -281,16 +382,16 @@ class CensysAPIBase:
         data: Optional[dict] = None,
         **kwargs,
     ) -> dict:
-        return self._make_call(self._session.put, endpoint, args, data, **kwargs)
+        return self._make_call(self._transport.put, endpoint, args, data, **kwargs)
 
     def _patch(
         self,
         endpoint: str,
         args: Optional[dict] = None,
-        data: Optional[dict] = None,
+        data: Optional[Any] = None,
         **kwargs,
     ) -> dict:
-        return self._make_call(self._session.patch, endpoint, args, data, **kwargs)
+        return self._make_call(self._transport.patch, endpoint, args, data, **kwargs)
 
     def _delete(self, endpoint: str, args: Optional[dict] = None, **kwargs) -> dict:
-        return self._make_call(self._session.delete, endpoint, args, **kwargs)
+        return self._make_call(self._transport.delete, endpoint, args, **kwargs)
@@ -0,0 +1,242 @@
+"""Concurrency helpers for the Censys APIs."""
+
+import itertools
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Splits an iterable into lists of at most ``size`` items.
+
+    The iterable is consumed lazily, one chunk at a time.
+
+    Args:
+        iterable (Iterable[T]): Items to split.
+        size (int): Maximum number of items per chunk.
+
+    Raises:
+        ValueError: If size is smaller than 1.
+
+    Yields:
+        List[T]: One chunk of items.
+    """
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+_running = threading.local()
+
+
+def _runs_on(executor: Executor) -> bool:
+    if executor in getattr(_running, "executors", ()):
+        return True
+    # Thread pools add a thread to their threads only after starting it
+    threads = getattr(executor, "_threads", None) or ()
+    return threading.current_thread() in threads
+
+
+def _run_on(executor: Executor, func: Callable[[T], R]) -> Callable[[T], R]:
+    def run(item: T) -> R:
+        executors = _running.__dict__.setdefault("executors", [])
+        executors.append(executor)
+        try:
+            return func(item)
+        finally:
+            executors.pop()
+
+    return run
+
+
+@contextmanager
+def worker_pool(
+    max_workers: int, executor: Optional[Executor] = None
+) -> Iterator[Executor]:
+    """Provides an executor, reusing a shared one if given.
+
+    A shared executor is left running. Otherwise a thread pool is created
+    and shut down on exit. A call already running on the shared executor
+    gets a new pool too, since waiting for calls queued behind it on the
+    same executor could block once all of its threads are waiting.
+
+    Args:
+        max_workers (int): The number of workers of a new pool.
+        executor (Executor): Optional; Shared executor to reuse.
+
+    Yields:
+        Executor: The executor.
+    """
+    if executor is not None and not _runs_on(executor):
+        yield executor
+        return
+    with ThreadPoolExecutor(max_workers) as pool:
+        yield pool
+
+
+def bounded_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = 10,
+    max_pending: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Iterator[Tuple[T, "Future[R]"]]:
+    """Calls a function on every item in a thread pool.
+
+    Unlike ``ThreadPoolExecutor.map``, at most ``max_pending`` items are read
+    ahead of the results, so items can be streamed from a large file without
+    loading it into memory. Futures are yielded as they complete, and calling
+    ``result`` on them raises the exception of a failed call.
+
+    With a shared ``executor``, its threads are reused and at most
+    ``max_workers`` calls are submitted at once, so a single call cannot
+    take over the executor.
+
+    Args:
+        func (Callable[[T], R]): Function to call.
+        items (Iterable[T]): Arguments of each call.
+        max_workers (int): Optional; The number of workers to use. Defaults to 10.
+        max_pending (int): Optional; Maximum number of submitted calls. Defaults to twice the number of workers, or the number of workers with a shared executor.
+        executor (Executor): Optional; Shared executor to submit calls to. Defaults to a new thread pool.
+
+    Yields:
+        Tuple[T, Future[R]]: Each item and its completed future.
+    """
+    max_pending = max_pending or (
+        max_workers if executor is not None else max_workers * 2
+    )
+    iterator = iter(items)
+    pending: Dict["Future[R]", T] = {}
+    with worker_pool(max_workers, executor) as pool:
+        func = _run_on(pool, func)
+        try:
+            for item in itertools.islice(iterator, max_pending):
+                pending[pool.submit(func, item)] = item
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future
+                for item in itertools.islice(iterator, max_pending - len(pending)):
+                    pending[pool.submit(func, item)] = item
+        finally:
+            # Do not start queued calls if the caller stops early
+            for future in pending:
+                future.cancel()
+
+
+def follow_cursor(
+    fetch_page: Callable[[Optional[str]], Tuple[List[T], Optional[str]]],
+    cursor: Optional[str] = None,
+    prefetch: bool = True,
+) -> Iterator[T]:
+    """Iterates over the items of cursor-paginated results.
+
+    With ``prefetch``, the next page is requested in a background thread as
+    soon as its cursor is known, while the items of the current page are
+    consumed.
+
+    Args:
+        fetch_page (Callable[[Optional[str]], Tuple[List[T], Optional[str]]]): Function returning the items of a page and the cursor of the next one.
+        cursor (str): Optional; Cursor of the first page.
+        prefetch (bool): Optional; Whether to request the next page in advance. Defaults to True.
+
+    Yields:
+        T: Each item.
+    """
+    if not prefetch:
+        while True:
+            items, cursor = fetch_page(cursor)
+            yield from items
+            if not cursor:
+                return
+
+    with ThreadPoolExecutor(1) as executor:
+        page = executor.submit(fetch_page, cursor)
+        try:
+            while True:
+                items, cursor = page.result()
+                if cursor:
+                    page = executor.submit(fetch_page, cursor)
+                yield from items
+                if not cursor:
+                    return
+        finally:
+            page.cancel()
+
+
+class RateLimiter:
+    """Token bucket limiting the request rate of concurrent workers.
+
+    Workers call ``acquire`` before each request. When the API answers that
+    the rate limit is exceeded, ``slow_down`` halves the rate, and every
+    successful request raises it again by a tenth of the configured rate
+    through ``speed_up``, so a pool settles just below the limit it is given.
+
+    Examples:
+        >>> limiter = RateLimiter(10)
+        >>> limiter.acquire()
+    """
+
+    def __init__(
+        self, rate: float, burst: Optional[float] = None, min_rate: float = 0.1
+    ):
+        """Inits RateLimiter.
+
+        Args:
+            rate (float): Maximum number of requests per second.
+            burst (float): Optional; Maximum number of requests sent at once. Defaults to the rate.
+            min_rate (float): Optional; Lowest rate reached by slowing down.
+
+        Raises:
+            ValueError: If rate is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive.")
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Waits until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_for = (1 - self._tokens) / self.rate
+            time.sleep(wait_for)
+
+    def slow_down(self):
+        """Halves the rate after the API rejected a request."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def speed_up(self):
+        """Raises the rate back towards its maximum after a successful request."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
@@ -0,0 +1,167 @@
+"""Conditional request cache for the Censys APIs."""
+
+import hashlib
+import threading
+from typing import Any, Dict, MutableMapping, Optional
+from urllib.parse import urlencode
+
+VALIDATOR_HEADERS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+"""Response validator headers and the request headers that send them back."""
+
+
+def credentials_fingerprint(auth: Any, headers: MutableMapping[str, Any]) -> str:
+    """Identifies the credentials of a session without storing them.
+
+    Cached responses are keyed by this fingerprint, so accounts sharing a
+    cache never see each other's responses.
+
+    Args:
+        auth (Any): Session authentication.
+        headers (MutableMapping[str, Any]): Session headers.
+
+    Returns:
+        str: Short hash of the credentials.
+    """
+    secrets = [repr(auth)] + [
+        f"{name}={value}"
+        for name, value in sorted(headers.items())
+        if "key" in name.lower() or "authorization" in name.lower()
+    ]
+    return hashlib.sha256("\n".join(secrets).encode()).hexdigest()[:16]
+
+
+class ConditionalCache:
+    """Cache of GET responses revalidated with conditional requests.
+
+    Responses with an ``ETag`` or ``Last-Modified`` header are stored with
+    their validators. Later requests for the same URL send
+    ``If-None-Match`` and ``If-Modified-Since``, and a ``304 Not Modified``
+    response is answered from the stored body. Responses without
+    validators are not stored.
+
+    ``storage`` can be any mutable mapping, such as a ``shelve`` database
+    to keep the cache between runs. The cache is thread-safe.
+
+    Examples:
+        >>> import shelve
+        >>> from censys.common.conditional import ConditionalCache
+        >>> from censys.search import CensysHosts
+        >>> cache = ConditionalCache(shelve.open("censys-cache"))
+        >>> h = CensysHosts(conditional_cache=cache)
+        >>> h.metadata()
+        >>> cache.bytes_saved
+        0
+    """
+
+    def __init__(self, storage: Optional[MutableMapping[str, Any]] = None):
+        """Inits ConditionalCache.
+
+        Args:
+            storage (MutableMapping[str, Any]): Optional; Mapping storing responses. Defaults to a dictionary.
+        """
+        self.storage: MutableMapping[str, Any] = {} if storage is None else storage
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    @staticmethod
+    def key(
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        namespace: str = "",
+    ) -> str:
+        """Builds the cache key of a request.
+
+        Args:
+            url (str): The URL to request.
+            params (dict): Optional; URL parameters.
+            headers (dict): Optional; Request headers. Only ``Accept`` is part of the key.
+            namespace (str): Optional; Prefix of the key, such as a credentials fingerprint.
+
+        Returns:
+            str: The cache key.
+        """
+        query = urlencode(
+            sorted((k, v) for k, v in (params or {}).items() if v is not None),
+            doseq=True,
+        )
+        accept = (headers or {}).get("Accept", "")
+        return f"{namespace}:{url}?{query}#{accept}"
+
+    def request_headers(self, key: str) -> Dict[str, str]:
+        """Gets the conditional headers for a request.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Dict[str, str]: Conditional headers, empty if nothing is stored.
+        """
+        with self._lock:
+            entry = self.storage.get(key)
+        if not entry:
+            return {}
+        return {
+            VALIDATOR_HEADERS[name]: value
+            for name, value in entry["validators"].items()
+        }
+
+    def store(self, key: str, res: Any) -> bool:
+        """Stores a successful response if it has validators.
+
+        Args:
+            key (str): The cache key.
+            res (Response): HTTP response.
+
+        Returns:
+            bool: True if the response was stored.
+        """
+        validators = {
+            name: res.headers[name]
+            for name in VALIDATOR_HEADERS
+            if res.headers.get(name)
+        }
+        with self._lock:
+            self.misses += 1
+            if not validators:
+                return False
+            self.storage[key] = {"validators": validators, "body": res.content}
+        return True
+
+    def revalidated(self, key: str) -> Optional[bytes]:
+        """Gets the stored body after a ``304 Not Modified`` response.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[bytes]: The stored body, or None if nothing is stored.
+        """
+        with self._lock:
+            entry = self.storage.get(key)
+            if not entry:
+                return None
+            self.hits += 1
+            self.bytes_saved += len(entry["body"])
+        return entry["body"]
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the cache counters.
+
+        Returns:
+            Dict[str, int]: Revalidated responses, downloaded responses and bytes not downloaded again.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bytes_saved": self.bytes_saved,
+            }
+
+    def clear(self):
+        """Removes all stored responses and resets the counters."""
+        with self._lock:
+            self.storage.clear()
+            self.hits = self.misses = self.bytes_saved = 0
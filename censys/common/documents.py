@@ -0,0 +1,306 @@
+"""Compact document representations for the Censys APIs."""
+
+import json
+import sys
+import threading
+from array import array
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+_KEY_TUPLES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+_KEY_TUPLES_LOCK = threading.Lock()
+_MISSING = object()
+
+
+def _intern_keys(keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Shares one key tuple between all documents with the same fields.
+
+    Args:
+        keys (Tuple[str, ...]): Top-level field names.
+
+    Returns:
+        Tuple[str, ...]: The shared tuple.
+    """
+    shared = _KEY_TUPLES.get(keys)
+    if shared is None:
+        with _KEY_TUPLES_LOCK:
+            shared = _KEY_TUPLES.setdefault(
+                keys, tuple(sys.intern(key) for key in keys)
+            )
+    return shared
+
+
+def get_field(document: Any, path: str, default: Any = None) -> Any:
+    """Gets a field from a document using a dotted path.
+
+    Lists are traversed element by element, so ``services.port`` returns the
+    port of every service, like the field syntax used by search queries.
+
+    Args:
+        document (Any): Document to read.
+        path (str): Dotted field path.
+        default (Any): Optional; Value returned if the field is missing.
+
+    Returns:
+        Any: The field value.
+    """
+    value = document
+    for index, part in enumerate(path.split(".")):
+        if isinstance(value, list):
+            rest = ".".join(path.split(".")[index:])
+            values = [get_field(item, rest, _MISSING) for item in value]
+            return [item for item in values if item is not _MISSING]
+        if not isinstance(value, Mapping) or part not in value:
+            return default
+        value = value[part]
+    return value
+
+
+def _field_tree(fields: Iterable[str]) -> Dict[str, Any]:
+    """Builds a tree of the requested dotted paths.
+
+    A leaf is ``None``, meaning that the whole sub-tree is kept.
+
+    Args:
+        fields (Iterable[str]): Dotted field paths.
+
+    Returns:
+        Dict[str, Any]: Nested field names.
+    """
+    tree: Dict[str, Any] = {}
+    for field in fields:
+        node: Optional[Dict[str, Any]] = tree
+        *parents, leaf = field.split(".")
+        for part in parents:
+            if node is None:
+                break
+            if part not in node:
+                node[part] = {}
+            node = node[part]
+        if node is not None:
+            node[leaf] = None
+    return tree
+
+
+def _project(value: Any, tree: Dict[str, Any]) -> Any:
+    if isinstance(value, list):
+        items = (_project(item, tree) for item in value)
+        return [item for item in items if item is not _MISSING]
+    if not isinstance(value, Mapping):
+        return _MISSING
+    projected = {}
+    for key, subtree in tree.items():
+        if key not in value:
+            continue
+        if subtree is None:
+            projected[key] = value[key]
+            continue
+        child = _project(value[key], subtree)
+        if child is not _MISSING:
+            projected[key] = child
+    return projected or _MISSING
+
+
+def project_document(document: Mapping[str, Any], fields: Iterable[str]) -> dict:
+    """Keeps only the given fields of a document.
+
+    Fields use the dotted path syntax of search queries. Lists are
+    projected element by element, and elements without any of the fields
+    are dropped. A path that selects a whole sub-tree takes precedence over
+    paths below it.
+
+    Examples:
+        >>> project_document(
+        ...     {"ip": "8.8.8.8", "services": [{"port": 53, "banner": "..."}]},
+        ...     ["ip", "services.port"],
+        ... )
+        {'ip': '8.8.8.8', 'services': [{'port': 53}]}
+
+    Args:
+        document (Mapping[str, Any]): Decoded document.
+        fields (Iterable[str]): Dotted field paths to keep.
+
+    Returns:
+        dict: The projected document.
+    """
+    projected = _project(document, _field_tree(fields))
+    return {} if projected is _MISSING else projected
+
+
+class LazyDocument(Mapping):
+    """Read-only document that decodes fields only when they are accessed.
+
+    Each top-level field is kept as compact JSON bytes in a single buffer,
+    and documents with the same fields share one tuple of field names. A
+    field is decoded every time it is read, so keep a reference to the value
+    if you need it more than once. Use ``to_dict`` to get a regular
+    dictionary.
+
+    Examples:
+        >>> from censys.common.documents import LazyDocument
+        >>> doc = LazyDocument.from_dict({"ip": "1.1.1.1", "services": [{"port": 53}]})
+        >>> doc["ip"]
+        '1.1.1.1'
+        >>> doc.get_field("services.port")
+        [53]
+    """
+
+    __slots__ = ("_keys", "_offsets", "_buffer")
+
+    def __init__(self, keys: Tuple[str, ...], offsets: array, buffer: bytes):
+        """Inits LazyDocument.
+
+        Args:
+            keys (Tuple[str, ...]): Top-level field names.
+            offsets (array): End offset of each field in the buffer.
+            buffer (bytes): Concatenated JSON encoded field values.
+        """
+        self._keys = keys
+        self._offsets = offsets
+        self._buffer = buffer
+
+    @classmethod
+    def from_dict(cls, document: Mapping[str, Any]) -> "LazyDocument":
+        """Builds a document from a decoded dictionary.
+
+        Args:
+            document (Mapping[str, Any]): Decoded document.
+
+        Returns:
+            LazyDocument: The compact document.
+        """
+        if isinstance(document, LazyDocument):
+            return document
+        parts = [
+            json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+            for value in document.values()
+        ]
+        offsets = array("I")
+        end = 0
+        for part in parts:
+            end += len(part)
+            offsets.append(end)
+        return cls(_intern_keys(tuple(document.keys())), offsets, b"".join(parts))
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> "LazyDocument":
+        """Builds a document from JSON bytes.
+
+        Args:
+            raw (bytes): JSON encoded document.
+
+        Returns:
+            LazyDocument: The compact document.
+        """
+        return cls.from_dict(json.loads(raw))
+
+    def _decode(self, index: int) -> Any:
+        start = self._offsets[index - 1] if index else 0
+        return json.loads(self._buffer[start : self._offsets[index]])
+
+    def __getitem__(self, key: str) -> Any:
+        """Decodes a top-level field.
+
+        Args:
+            key (str): Field name.
+
+        Raises:
+            KeyError: If the field does not exist.
+
+        Returns:
+            Any: The field value.
+        """
+        try:
+            index = self._keys.index(key)
+        except ValueError:
+            raise KeyError(key) from None
+        return self._decode(index)
+
+    def __contains__(self, key: object) -> bool:
+        """Checks if a top-level field exists without decoding it.
+
+        Args:
+            key (object): Field name.
+
+        Returns:
+            bool: True if the field exists.
+        """
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over top-level field names.
+
+        Returns:
+            Iterator[str]: Field names.
+        """
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        """Number of top-level fields.
+
+        Returns:
+            int: Field count.
+        """
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        """Representation of LazyDocument.
+
+        Returns:
+            str: Printable representation.
+        """
+        return f"LazyDocument({', '.join(self._keys)})"
+
+    def __getstate__(self) -> Tuple[Tuple[str, ...], bytes, bytes]:
+        """Pickles the compact representation.
+
+        Returns:
+            Tuple[Tuple[str, ...], bytes, bytes]: Keys, offsets and buffer.
+        """
+        return self._keys, self._offsets.tobytes(), self._buffer
+
+    def __setstate__(self, state: Tuple[Tuple[str, ...], bytes, bytes]):
+        """Restores a pickled document.
+
+        Args:
+            state (Tuple[Tuple[str, ...], bytes, bytes]): Keys, offsets and buffer.
+        """
+        keys, offsets, buffer = state
+        self._keys = _intern_keys(keys)
+        self._offsets = array("I")
+        self._offsets.frombytes(offsets)
+        self._buffer = buffer
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the encoded fields.
+
+        Returns:
+            int: Buffer size in bytes.
+        """
+        return len(self._buffer)
+
+    def get_field(self, path: str, default: Optional[Any] = None) -> Any:
+        """Gets a field using a dotted path, decoding only its top-level field.
+
+        Args:
+            path (str): Dotted field path, such as ``autonomous_system.asn``.
+            default (Any): Optional; Value returned if the field is missing.
+
+        Returns:
+            Any: The field value.
+        """
+        key, _, rest = path.partition(".")
+        if key not in self._keys:
+            return default
+        value = self[key]
+        if not rest:
+            return value
+        return get_field(value, rest, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Decodes the whole document.
+
+        Returns:
+            Dict[str, Any]: The decoded document.
+        """
+        return {key: self._decode(index) for index, key in enumerate(self._keys)}
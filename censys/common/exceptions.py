@@ -11,6 +11,14 @@ class CensysCLIException(CensysException):
     """Exception raised when the CLI is passed invalid arguments."""
 
 
+class CensysCircuitOpenException(CensysException):
+    """Exception raised when the circuit breaker rejects a request."""
+
+
+class CensysQuerySyntaxException(CensysException):
+    """Exception raised when a local query cannot be parsed."""
+
+
 class CensysAPIException(CensysException):
     """Base Exception for Censys APIs."""
 
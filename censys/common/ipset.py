@@ -0,0 +1,413 @@
+"""Compact sets of IP addresses and networks."""
+
+import bisect
+import ipaddress
+import mmap
+import struct
+from array import array
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .exceptions import CensysException
+
+T = TypeVar("T")
+
+IPLike = Union[
+    str,
+    int,
+    ipaddress.IPv4Address,
+    ipaddress.IPv6Address,
+    ipaddress.IPv4Network,
+    ipaddress.IPv6Network,
+]
+
+Range = Tuple[int, int]
+
+MAGIC = b"CENSYSIP"
+HEADER = struct.Struct("<8sQQ")
+LOW_64 = (1 << 64) - 1
+
+
+def _to_range(item: IPLike) -> Tuple[int, Range]:
+    """Converts an address or network to its version and inclusive range.
+
+    Args:
+        item (IPLike): Address or network, such as ``1.1.1.1`` or ``10.0.0.0/8``.
+
+    Returns:
+        Tuple[int, Range]: The IP version and the first and last address.
+    """
+    if isinstance(item, str) and "/" in item:
+        item = ipaddress.ip_network(item, strict=False)
+    if isinstance(item, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
+        return item.version, (
+            int(item.network_address),
+            int(item.broadcast_address),
+        )
+    address = ipaddress.ip_address(item)
+    return address.version, (int(address), int(address))
+
+
+def _merge(ranges: Iterable[Range]) -> List[Range]:
+    """Sorts ranges and merges the overlapping and adjacent ones.
+
+    Args:
+        ranges (Iterable[Range]): Inclusive ranges.
+
+    Returns:
+        List[Range]: Disjoint ranges in ascending order.
+    """
+    merged: List[Range] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _subtract(ranges: List[Range], other: List[Range]) -> List[Range]:
+    result: List[Range] = []
+    index = 0
+    for start, end in ranges:
+        while index < len(other) and other[index][1] < start:
+            index += 1
+        position = index
+        while position < len(other) and other[position][0] <= end:
+            if other[position][0] > start:
+                result.append((start, other[position][0] - 1))
+            start = max(start, other[position][1] + 1)
+            if start > end:
+                break
+            position += 1
+        if start <= end:
+            result.append((start, end))
+    return result
+
+
+def _intersect(ranges: List[Range], other: List[Range]) -> List[Range]:
+    result: List[Range] = []
+    i = j = 0
+    while i < len(ranges) and j < len(other):
+        start = max(ranges[i][0], other[j][0])
+        end = min(ranges[i][1], other[j][1])
+        if start <= end:
+            result.append((start, end))
+        if ranges[i][1] < other[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+class _WideInts(Sequence[int]):
+    """Read-only sequence of 128-bit integers split into two 64-bit halves."""
+
+    def __init__(self, high: Sequence[int], low: Sequence[int]):
+        self.high = high
+        self.low = low
+
+    def __len__(self) -> int:
+        return len(self.high)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        return (self.high[index] << 64) | self.low[index]
+
+
+class IPSet:
+    """Set of IPv4 and IPv6 addresses stored as sorted ranges.
+
+    Addresses and networks are kept as disjoint, merged ranges in typed
+    arrays, so ``10.0.0.0/8`` costs as much as a single address and
+    membership is a binary search. A set can be saved to disk and loaded
+    back through ``mmap`` without reading it into memory.
+
+    Sets are immutable. ``|``, ``&`` and ``-`` return new sets.
+
+    Examples:
+        >>> from censys.common.ipset import IPSet
+        >>> excluded = IPSet(["10.0.0.0/8", "192.168.1.1", "2001:db8::/32"])
+        >>> "10.1.2.3" in excluded
+        True
+        >>> hits = [{"ip": "8.8.8.8"}, {"ip": "10.0.0.1"}]
+        >>> list(excluded.filter(hits, key=lambda hit: hit["ip"], exclude=True))
+        [{'ip': '8.8.8.8'}]
+    """
+
+    def __init__(self, items: Iterable[IPLike] = ()):
+        """Inits IPSet.
+
+        Args:
+            items (Iterable[IPLike]): Optional; Addresses and networks, as strings, integers or ``ipaddress`` objects. Integers are read as IPv4 below 2**32.
+        """
+        ranges: dict = {4: [], 6: []}
+        for item in items:
+            version, item_range = _to_range(item)
+            ranges[version].append(item_range)
+        self._set_ranges(_merge(ranges[4]), _merge(ranges[6]))
+        self._mmap: Optional[mmap.mmap] = None
+
+    def _set_ranges(self, v4: List[Range], v6: List[Range]):
+        self._v4_starts: Sequence[int] = array("I", (start for start, _ in v4))
+        self._v4_ends: Sequence[int] = array("I", (end for _, end in v4))
+        self._v6_starts: Sequence[int] = _WideInts(
+            array("Q", (start >> 64 for start, _ in v6)),
+            array("Q", (start & LOW_64 for start, _ in v6)),
+        )
+        self._v6_ends: Sequence[int] = _WideInts(
+            array("Q", (end >> 64 for _, end in v6)),
+            array("Q", (end & LOW_64 for _, end in v6)),
+        )
+
+    @classmethod
+    def _from_ranges(cls, v4: List[Range], v6: List[Range]) -> "IPSet":
+        ip_set = cls()
+        ip_set._set_ranges(v4, v6)
+        return ip_set
+
+    def _family(self, version: int) -> Tuple[Sequence[int], Sequence[int]]:
+        if version == 4:
+            return self._v4_starts, self._v4_ends
+        return self._v6_starts, self._v6_ends
+
+    def ranges(self, version: int) -> Iterator[Range]:
+        """Iterates over the ranges of one IP version as integers.
+
+        Args:
+            version (int): 4 or 6.
+
+        Yields:
+            Range: The first and last address of each range.
+        """
+        starts, ends = self._family(version)
+        for index in range(len(starts)):
+            yield starts[index], ends[index]
+
+    def __contains__(self, item: object) -> bool:
+        """Checks if an address, or every address of a network, is in the set.
+
+        Args:
+            item (object): Address or network.
+
+        Returns:
+            bool: True if it is in the set. Invalid addresses are not.
+        """
+        try:
+            version, (start, end) = _to_range(item)  # type: ignore[arg-type]
+        except ValueError:
+            return False
+        starts, ends = self._family(version)
+        index = bisect.bisect_right(starts, start) - 1
+        return index >= 0 and ends[index] >= end
+
+    def __bool__(self) -> bool:
+        """Checks if the set is not empty.
+
+        Returns:
+            bool: True if it contains an address.
+        """
+        return bool(len(self._v4_starts) or len(self._v6_starts))
+
+    def __eq__(self, other: object) -> bool:
+        """Compares the addresses of two sets.
+
+        Args:
+            other (object): Other set.
+
+        Returns:
+            bool: True if both contain the same addresses.
+        """
+        if not isinstance(other, IPSet):
+            return NotImplemented
+        return all(
+            list(self.ranges(version)) == list(other.ranges(version))
+            for version in (4, 6)
+        )
+
+    def __repr__(self) -> str:
+        """Representation of IPSet.
+
+        Returns:
+            str: Printable representation.
+        """
+        return (
+            f"IPSet({len(self._v4_starts)} IPv4 ranges, "
+            f"{len(self._v6_starts)} IPv6 ranges)"
+        )
+
+    @property
+    def num_addresses(self) -> int:
+        """Number of addresses in the set.
+
+        Returns:
+            int: The address count.
+        """
+        return sum(
+            end - start + 1 for version in (4, 6) for start, end in self.ranges(version)
+        )
+
+    def networks(self) -> Iterator[Union[ipaddress.IPv4Network, ipaddress.IPv6Network]]:
+        """Iterates over the fewest networks covering the set.
+
+        Yields:
+            Union[IPv4Network, IPv6Network]: Each network, IPv4 first.
+        """
+        for version, address in (
+            (4, ipaddress.IPv4Address),
+            (6, ipaddress.IPv6Address),
+        ):
+            for start, end in self.ranges(version):
+                yield from ipaddress.summarize_address_range(
+                    address(start), address(end)  # type: ignore[arg-type]
+                )
+
+    def __iter__(self) -> Iterator[Union[ipaddress.IPv4Network, ipaddress.IPv6Network]]:
+        """Iterates over the fewest networks covering the set.
+
+        Returns:
+            Iterator[Union[IPv4Network, IPv6Network]]: The networks.
+        """
+        return self.networks()
+
+    def _combine(
+        self,
+        other: "IPSet",
+        operation: Callable[[List[Range], List[Range]], List[Range]],
+    ) -> "IPSet":
+        return self._from_ranges(
+            *(
+                operation(list(self.ranges(version)), list(other.ranges(version)))
+                for version in (4, 6)
+            )
+        )
+
+    def union(self, other: "IPSet") -> "IPSet":
+        """Returns the addresses in either set.
+
+        Args:
+            other (IPSet): Other set.
+
+        Returns:
+            IPSet: The union.
+        """
+        return self._combine(other, lambda a, b: _merge(a + b))
+
+    def intersection(self, other: "IPSet") -> "IPSet":
+        """Returns the addresses in both sets.
+
+        Args:
+            other (IPSet): Other set.
+
+        Returns:
+            IPSet: The intersection.
+        """
+        return self._combine(other, _intersect)
+
+    def difference(self, other: "IPSet") -> "IPSet":
+        """Returns the addresses in this set but not in the other.
+
+        Args:
+            other (IPSet): Other set.
+
+        Returns:
+            IPSet: The difference.
+        """
+        return self._combine(other, _subtract)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def filter(
+        self,
+        items: Iterable[T],
+        key: Optional[Callable[[T], Any]] = None,
+        exclude: bool = False,
+    ) -> Iterator[T]:
+        """Keeps the items whose address is in the set, or not in it.
+
+        Args:
+            items (Iterable[T]): Items to filter, such as search hits.
+            key (Callable[[T], Any]): Optional; Returns the address of an item. Defaults to the item itself.
+            exclude (bool): Optional; Keep the items not in the set instead. Defaults to False.
+
+        Yields:
+            T: Each kept item.
+        """
+        for item in items:
+            if ((key(item) if key else item) in self) != exclude:
+                yield item
+
+    def save(self, file_path: str):
+        """Writes the set to a file in native byte order.
+
+        Args:
+            file_path (str): The file path.
+        """
+        v6_starts: _WideInts = self._v6_starts  # type: ignore[assignment]
+        v6_ends: _WideInts = self._v6_ends  # type: ignore[assignment]
+        with open(file_path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, len(self._v4_starts), len(v6_starts)))
+            for values in (
+                self._v4_starts,
+                self._v4_ends,
+                v6_starts.high,
+                v6_starts.low,
+                v6_ends.high,
+                v6_ends.low,
+            ):
+                file.write(bytes(memoryview(values)))  # type: ignore[arg-type]
+
+    @classmethod
+    def load(cls, file_path: str) -> "IPSet":
+        """Maps a set written by ``save`` into memory.
+
+        Pages of the file are only read when they are searched, so large
+        sets load instantly and are shared between processes.
+
+        Args:
+            file_path (str): The file path.
+
+        Raises:
+            CensysException: If the file is not an IP set.
+
+        Returns:
+            IPSet: The set, backed by the file.
+        """
+        with open(file_path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, v4_count, v6_count = HEADER.unpack_from(mapped)
+        if magic != MAGIC or len(mapped) != HEADER.size + (
+            v4_count * 8 + v6_count * 32
+        ):
+            mapped.close()
+            raise CensysException(f"{file_path} is not an IP set file.")
+
+        view = memoryview(mapped)
+        offset = HEADER.size
+
+        def take(count: int, wide: bool = False) -> memoryview:
+            nonlocal offset
+            size = count * (8 if wide else 4)
+            values = view[offset : offset + size]
+            offset += size
+            return values.cast("Q") if wide else values.cast("I")
+
+        ip_set = cls()
+        ip_set._v4_starts = take(v4_count)
+        ip_set._v4_ends = take(v4_count)
+        ip_set._v6_starts = _WideInts(take(v6_count, True), take(v6_count, True))
+        ip_set._v6_ends = _WideInts(take(v6_count, True), take(v6_count, True))
+        ip_set._mmap = mapped
+        return ip_set
@@ -0,0 +1,606 @@
+"""Evaluate search queries locally over exported documents."""
+
+import fnmatch
+import ipaddress
+import json
+import re
+import time
+from array import array
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Union,
+)
+
+from .documents import get_field
+from .exceptions import CensysQuerySyntaxException
+
+NUMBER_REGEX = re.compile(r"^-?\d+(\.\d+)?$")
+TOKEN_REGEX = re.compile(
+    r'\s*(?:(?P<string>"(?:[^"\\]|\\.)*")|(?P<op>>=|<=|[><():\[\]{}])|(?P<word>[^\s():\[\]{}"<>]+))'
+)
+
+Key = Union[str, float]
+
+
+def _normalize(value: Any) -> Key:
+    """Normalizes a value so equal values compare equal.
+
+    Numbers and numeric strings become floats, and other values become
+    lowercase strings.
+
+    Args:
+        value (Any): Field or query value.
+
+    Returns:
+        Key: The normalized value.
+    """
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value)
+    if NUMBER_REGEX.match(text):
+        return float(text)
+    return text.lower()
+
+
+def _text(key: Key) -> str:
+    if isinstance(key, float) and key.is_integer():
+        return str(int(key))
+    return str(key)
+
+
+def _leaves(value: Any) -> Iterator[Any]:
+    if isinstance(value, list):
+        for item in value:
+            yield from _leaves(item)
+    elif isinstance(value, Mapping):
+        for item in value.values():
+            yield from _leaves(item)
+    elif value is not None:
+        yield value
+
+
+def _compare(key: Key, bound: Key) -> Optional[int]:
+    if isinstance(key, float) != isinstance(bound, float):
+        return None
+    return (key > bound) - (key < bound)  # type: ignore[operator]
+
+
+class Node:
+    """Node of a parsed query."""
+
+    def matches(self, document: Any) -> bool:
+        """Checks if a document matches the node.
+
+        Args:
+            document (Any): Decoded document.
+
+        Raises:
+            NotImplementedError: In the base class.
+        """
+        raise NotImplementedError
+
+
+class Term(Node):
+    """Matches a field, or any field if ``field`` is None, against a value.
+
+    Values can contain ``*`` and ``?`` wildcards, and a network such as
+    ``10.0.0.0/8`` matches the addresses it contains. ``field: *`` matches
+    documents having the field.
+    """
+
+    def __init__(self, field: Optional[str], value: str):
+        """Inits Term.
+
+        Args:
+            field (str): Optional; Dotted field path.
+            value (str): Expected value.
+        """
+        self.field = field
+        self.value = value
+        self.key = _normalize(value)
+        self.pattern: Optional[re.Pattern] = None
+        self.network: Any = None
+        if value != "*" and ("*" in value or "?" in value):
+            self.pattern = re.compile(fnmatch.translate(value.lower()))
+        elif "/" in value:
+            try:
+                self.network = ipaddress.ip_network(value, strict=False)
+            except ValueError:
+                pass
+
+    def match_key(self, key: Key) -> bool:
+        """Checks if a normalized value matches.
+
+        Args:
+            key (Key): Normalized value.
+
+        Returns:
+            bool: True if it matches.
+        """
+        if self.pattern is not None:
+            return bool(self.pattern.match(_text(key)))
+        if self.network is not None and isinstance(key, str):
+            try:
+                return ipaddress.ip_address(key) in self.network
+            except ValueError:
+                return False
+        return key == self.key
+
+    def values(self, document: Any) -> Iterator[Any]:
+        """Gets the values of the field of the node.
+
+        Args:
+            document (Any): Decoded document.
+
+        Returns:
+            Iterator[Any]: Leaf values.
+        """
+        if self.field is None:
+            return _leaves(document)
+        return _leaves(get_field(document, self.field))
+
+    def matches(self, document: Any) -> bool:
+        """Checks if a document matches the node.
+
+        Args:
+            document (Any): Decoded document.
+
+        Returns:
+            bool: True if it matches.
+        """
+        if self.value == "*":
+            return any(True for _ in self.values(document))
+        return any(self.match_key(_normalize(v)) for v in self.values(document))
+
+    def __repr__(self) -> str:
+        """Representation of Term.
+
+        Returns:
+            str: Printable representation.
+        """
+        return f"Term({self.field!r}, {self.value!r})"
+
+
+class Range(Term):
+    """Matches a field against a range, such as ``[100 to 200}``.
+
+    Numbers are compared numerically and other values as lowercase
+    strings, so ISO dates compare in time order.
+    """
+
+    def __init__(
+        self,
+        field: Optional[str],
+        low: Optional[str],
+        high: Optional[str],
+        include_low: bool = True,
+        include_high: bool = True,
+    ):
+        """Inits Range.
+
+        Args:
+            field (str): Optional; Dotted field path.
+            low (str): Optional; Lower bound, or None if open.
+            high (str): Optional; Upper bound, or None if open.
+            include_low (bool): Optional; Whether the lower bound matches.
+            include_high (bool): Optional; Whether the upper bound matches.
+        """
+        super().__init__(field, "")
+        self.low = None if low is None else _normalize(low)
+        self.high = None if high is None else _normalize(high)
+        self.include_low = include_low
+        self.include_high = include_high
+
+    def match_key(self, key: Key) -> bool:
+        """Checks if a normalized value is in the range.
+
+        Args:
+            key (Key): Normalized value.
+
+        Returns:
+            bool: True if it is in the range.
+        """
+        if self.low is not None:
+            order = _compare(key, self.low)
+            if order is None or order < 0 or (order == 0 and not self.include_low):
+                return False
+        if self.high is not None:
+            order = _compare(key, self.high)
+            if order is None or order > 0 or (order == 0 and not self.include_high):
+                return False
+        return True
+
+    def __repr__(self) -> str:
+        """Representation of Range.
+
+        Returns:
+            str: Printable representation.
+        """
+        return f"Range({self.field!r}, {self.low!r}, {self.high!r})"
+
+
+class And(Node):
+    """Matches documents matching every child."""
+
+    def __init__(self, children: List[Node]):
+        """Inits And.
+
+        Args:
+            children (List[Node]): Child nodes.
+        """
+        self.children = children
+
+    def matches(self, document: Any) -> bool:
+        """Checks if a document matches every child.
+
+        Args:
+            document (Any): Decoded document.
+
+        Returns:
+            bool: True if it matches.
+        """
+        return all(child.matches(document) for child in self.children)
+
+
+class Or(And):
+    """Matches documents matching any child."""
+
+    def matches(self, document: Any) -> bool:
+        """Checks if a document matches any child.
+
+        Args:
+            document (Any): Decoded document.
+
+        Returns:
+            bool: True if it matches.
+        """
+        return any(child.matches(document) for child in self.children)
+
+
+class Not(Node):
+    """Matches documents not matching its child."""
+
+    def __init__(self, child: Node):
+        """Inits Not.
+
+        Args:
+            child (Node): Negated node.
+        """
+        self.child = child
+
+    def matches(self, document: Any) -> bool:
+        """Checks if a document does not match the child.
+
+        Args:
+            document (Any): Decoded document.
+
+        Returns:
+            bool: True if it matches.
+        """
+        return not self.child.matches(document)
+
+
+class _Parser:
+    def __init__(self, query: str):
+        self.query = query
+        self.tokens: List[str] = []
+        position = 0
+        query = query.rstrip()
+        while position < len(query):
+            match = TOKEN_REGEX.match(query, position)
+            if not match:
+                raise CensysQuerySyntaxException(
+                    f"Unexpected character at {position} in query: {query}"
+                )
+            self.tokens.append(match.group(match.lastgroup))  # type: ignore[arg-type]
+            position = match.end()
+        self.position = 0
+
+    def peek(self) -> Optional[str]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def take(self, expected: Optional[str] = None) -> str:
+        token = self.peek()
+        if token is None or (expected is not None and token != expected):
+            raise CensysQuerySyntaxException(
+                f"Expected {expected or 'a value'} in query: {self.query}"
+            )
+        self.position += 1
+        return token
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            return Term(None, "*")
+        node = self.parse_or()
+        if self.peek() is not None:
+            raise CensysQuerySyntaxException(
+                f"Unexpected {self.peek()} in query: {self.query}"
+            )
+        return node
+
+    def parse_or(self) -> Node:
+        children = [self.parse_and()]
+        while (self.peek() or "").lower() == "or":
+            self.take()
+            children.append(self.parse_and())
+        return children[0] if len(children) == 1 else Or(children)
+
+    def parse_and(self) -> Node:
+        children = [self.parse_not()]
+        while self.peek() not in (None, ")") and (self.peek() or "").lower() != "or":
+            if (self.peek() or "").lower() == "and":
+                self.take()
+            children.append(self.parse_not())
+        return children[0] if len(children) == 1 else And(children)
+
+    def parse_not(self) -> Node:
+        token = self.peek() or ""
+        if token.lower() == "not":
+            self.take()
+            return Not(self.parse_not())
+        if token.startswith("-") and len(token) > 1 and not NUMBER_REGEX.match(token):
+            self.tokens[self.position] = token[1:]
+            return Not(self.parse_not())
+        return self.parse_primary()
+
+    def parse_primary(self) -> Node:
+        token = self.take()
+        if token == "(":
+            node = self.parse_or()
+            self.take(")")
+            return node
+        if self.peek() == ":":
+            self.take()
+            return self.parse_value(token)
+        if self.peek() in (">", ">=", "<", "<="):
+            return self.parse_value(token)
+        return self.parse_value(None, token)
+
+    def value(self, token: str) -> str:
+        if token.startswith('"'):
+            return json.loads(token)
+        if token in "()[]{}:<>" or token in (">=", "<="):
+            raise CensysQuerySyntaxException(
+                f"Unexpected {token} in query: {self.query}"
+            )
+        return token
+
+    def parse_value(self, field: Optional[str], token: Optional[str] = None) -> Node:
+        token = token if token is not None else self.take()
+        if token in (">", ">=", "<", "<="):
+            bound = self.value(self.take())
+            if token.startswith(">"):
+                return Range(field, bound, None, include_low=token == ">=")
+            return Range(field, None, bound, include_high=token == "<=")
+        if token in ("[", "{"):
+            low = self.value(self.take())
+            if self.take().lower() != "to":
+                raise CensysQuerySyntaxException(
+                    f"Expected to in range of query: {self.query}"
+                )
+            high = self.value(self.take())
+            closing = self.take()
+            if closing not in ("]", "}"):
+                raise CensysQuerySyntaxException(
+                    f"Expected ] or }} in query: {self.query}"
+                )
+            return Range(
+                field,
+                None if low == "*" else low,
+                None if high == "*" else high,
+                include_low=token == "[",
+                include_high=closing == "]",
+            )
+        if token == "(" and field is not None:
+            # Values grouped under one field, such as port: (80 or 443)
+            node = self.parse_or()
+            self.take(")")
+            return self.apply_field(node, field)
+        return Term(field, self.value(token))
+
+    def apply_field(self, node: Node, field: str) -> Node:
+        if isinstance(node, Term) and node.field is None:
+            node.field = field
+        elif isinstance(node, And):
+            node.children = [self.apply_field(child, field) for child in node.children]
+        elif isinstance(node, Not):
+            node.child = self.apply_field(node.child, field)
+        return node
+
+
+def parse_query(query: str) -> Node:
+    """Parses a query in a subset of the Censys search language.
+
+    Supported are ``field: value`` terms, quoted values, ``*`` and ``?``
+    wildcards, ranges such as ``[100 to 200]``, ``{* to 2024-01-01}``,
+    ``>= 100`` and ``port > 100``, networks such as ``ip: 10.0.0.0/8``, values grouped under one
+    field such as ``port: (80 or 443)``, ``and``, ``or``, ``not`` and
+    parentheses. Terms without a field match any field. Terms next to each
+    other are combined with ``and``.
+
+    Args:
+        query (str): The query.
+
+    Returns:
+        Node: The parsed query.
+    """
+    return _Parser(query).parse()
+
+
+def filter_documents(
+    documents: Iterable[Any], query: Union[str, Node]
+) -> Iterator[Any]:
+    """Streams the documents matching a query.
+
+    Args:
+        documents (Iterable[Any]): Decoded documents.
+        query (Union[str, Node]): Query or parsed query.
+
+    Yields:
+        Any: Each matching document.
+    """
+    node = parse_query(query) if isinstance(query, str) else query
+    for document in documents:
+        if node.matches(document):
+            yield document
+
+
+def read_ndjson(file_path: str) -> Iterator[dict]:
+    """Reads documents from a file with one JSON document per line.
+
+    Args:
+        file_path (str): The file path.
+
+    Yields:
+        dict: Each document.
+    """
+    with open(file_path) as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def documents_from_cache(storage: Mapping[str, Any]) -> Iterator[dict]:
+    """Reads the documents stored in a ``ConditionalCache``.
+
+    Search hits are yielded one by one, and other results as they are.
+
+    Args:
+        storage (Mapping[str, Any]): Storage of a ``ConditionalCache``.
+
+    Yields:
+        dict: Each document.
+    """
+    for entry in storage.values():
+        try:
+            result = json.loads(entry["body"]).get("result")
+        except (ValueError, AttributeError, KeyError, TypeError):
+            continue
+        if isinstance(result, dict) and isinstance(result.get("hits"), list):
+            yield from result["hits"]
+        elif isinstance(result, dict):
+            yield result
+
+
+class LocalIndex:
+    """Documents searchable with local queries.
+
+    Queries are evaluated into sets of document positions. Fields passed to
+    ``add_index`` get an inverted index from values to positions, so terms
+    on them are looked up instead of scanning every document.
+
+    Examples:
+        >>> from censys.common.local_search import LocalIndex, read_ndjson
+        >>> index = LocalIndex(read_ndjson("hosts.ndjson"))
+        >>> index.add_index("services.port", "location.country_code")
+        >>> result = index.search("services.port: 8443 and location.country_code: DE")
+        >>> result["total"], result["seconds"]
+        (12, 0.0004)
+    """
+
+    def __init__(self, documents: Iterable[Any]):
+        """Inits LocalIndex.
+
+        Args:
+            documents (Iterable[Any]): Decoded documents.
+        """
+        self.documents: List[Any] = list(documents)
+        self.indexes: Dict[str, Dict[Key, array]] = {}
+
+    def __len__(self) -> int:
+        """Number of documents.
+
+        Returns:
+            int: Document count.
+        """
+        return len(self.documents)
+
+    def add_index(self, *fields: str):
+        """Builds inverted indexes for fields.
+
+        Args:
+            *fields (str): Dotted field paths.
+        """
+        for field in fields:
+            index: Dict[Key, array] = {}
+            for position, document in enumerate(self.documents):
+                keys = {_normalize(v) for v in _leaves(get_field(document, field))}
+                for key in keys:
+                    index.setdefault(key, array("I")).append(position)
+            self.indexes[field] = index
+
+    def _evaluate(self, node: Node) -> Set[int]:
+        if isinstance(node, Or):
+            return set().union(*(self._evaluate(child) for child in node.children))
+        if isinstance(node, And):
+            # Evaluate the cheapest children first and stop on empty results
+            children = sorted(
+                node.children, key=lambda child: isinstance(child, (Not, And))
+            )
+            positions = self._evaluate(children[0])
+            for child in children[1:]:
+                if not positions:
+                    break
+                if isinstance(child, Not):
+                    positions -= self._evaluate(child.child)
+                else:
+                    positions &= self._evaluate(child)
+            return positions
+        if isinstance(node, Not):
+            return set(range(len(self.documents))) - self._evaluate(node.child)
+        if isinstance(node, Term) and node.field in self.indexes:
+            index = self.indexes[node.field]
+            if node.value == "*" and not isinstance(node, Range):
+                keys: Iterable[Key] = index
+            elif (
+                node.pattern is None
+                and node.network is None
+                and not isinstance(node, Range)
+            ):
+                keys = [node.key] if node.key in index else []
+            else:
+                keys = [key for key in index if node.match_key(key)]
+            return set().union(*(index[key] for key in keys))
+        return {
+            position
+            for position, document in enumerate(self.documents)
+            if node.matches(document)
+        }
+
+    def search(
+        self,
+        query: Union[str, Node],
+        limit: Optional[int] = None,
+        timer: Callable[[], float] = time.perf_counter,
+    ) -> Dict[str, Any]:
+        """Searches the documents.
+
+        Args:
+            query (Union[str, Node]): Query or parsed query.
+            limit (int): Optional; Maximum number of hits returned. Defaults to all.
+            timer (Callable[[], float]): Optional; Clock used to time the search.
+
+        Returns:
+            Dict[str, Any]: The ``total`` number of matches, the ``seconds`` taken and the ``hits`` in document order.
+        """
+        started = timer()
+        node = parse_query(query) if isinstance(query, str) else query
+        positions = sorted(self._evaluate(node))
+        seconds = timer() - started
+        return {
+            "total": len(positions),
+            "seconds": seconds,
+            "hits": [self.documents[p] for p in positions[:limit]],
+        }
@@ -0,0 +1,486 @@
+"""Client-wide retry controls for the Censys APIs."""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
+
+import requests
+
+from .exceptions import (
+    CensysAPIException,
+    CensysAppDownForMaintenanceException,
+    CensysCircuitOpenException,
+    CensysInternalServerErrorException,
+    CensysInternalServerException,
+)
+from .stats import percentile as latency_percentile
+
+SERVER_FAILURE_EXCEPTIONS = (
+    CensysInternalServerException,
+    CensysInternalServerErrorException,
+    CensysAppDownForMaintenanceException,
+    requests.exceptions.Timeout,
+    requests.exceptions.ConnectionError,
+)
+"""Exceptions that indicate the API itself is failing."""
+
+
+def is_server_failure(error: BaseException) -> bool:
+    """Checks if an error was caused by the API rather than by the request.
+
+    Args:
+        error (BaseException): The raised error.
+
+    Returns:
+        bool: True if the error counts against the circuit breaker.
+    """
+    if isinstance(error, SERVER_FAILURE_EXCEPTIONS):
+        return True
+    return isinstance(error, CensysAPIException) and error.status_code >= 500
+
+
+class CircuitBreaker:
+    """Circuit breaker shared by every request of a client.
+
+    The breaker starts ``closed``. After ``failure_threshold`` consecutive
+    server failures it trips ``open`` and rejects calls immediately with
+    ``CensysCircuitOpenException``. Once ``recovery_timeout`` seconds have
+    passed it becomes ``half-open`` and lets ``half_open_max_calls`` trial
+    calls through. A successful trial closes the breaker again, a failed one
+    re-opens it.
+
+    Examples:
+        Share one breaker between several indexes.
+
+        >>> from censys.common.retry import CircuitBreaker
+        >>> from censys.search import SearchClient
+        >>> c = SearchClient(circuit_breaker=CircuitBreaker(failure_threshold=10))
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        is_failure: Callable[[BaseException], bool] = is_server_failure,
+    ):
+        """Inits CircuitBreaker.
+
+        Args:
+            failure_threshold (int): Optional; Consecutive failures before opening.
+            recovery_timeout (float): Optional; Seconds to stay open before probing.
+            half_open_max_calls (int): Optional; Concurrent trial calls when half-open.
+            is_failure (Callable): Optional; Classifies errors as server failures.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.is_failure = is_failure
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0
+
+    @property
+    def state(self) -> str:
+        """The current state of the breaker.
+
+        Returns:
+            str: One of ``closed``, ``open`` or ``half-open``.
+        """
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = self.HALF_OPEN
+            self._trial_calls = 0
+        return self._state
+
+    def before_call(self):
+        """Reserves a call slot.
+
+        Raises:
+            CensysCircuitOpenException: If the breaker rejects the call.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and self._trial_calls < self.half_open_max_calls:
+                self._trial_calls += 1
+                return
+            retry_in = max(
+                0.0, self.recovery_timeout - (time.monotonic() - self._opened_at)
+            )
+        raise CensysCircuitOpenException(
+            f"Circuit breaker is {state}, failing fast. Retry in {retry_in:.1f}s."
+        )
+
+    def _release_trial(self):
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._trial_calls > 0:
+                self._trial_calls -= 1
+
+    def record_success(self):
+        """Records a successful call."""
+        with self._lock:
+            self._failures = 0
+            self._state = self.CLOSED
+
+    def record_failure(self, error: BaseException):
+        """Records a failed call.
+
+        Args:
+            error (BaseException): The raised error.
+        """
+        if not self.is_failure(error):
+            # The API answered, so a client error still proves it is up
+            self.record_success()
+            return
+        with self._lock:
+            self._failures += 1
+            if (
+                self._state == self.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Calls a function through the breaker.
+
+        Args:
+            func (Callable): Function to call.
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            Any: The function result.
+        """
+        self.before_call()
+        settled = False
+        try:
+            result = func(*args, **kwargs)
+            settled = True
+        except Exception as error:
+            settled = True
+            self.record_failure(error)
+            raise
+        finally:
+            if not settled:
+                # An interrupted call proves nothing, so free its trial slot
+                self._release_trial()
+        self.record_success()
+        return result
+
+
+class RetryBudget:
+    """Retry budget shared by every request of a client.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so
+    retries stay at roughly ``ratio`` of all requests. The balance starts full
+    and is capped at ``capacity``, which allows a small burst of retries for
+    low-traffic clients.
+
+    Examples:
+        Allow retries for at most 10% of requests.
+
+        >>> from censys.common.retry import RetryBudget
+        >>> from censys.search import CensysHosts
+        >>> h = CensysHosts(retry_budget=RetryBudget(ratio=0.1))
+    """
+
+    def __init__(self, ratio: float = 0.1, capacity: float = 10.0):
+        """Inits RetryBudget.
+
+        Args:
+            ratio (float): Optional; Retries allowed per request.
+            capacity (float): Optional; Maximum number of banked retries.
+        """
+        self.ratio = ratio
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._balance = capacity
+        self.requests = 0
+        self.retries = 0
+        self.exhausted = 0
+
+    @property
+    def balance(self) -> float:
+        """Number of retries currently available.
+
+        Returns:
+            float: The token balance.
+        """
+        with self._lock:
+            return self._balance
+
+    def record_request(self):
+        """Deposits tokens for a new request."""
+        with self._lock:
+            self.requests += 1
+            self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def can_retry(self) -> bool:
+        """Checks if the budget allows another retry.
+
+        Returns:
+            bool: True if a retry may be sent.
+        """
+        with self._lock:
+            if self._balance >= 1:
+                return True
+            self.exhausted += 1
+            return False
+
+    def record_retry(self):
+        """Withdraws a token for a retry."""
+        with self._lock:
+            self.retries += 1
+            self._balance -= 1
+
+    def try_acquire(self) -> bool:
+        """Withdraws a token for a retry if the budget allows one.
+
+        Unlike ``can_retry`` followed by ``record_retry``, checking and
+        withdrawing happen under one lock, so concurrent requests cannot
+        spend the same token.
+
+        Returns:
+            bool: True if a retry may be sent.
+        """
+        with self._lock:
+            if self._balance >= 1:
+                self.retries += 1
+                self._balance -= 1
+                return True
+            self.exhausted += 1
+            return False
+
+
+class Hedger:
+    """Hedges slow idempotent requests with a duplicate request.
+
+    A request that has not returned after the ``percentile`` latency of
+    recent requests to its endpoint is sent again, and the first successful
+    response wins. Until ``min_samples`` latencies are known, the delay is
+    ``initial_delay``. Hedges draw from a budget like ``RetryBudget``, so
+    they stay at roughly ``ratio`` of all requests and cannot multiply the
+    load during a slowdown.
+
+    Clients hedge each HTTP request they send, below their retries, so
+    latencies do not include backoff sleeps and hedges are not counted as
+    retries. Every attempt runs on a thread of its own, started when the
+    request is made, so hedging is not limited by a pool size and the
+    time waiting for a thread is not counted as latency. The losing
+    request is not cancelled, its response is discarded.
+
+    Examples:
+        Hedge host views slower than the 95th percentile.
+
+        >>> from censys.common.retry import Hedger
+        >>> from censys.search import CensysHosts
+        >>> h = CensysHosts(hedger=Hedger(percentile=95, ratio=0.05))
+        >>> h.view("1.1.1.1")
+        >>> h.hedger.stats()
+        {'requests': 1, 'hedges': 0, 'hedge_wins': 0, 'exhausted': 0, 'win_rate': None}
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.01,
+        min_samples: int = 20,
+        window: int = 1000,
+        ratio: float = 0.05,
+        capacity: float = 5.0,
+    ):
+        """Inits Hedger.
+
+        Args:
+            percentile (float): Optional; Latency percentile after which a request is hedged.
+            initial_delay (float): Optional; Delay in seconds until enough latencies are known.
+            min_delay (float): Optional; Shortest delay in seconds.
+            min_samples (int): Optional; Latencies needed before using the percentile.
+            window (int): Optional; Number of recent latencies kept per endpoint.
+            ratio (float): Optional; Hedges allowed per request.
+            capacity (float): Optional; Maximum number of banked hedges.
+        """
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.ratio = ratio
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._balance = capacity
+        self._threads: Set[threading.Thread] = set()
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.exhausted = 0
+
+    def delay(self, key: str) -> float:
+        """Gets the time to wait before hedging a request.
+
+        Args:
+            key (str): The endpoint of the request.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies.get(key, ()))
+        if len(latencies) < self.min_samples:
+            return self.initial_delay
+        return max(
+            self.min_delay, latency_percentile(latencies, self.percentile) or 0.0
+        )
+
+    def record_latency(self, key: str, seconds: float):
+        """Records the latency of a successful request.
+
+        Args:
+            key (str): The endpoint of the request.
+            seconds (float): The latency.
+        """
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None:
+                latencies = self._latencies[key] = deque(maxlen=self.window)
+            latencies.append(seconds)
+
+    def _can_hedge(self) -> bool:
+        with self._lock:
+            if self._balance >= 1:
+                self._balance -= 1
+                self.hedges += 1
+                return True
+            self.exhausted += 1
+            return False
+
+    def _start(
+        self, key: Optional[str], func: Callable[..., Any], *args, **kwargs
+    ) -> "Future[Any]":
+        future: "Future[Any]" = Future()
+
+        def run():
+            future.set_running_or_notify_cancel()
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                if key is not None:
+                    self.record_latency(key, time.perf_counter() - start)
+                future.set_result(result)
+            finally:
+                with self._lock:
+                    self._threads.discard(thread)
+
+        thread = threading.Thread(target=run, name="censys-hedge", daemon=True)
+        with self._lock:
+            self._threads.add(thread)
+        thread.start()
+        return future
+
+    def call(self, key: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Calls a function, and calls it again if it is slow.
+
+        Only the latencies of first attempts are recorded, so hedging does
+        not lower the delay it is based on.
+
+        Args:
+            key (str): The endpoint of the request, grouping latencies.
+            func (Callable): Idempotent function to call.
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+
+        Raises:
+            Exception: The error of the first attempt if every attempt failed.
+
+        Returns:
+            Any: The first successful result.
+        """
+        with self._lock:
+            self.requests += 1
+            self._balance = min(self.capacity, self._balance + self.ratio)
+
+        first = self._start(key, func, *args, **kwargs)
+        attempts: List["Future[Any]"] = [first]
+        done, _ = wait(attempts, timeout=self.delay(key))
+        if not done and self._can_hedge():
+            attempts.append(self._start(None, func, *args, **kwargs))
+
+        pending = set(attempts)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # Prefer the first attempt when both finish together
+            for future in attempts:
+                if future in done and future.exception() is None:
+                    if future is not first:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+        return first.result()
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the hedging counters.
+
+        Returns:
+            Dict[str, Any]: Requests, hedges sent, hedges that returned first, hedges denied by the budget and the share of hedges that won.
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "exhausted": self.exhausted,
+                "win_rate": (
+                    round(self.hedge_wins / self.hedges, 3) if self.hedges else None
+                ),
+            }
+
+    def close(self):
+        """Waits for the losing attempts that are still running."""
+        with self._lock:
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join()
+
+
+def guarded_call(
+    func: Callable[..., Any],
+    circuit_breaker: Optional[CircuitBreaker],
+    *args,
+    **kwargs,
+) -> Any:
+    """Calls a function through an optional circuit breaker.
+
+    Args:
+        func (Callable): Function to call.
+        circuit_breaker (CircuitBreaker): Optional; Breaker to call through.
+        *args: Variable length argument list.
+        **kwargs: Arbitrary keyword arguments.
+
+    Returns:
+        Any: The function result.
+    """
+    if circuit_breaker is None:
+        return func(*args, **kwargs)
+    return circuit_breaker.call(func, *args, **kwargs)
@@ -0,0 +1,306 @@
+"""Request statistics for the Censys APIs."""
+
+import math
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, Optional, Sequence, Tuple
+
+ID_SEGMENT_REGEX = re.compile(r"^(?!v\d+$).*[\d.:%@].*$")
+
+MAX_LATENCY_SAMPLES = 10000
+"""Number of recent request latencies kept for percentiles."""
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Replaces document IDs in an endpoint path with a placeholder.
+
+    Statistics are grouped by endpoint, so paths such as
+    ``/v2/hosts/1.1.1.1`` and ``/v2/hosts/8.8.8.8`` share ``/v2/hosts/{id}``.
+
+    Args:
+        endpoint (str): The path of API endpoint.
+
+    Returns:
+        str: Endpoint path with IDs replaced.
+    """
+    path = endpoint.split("?", 1)[0]
+    return "/".join(
+        "{id}" if ID_SEGMENT_REGEX.match(segment) else segment
+        for segment in path.split("/")
+    )
+
+
+def response_sizes(res: Any) -> Optional[Tuple[int, int]]:
+    """Measures the transferred and decoded size of a response body.
+
+    Args:
+        res (Response): HTTP response.
+
+    Returns:
+        Optional[Tuple[int, int]]: Bytes on the wire and decoded bytes.
+    """
+    content = getattr(res, "content", None)
+    if not isinstance(content, bytes):
+        return None
+    body_bytes = len(content)
+    wire_bytes = None
+    raw = getattr(res, "raw", None)
+    if raw is not None and hasattr(raw, "tell"):
+        try:
+            wire_bytes = raw.tell()
+        except (OSError, ValueError):  # pragma: no cover
+            wire_bytes = None
+    if not wire_bytes:
+        headers = getattr(res, "headers", None) or {}
+        wire_bytes = int(headers.get("Content-Length") or body_bytes)
+    return wire_bytes, body_bytes
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    """Computes a percentile with the nearest-rank method.
+
+    Args:
+        values (Sequence[float]): Sorted values.
+        q (float): Percentile between 0 and 100.
+
+    Returns:
+        Optional[float]: The percentile, or None without values.
+    """
+    if not values:
+        return None
+    rank = max(1, math.ceil(q / 100 * len(values)))
+    return values[min(rank, len(values)) - 1]
+
+
+class EndpointStats:
+    """Counters for a single endpoint."""
+
+    __slots__ = ("requests", "wire_bytes", "body_bytes")
+
+    def __init__(self):
+        """Inits EndpointStats."""
+        self.requests = 0
+        self.wire_bytes = 0
+        self.body_bytes = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the counters as a dictionary.
+
+        Returns:
+            Dict[str, Any]: Endpoint counters.
+        """
+        return {
+            "requests": self.requests,
+            "wire_bytes": self.wire_bytes,
+            "body_bytes": self.body_bytes,
+            "compression_ratio": (
+                round(self.body_bytes / self.wire_bytes, 2) if self.wire_bytes else None
+            ),
+        }
+
+
+class RequestStats:
+    """Thread-safe request counters grouped by endpoint.
+
+    ``wire_bytes`` counts the response body as transferred (compressed),
+    ``body_bytes`` counts it after decompression. Request latencies, retries
+    and the time spent in phases such as JSON decoding are counted too.
+    Everything recorded is also recorded in the ``parent`` statistics, if
+    any, to aggregate the requests of many clients.
+
+    Examples:
+        >>> from censys.search import CensysHosts
+        >>> h = CensysHosts()
+        >>> h.view("1.1.1.1")
+        >>> h.stats.snapshot()
+        {'/v2/hosts/{id}': {'requests': 1, 'wire_bytes': 2048, 'body_bytes': 9216, 'compression_ratio': 4.5}}
+    """
+
+    def __init__(self, parent: Optional["RequestStats"] = None):
+        """Inits RequestStats.
+
+        Args:
+            parent (RequestStats): Optional; Statistics also receiving every record.
+        """
+        self.parent = parent
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointStats] = {}
+        self._latencies: Deque[float] = deque(maxlen=MAX_LATENCY_SAMPLES)
+        self._phases: Dict[str, float] = {}
+        self._retries = 0
+
+    def record_response(self, endpoint: str, res: Any, seconds: Optional[float] = None):
+        """Records a response.
+
+        Args:
+            endpoint (str): The path of API endpoint.
+            res (Response): HTTP response.
+            seconds (float): Optional; Time taken by the request, counted as the ``network`` phase.
+        """
+        sizes = response_sizes(res)
+        key = endpoint_template(endpoint)
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = EndpointStats()
+            stats.requests += 1
+            if sizes:
+                stats.wire_bytes += sizes[0]
+                stats.body_bytes += sizes[1]
+            if seconds is not None:
+                self._latencies.append(seconds)
+                self._phases["network"] = self._phases.get("network", 0.0) + seconds
+        if self.parent is not None:
+            self.parent.record_response(endpoint, res, seconds)
+
+    def record_retry(self):
+        """Records a retried request."""
+        with self._lock:
+            self._retries += 1
+        if self.parent is not None:
+            self.parent.record_retry()
+
+    def record_phase(self, name: str, seconds: float):
+        """Adds time spent in a phase, such as ``decode`` or ``render``.
+
+        Args:
+            name (str): The phase name.
+            seconds (float): Time spent.
+        """
+        with self._lock:
+            self._phases[name] = self._phases.get(name, 0.0) + seconds
+        if self.parent is not None:
+            self.parent.record_phase(name, seconds)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Times the enclosed block as a phase.
+
+        Args:
+            name (str): The phase name.
+
+        Yields:
+            None
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_phase(name, time.perf_counter() - start)
+
+    def latency(self) -> Dict[str, Optional[float]]:
+        """Returns the percentiles of recent request latencies in seconds.
+
+        Returns:
+            Dict[str, Optional[float]]: The 50th, 90th and 99th percentiles and the maximum.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+        return {
+            "p50": percentile(latencies, 50),
+            "p90": percentile(latencies, 90),
+            "p99": percentile(latencies, 99),
+            "max": latencies[-1] if latencies else None,
+        }
+
+    def phases(self) -> Dict[str, float]:
+        """Returns the time spent in each phase in seconds.
+
+        Returns:
+            Dict[str, float]: Seconds by phase name.
+        """
+        with self._lock:
+            return dict(self._phases)
+
+    def summary(self) -> Dict[str, Any]:
+        """Returns the totals, retries, latency percentiles and phase timings.
+
+        Returns:
+            Dict[str, Any]: Summary of all recorded requests.
+        """
+        with self._lock:
+            retries = self._retries
+        return {
+            **self.totals(),
+            "retries": retries,
+            "latency": self.latency(),
+            "phases": self.phases(),
+        }
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Returns a copy of the counters.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Counters by endpoint.
+        """
+        with self._lock:
+            return {key: stats.to_dict() for key, stats in self._endpoints.items()}
+
+    def totals(self) -> Dict[str, Any]:
+        """Returns the counters summed over all endpoints.
+
+        Returns:
+            Dict[str, Any]: Total counters.
+        """
+        total = EndpointStats()
+        with self._lock:
+            for stats in self._endpoints.values():
+                total.requests += stats.requests
+                total.wire_bytes += stats.wire_bytes
+                total.body_bytes += stats.body_bytes
+        return total.to_dict()
+
+    def reset(self):
+        """Clears all counters."""
+        with self._lock:
+            self._endpoints.clear()
+            self._latencies.clear()
+            self._phases.clear()
+            self._retries = 0
+
+
+process_stats: Optional[RequestStats] = None
+"""Statistics of every client in the process, once enabled."""
+
+
+def enable_process_stats() -> RequestStats:
+    """Aggregates the statistics of every client created from now on.
+
+    Returns:
+        RequestStats: The process statistics.
+    """
+    global process_stats
+    if process_stats is None:
+        process_stats = RequestStats()
+    return process_stats
+
+
+def get_process_stats() -> Optional[RequestStats]:
+    """Gets the process statistics.
+
+    Returns:
+        Optional[RequestStats]: The process statistics, or None if they are not enabled.
+    """
+    return process_stats
+
+
+@contextmanager
+def timed_phase(name: str) -> Iterator[None]:
+    """Times the enclosed block as a phase of the process statistics.
+
+    Nothing is recorded unless process statistics are enabled.
+
+    Args:
+        name (str): The phase name.
+
+    Yields:
+        None
+    """
+    if process_stats is None:
+        yield
+        return
+    with process_stats.phase(name):
+        yield
@@ -0,0 +1,580 @@
+"""HTTP transports used to send requests to the Censys APIs."""
+
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, cast
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+from .exceptions import CensysException
+
+
+class Transport:
+    """Base class for HTTP transports.
+
+    A transport sends the requests of a client. Every transport owns a
+    ``requests.Session``, which holds the settings shared by all transports
+    (headers, credentials, cookies, proxies and TLS options), so clients can
+    configure a transport without knowing how it sends requests.
+
+    Subclasses must implement ``request``.
+    """
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        """Inits Transport.
+
+        Args:
+            session (requests.Session): Optional; Session holding request settings.
+        """
+        self.session = session or requests.Session()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        """Sends a request.
+
+        Must be implemented by child class.
+
+        Args:
+            method (str): HTTP method.
+            url (str): The URL to request.
+            **kwargs (Any): Keyword arguments accepted by ``requests.request``.
+
+        Raises:
+            NotImplementedError: This method is not implemented.
+        """
+        raise NotImplementedError("Transports must implement request.")
+
+    def get(self, url: str, **kwargs: Any) -> Response:
+        """Sends a GET request.
+
+        Args:
+            url (str): The URL to request.
+            **kwargs (Any): Keyword arguments accepted by ``requests.request``.
+
+        Returns:
+            Response: HTTP response.
+        """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Response:
+        """Sends a POST request.
+
+        Args:
+            url (str): The URL to request.
+            **kwargs (Any): Keyword arguments accepted by ``requests.request``.
+
+        Returns:
+            Response: HTTP response.
+        """
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> Response:
+        """Sends a PUT request.
+
+        Args:
+            url (str): The URL to request.
+            **kwargs (Any): Keyword arguments accepted by ``requests.request``.
+
+        Returns:
+            Response: HTTP response.
+        """
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs: Any) -> Response:
+        """Sends a PATCH request.
+
+        Args:
+            url (str): The URL to request.
+            **kwargs (Any): Keyword arguments accepted by ``requests.request``.
+
+        Returns:
+            Response: HTTP response.
+        """
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> Response:
+        """Sends a DELETE request.
+
+        Args:
+            url (str): The URL to request.
+            **kwargs (Any): Keyword arguments accepted by ``requests.request``.
+
+        Returns:
+            Response: HTTP response.
+        """
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self):
+        """Closes open connections."""
+        self.session.close()
+
+
+class RequestsTransport(Transport):
+    """Default transport, sending HTTP/1.1 requests with ``requests``."""
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        pool_size: Optional[int] = None,
+        adapter: Optional[HTTPAdapter] = None,
+    ):
+        """Inits RequestsTransport.
+
+        Args:
+            session (requests.Session): Optional; Session holding request settings.
+            pool_size (int): Optional; Connections kept open per host, which should be at least the number of concurrent requests. Defaults to the ``requests`` default of 10.
+            adapter (HTTPAdapter): Optional; Connection pool to send requests with, such as one shared by the transports of several clients. Overrides ``pool_size``.
+        """
+        super().__init__(session)
+        if adapter is None and pool_size:
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        if adapter is not None:
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        """Sends a request through the session.
+
+        Args:
+            method (str): HTTP method.
+            url (str): The URL to request.
+            **kwargs (Any): Keyword arguments accepted by ``requests.request``.
+
+        Returns:
+            Response: HTTP response.
+        """
+        return getattr(self.session, method.lower())(url, **kwargs)
+
+
+class HTTPXResponse:
+    """Adapts an ``httpx.Response`` to the parts of ``requests.Response`` we use."""
+
+    def __init__(self, response: Any):
+        """Inits HTTPXResponse.
+
+        Args:
+            response (httpx.Response): The httpx response.
+        """
+        self._response = response
+        self.status_code: int = response.status_code
+        self.headers = response.headers
+        self.url = str(response.url)
+        self.reason: str = response.reason_phrase
+
+    @property
+    def ok(self) -> bool:
+        """Whether the status code is less than 400.
+
+        Returns:
+            bool: True for successful responses.
+        """
+        return self.status_code < 400
+
+    @property
+    def elapsed(self) -> datetime.timedelta:
+        """Time between sending the request and reading the response.
+
+        Returns:
+            datetime.timedelta: Elapsed time.
+        """
+        return self._response.elapsed
+
+    @property
+    def content(self) -> bytes:
+        """The decoded response body.
+
+        Returns:
+            bytes: Response body.
+        """
+        return self._response.content
+
+    @property
+    def text(self) -> str:
+        """The response body as text.
+
+        Returns:
+            str: Response body.
+        """
+        return self._response.text
+
+    def json(self, **kwargs: Any) -> Any:
+        """Decodes the JSON response body.
+
+        Args:
+            **kwargs (Any): Keyword arguments passed to ``json.loads``.
+
+        Returns:
+            Any: Decoded JSON.
+        """
+        return self._response.json(**kwargs)
+
+
+class HTTPXTransport(Transport):
+    """Transport multiplexing concurrent requests over HTTP/2 with ``httpx``.
+
+    Requires the optional ``httpx`` package with HTTP/2 support.
+
+    Examples:
+        >>> from censys.common.transport import HTTPXTransport
+        >>> from censys.search import CensysHosts
+        >>> h = CensysHosts(transport=HTTPXTransport())
+        >>> h.bulk_view(["1.1.1.1", "8.8.8.8"])
+    """
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        http2: bool = True,
+        max_connections: int = 10,
+    ):
+        """Inits HTTPXTransport.
+
+        Args:
+            session (requests.Session): Optional; Session holding request settings.
+            http2 (bool): Optional; Whether to negotiate HTTP/2. Defaults to True.
+            max_connections (int): Optional; Size of the connection pool.
+
+        Raises:
+            CensysException: If httpx is not installed.
+        """
+        super().__init__(session)
+        try:
+            import httpx
+        except ImportError as error:
+            raise CensysException(
+                "The HTTPX transport requires httpx. "
+                "Install it with: pip install 'httpx[http2]'"
+            ) from error
+        self._httpx = httpx
+        self.http2 = http2
+        self.max_connections = max_connections
+        self._client: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> Any:
+        """The httpx client, created on first use from the session settings.
+
+        Returns:
+            httpx.Client: The httpx client.
+        """
+        with self._lock:
+            if self._client is None:
+                client_kwargs = {
+                    "http2": self.http2,
+                    "verify": self.session.verify,
+                    "cert": self.session.cert,
+                    "cookies": self.session.cookies,
+                    "limits": self._httpx.Limits(max_connections=self.max_connections),
+                }
+                proxy = self.session.proxies.get("https")
+                if proxy:
+                    client_kwargs["proxy"] = proxy
+                self._client = self._httpx.Client(**client_kwargs)
+            return self._client
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        """Sends a request through the httpx client.
+
+        Args:
+            method (str): HTTP method.
+            url (str): The URL to request.
+            **kwargs (Any): Keyword arguments accepted by ``requests.request``.
+
+        Returns:
+            Response: HTTP response.
+        """
+        headers = {**self.session.headers, **(kwargs.pop("headers", None) or {})}
+        params = kwargs.pop("params", None) or {}
+        response = self.client.request(
+            method,
+            url,
+            params={key: value for key, value in params.items() if value is not None},
+            headers={key: value for key, value in headers.items() if value is not None},
+            auth=self.session.auth,
+            **kwargs,
+        )
+        # The adapter provides the parts of requests.Response used by clients
+        return cast(Response, HTTPXResponse(response))
+
+    def close(self):
+        """Closes open connections."""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+        super().close()
+
+
+def request_key(method: str, url: str, **kwargs: Any) -> str:
+    """Identifies a request by its method, URL, parameters and body.
+
+    Headers, credentials and timeouts are not part of the key, so a
+    recording can be replayed with other credentials.
+
+    Args:
+        method (str): HTTP method.
+        url (str): The URL to request.
+        **kwargs (Any): Keyword arguments accepted by ``requests.request``.
+
+    Returns:
+        str: SHA-256 hex digest of the request.
+    """
+    params = kwargs.get("params") or {}
+    query = urlencode(
+        sorted((k, v) for k, v in params.items() if v is not None), doseq=True
+    )
+    body = kwargs.get("json")
+    if body is None and kwargs.get("data") is not None:
+        data = kwargs["data"]
+        body = data.decode() if isinstance(data, bytes) else data
+    canonical = json.dumps(
+        [method.upper(), url, query, body], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class Cassette:
+    """Directory of recorded requests and responses.
+
+    Each request is stored in ``requests/<key>.json.gz`` with the list of
+    responses it received in order. Response bodies are stored once in
+    ``bodies/<sha256>.gz``, so identical payloads share a file. The
+    cassette is thread-safe.
+    """
+
+    def __init__(self, path: str):
+        """Inits Cassette.
+
+        Args:
+            path (str): The cassette directory. It is created when recording.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Dict[str, dict] = {}
+        self._recorded: Dict[str, dict] = {}
+
+    def _request_path(self, key: str) -> str:
+        return os.path.join(self.path, "requests", f"{key}.json.gz")
+
+    def _body_path(self, digest: str) -> str:
+        return os.path.join(self.path, "bodies", f"{digest}.gz")
+
+    def _write(self, path: str, data: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first, so readers never see partial files
+        temporary_path = f"{path}.{threading.get_ident()}.tmp"
+        with gzip.open(temporary_path, "wb") as file:
+            file.write(data)
+        os.replace(temporary_path, path)
+
+    def entry(self, key: str) -> Optional[dict]:
+        """Reads the recorded request with a key.
+
+        Args:
+            key (str): The request key.
+
+        Returns:
+            Optional[dict]: The request and its responses, or None if it was not recorded.
+        """
+        with self._lock:
+            if key not in self._entries:
+                try:
+                    with gzip.open(self._request_path(key), "rb") as file:
+                        self._entries[key] = json.loads(file.read())
+                except FileNotFoundError:
+                    return None
+            return self._entries[key]
+
+    def body(self, digest: str) -> bytes:
+        """Reads a recorded response body.
+
+        Args:
+            digest (str): SHA-256 hex digest of the body.
+
+        Returns:
+            bytes: The body.
+        """
+        with gzip.open(self._body_path(digest), "rb") as file:
+            return file.read()
+
+    def record(self, method: str, url: str, res: Response, **kwargs: Any):
+        """Appends a response to the recorded request.
+
+        A request recorded by an earlier session is replaced on its first
+        response in this session.
+
+        Args:
+            method (str): HTTP method.
+            url (str): The requested URL.
+            res (Response): HTTP response.
+            **kwargs (Any): Keyword arguments the request was sent with.
+        """
+        key = request_key(method, url, **kwargs)
+        content = res.content or b""
+        digest = hashlib.sha256(content).hexdigest()
+        if not os.path.exists(self._body_path(digest)):
+            self._write(self._body_path(digest), content)
+        elapsed = getattr(res, "elapsed", None)
+        response = {
+            "status_code": res.status_code,
+            "reason": res.reason,
+            "headers": {
+                name: value
+                for name, value in res.headers.items()
+                # The stored body is already decoded
+                if name.lower() not in ("content-encoding", "content-length")
+            },
+            "body": digest,
+            "elapsed": elapsed.total_seconds() if elapsed is not None else 0.0,
+        }
+        with self._lock:
+            entry = self._recorded.setdefault(
+                key,
+                {
+                    "method": method.upper(),
+                    "url": url,
+                    "params": kwargs.get("params") or {},
+                    "json": kwargs.get("json"),
+                    "responses": [],
+                },
+            )
+            entry["responses"].append(response)
+            self._write(self._request_path(key), json.dumps(entry).encode())
+
+
+class RecordingTransport(Transport):
+    """Transport recording every request and response to a cassette.
+
+    Requests are sent with another transport, and the settings of its
+    session are used. Recordings are replayed with ``ReplayTransport``.
+
+    Examples:
+        >>> from censys.common.transport import RecordingTransport
+        >>> from censys.search import CensysHosts
+        >>> h = CensysHosts(transport=RecordingTransport("cassettes/bulk-view"))
+        >>> h.bulk_view(["1.1.1.1", "8.8.8.8"])
+    """
+
+    def __init__(self, path: str, transport: Optional[Transport] = None):
+        """Inits RecordingTransport.
+
+        Args:
+            path (str): The cassette directory.
+            transport (Transport): Optional; Transport sending the requests. Defaults to requests.
+        """
+        self.transport = transport or RequestsTransport()
+        super().__init__(self.transport.session)
+        self.cassette = Cassette(path)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        """Sends a request and records its response.
+
+        Args:
+            method (str): HTTP method.
+            url (str): The URL to request.
+            **kwargs (Any): Keyword arguments accepted by ``requests.request``.
+
+        Returns:
+            Response: HTTP response.
+        """
+        res = self.transport.request(method, url, **kwargs)
+        self.cassette.record(method, url, res, **kwargs)
+        return res
+
+    def close(self):
+        """Closes open connections."""
+        self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """Transport answering requests from a cassette without sending them.
+
+    The responses recorded for a request are returned in order, and the
+    last one is repeated once they are used up. By default responses are
+    returned immediately. ``latency`` replays the recorded response times,
+    scaled by its value, to load test a workflow against the timing of
+    real traffic.
+
+    Examples:
+        >>> from censys.common.transport import ReplayTransport
+        >>> from censys.search import CensysHosts
+        >>> h = CensysHosts(transport=ReplayTransport("cassettes/bulk-view"))
+        >>> h.bulk_view(["1.1.1.1", "8.8.8.8"])
+    """
+
+    def __init__(
+        self,
+        path: str,
+        latency: Optional[float] = None,
+        session: Optional[requests.Session] = None,
+    ):
+        """Inits ReplayTransport.
+
+        Args:
+            path (str): The cassette directory.
+            latency (float): Optional; Factor applied to the recorded response times, such as 1.0 for the recorded timing. Defaults to no delay.
+            session (requests.Session): Optional; Session holding request settings.
+
+        Raises:
+            CensysException: If the cassette directory does not exist.
+        """
+        if not os.path.isdir(path):
+            raise CensysException(f"Cassette {path} does not exist.")
+        super().__init__(session)
+        self.cassette = Cassette(path)
+        self.latency = latency
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.replayed = 0
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        """Returns the recorded response to a request.
+
+        Args:
+            method (str): HTTP method.
+            url (str): The URL to request.
+            **kwargs (Any): Keyword arguments accepted by ``requests.request``.
+
+        Raises:
+            CensysException: If the request was not recorded.
+
+        Returns:
+            Response: The recorded HTTP response.
+        """
+        key = request_key(method, url, **kwargs)
+        entry = self.cassette.entry(key)
+        if entry is None:
+            raise CensysException(f"No recorded response for {method.upper()} {url}.")
+        responses: List[dict] = entry["responses"]
+        with self._lock:
+            index = self._counts.get(key, 0)
+            self._counts[key] = index + 1
+            self.replayed += 1
+        recorded = responses[min(index, len(responses) - 1)]
+
+        if self.latency:
+            time.sleep(recorded["elapsed"] * self.latency)
+
+        res = Response()
+        res.status_code = recorded["status_code"]
+        res.reason = recorded["reason"]
+        res.headers = CaseInsensitiveDict(recorded["headers"])
+        res._content = self.cassette.body(recorded["body"])
+        res.url = url
+        res.elapsed = datetime.timedelta(seconds=recorded["elapsed"])
+        return res
+
+    def reset(self):
+        """Replays every request from its first response again."""
+        with self._lock:
+            self._counts.clear()
+            self.replayed = 0
@@ -1,9 +1,13 @@
 """Common utilities for the Censys Python SDK."""
 
 import datetime
+import re
+from typing import List, Tuple
 
 from .types import Datetime
 
+FRACTION_REGEX = re.compile(r"(\.\d{6})\d+")
+
 
 def format_rfc3339(time: Datetime) -> str:
     """Formats a datetime object into an RFC3339 string.
@@ -31,3 +35,53 @@ def format_iso8601(time: Datetime) -> str:
     if isinstance(time, (datetime.date, datetime.datetime)):
         return time.strftime("%Y-%m-%d")
     return time
+
+
+def parse_datetime(time: Datetime) -> datetime.datetime:
+    """Parses a date, datetime or RFC3339 string into a naive UTC datetime.
+
+    Args:
+        time (Datetime): Value to parse.
+
+    Returns:
+        datetime.datetime: Naive datetime in UTC.
+    """
+    if isinstance(time, datetime.datetime):
+        parsed = time
+    elif isinstance(time, datetime.date):
+        parsed = datetime.datetime.combine(time, datetime.time())
+    else:
+        # fromisoformat accepts neither "Z" nor more than 6 fractional digits
+        parsed = datetime.datetime.fromisoformat(
+            FRACTION_REGEX.sub(r"\1", time.replace("Z", "+00:00"))
+        )
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def split_time_range(
+    start: Datetime, end: Datetime, windows: int
+) -> List[Tuple[datetime.datetime, datetime.datetime]]:
+    """Splits a time range into consecutive windows of equal length.
+
+    Args:
+        start (Datetime): Start of the range.
+        end (Datetime): End of the range.
+        windows (int): Number of windows.
+
+    Raises:
+        ValueError: If windows is smaller than 1 or the range is empty.
+
+    Returns:
+        List[Tuple[datetime.datetime, datetime.datetime]]: Start and end of each window.
+    """
+    if windows < 1:
+        raise ValueError("Number of windows must be at least 1.")
+    first = parse_datetime(start)
+    last = parse_datetime(end)
+    if last <= first:
+        raise ValueError("End time must be after start time.")
+    step = (last - first) / windows
+    bounds = [first + step * index for index in range(windows)] + [last]
+    return list(zip(bounds, bounds[1:]))
@@ -2,7 +2,7 @@
 
 from .client import SearchClient
 from .v1 import CensysData
-from .v2 import CensysCerts, CensysHosts
+from .v2 import CensysCerts, CensysHosts, CertificateJoin, HostTimeline
 
 __copyright__ = "Copyright 2024 Censys, Inc."
 __all__ = [
@@ -10,4 +10,6 @@ __all__ = [
     "CensysData",
     "CensysCerts",
     "CensysHosts",
+    "CertificateJoin",
+    "HostTimeline",
 ]
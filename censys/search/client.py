@@ -1,5 +1,11 @@
 """Interact with all Search APIs."""
 
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from requests.adapters import HTTPAdapter
+
+from ..common.transport import RequestsTransport, Transport
 from .v1 import CensysData
 from .v2 import CensysCerts, CensysHosts
 
@@ -9,6 +15,13 @@ class SearchClient:
 
     All indexes are passed the args and kwargs that are provided.
 
+    The indexes share one connection pool, so they reuse the same
+    connections, and one executor running the concurrent calls of methods
+    such as ``bulk_view`` and ``view_all``, so repeated calls reuse warm
+    threads. Each index keeps its own session, so settings such as its
+    ``request_id`` do not apply to the other indexes. Call ``close`` or use
+    the client as a context manager to release them.
+
     Examples:
         Inits SearchClient.
 
@@ -20,6 +33,11 @@ class SearchClient:
         >>> data = c.v1.data # CensysData()
         >>> hosts = c.v2.hosts # CensysHosts()
         >>> certs = c.v2.certs # CensysCerts()
+
+        Share 50 threads and connections between all indexes.
+
+        >>> with SearchClient(max_workers=50) as c:
+        ...     c.v2.hosts.bulk_view(["1.1.1.1", "8.8.8.8"])
     """
 
     class _V1:
@@ -27,14 +45,20 @@ class SearchClient:
 
         data: CensysData
 
-        def __init__(self, *args, **kwargs):
+        def __init__(
+            self,
+            *args,
+            transport: Callable[[], Optional[Transport]] = lambda: None,
+            **kwargs,
+        ):
             """Inits V1.
 
             Args:
                 *args: Variable length argument list.
+                transport (Callable[[], Optional[Transport]]): Optional; Returns the transport of each index.
                 **kwargs: Arbitrary keyword arguments.
             """
-            self.data = CensysData(*args, **kwargs)
+            self.data = CensysData(*args, transport=transport(), **kwargs)
 
     class _V2:
         """Class for v2 Search APIs."""
@@ -43,22 +67,38 @@ class SearchClient:
         certs: CensysCerts
         certificates: CensysCerts
 
-        def __init__(self, *args, **kwargs):
+        def __init__(
+            self,
+            *args,
+            transport: Callable[[], Optional[Transport]] = lambda: None,
+            **kwargs,
+        ):
             """Inits V2.
 
             Args:
                 *args: Variable length argument list.
+                transport (Callable[[], Optional[Transport]]): Optional; Returns the transport of each index.
                 **kwargs: Arbitrary keyword arguments.
             """
-            self.hosts = CensysHosts(*args, **kwargs)
-            self.certs = CensysCerts(*args, **kwargs)
+            self.hosts = CensysHosts(*args, transport=transport(), **kwargs)
+            self.certs = CensysCerts(*args, transport=transport(), **kwargs)
             self.certificates = self.certs
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        max_workers: int = 20,
+        transport: Optional[Transport] = None,
+        executor: Optional[Executor] = None,
+        **kwargs,
+    ):
         """Inits SearchClient.
 
         Args:
             *args: Variable length argument list.
+            max_workers (int): Optional; Threads of the shared executor and connections of the shared connection pool. Defaults to 20.
+            transport (Transport): Optional; Transport shared by all indexes, including its session. Defaults to a ``RequestsTransport`` per index owned by the client.
+            executor (Executor): Optional; Executor shared by all indexes. Defaults to a thread pool owned by the client.
             **kwargs: Arbitrary keyword arguments.
         """
         # Backwards compatibility
@@ -66,5 +106,50 @@ class SearchClient:
             kwargs["api_id"] = args[0]
             kwargs["api_secret"] = args[1]
 
+        self._owns_executor = executor is None
+        self.transport = transport
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers, thread_name_prefix="censys"
+        )
+        self.hedger = kwargs.get("hedger")
+        self._adapter = HTTPAdapter(
+            pool_connections=max_workers, pool_maxsize=max_workers
+        )
+        self._transports: List[Transport] = []
+        kwargs.update(transport=self._index_transport, executor=self.executor)
+
         self.v1 = self._V1(**kwargs)
         self.v2 = self._V2(**kwargs)
+
+    def _index_transport(self) -> Transport:
+        if self.transport is not None:
+            return self.transport
+        # A session per index, sending requests over the shared connections
+        transport = RequestsTransport(adapter=self._adapter)
+        self._transports.append(transport)
+        return transport
+
+    def close(self):
+        """Shuts down the executor, hedger and connections owned by the client.
+
+        A transport or executor passed to the client is left open. A hedger
+        is closed, since it sends requests of the client.
+        """
+        if self.hedger is not None:
+            self.hedger.close()
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
+        for transport in self._transports:
+            transport.close()
+
+    def __enter__(self) -> "SearchClient":
+        """Enters the client context.
+
+        Returns:
+            SearchClient: The client.
+        """
+        return self
+
+    def __exit__(self, *_):
+        """Closes the client when leaving its context."""
+        self.close()
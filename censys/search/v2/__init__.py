@@ -1,6 +1,8 @@
 """Interact with the Censys Search v2 APIs."""
 
 from .certs import CensysCerts
+from .enrichment import CertificateJoin
 from .hosts import CensysHosts
+from .timeline import HostTimeline
 
-__all__ = ["CensysCerts", "CensysHosts"]
+__all__ = ["CensysCerts", "CensysHosts", "CertificateJoin", "HostTimeline"]
@@ -1,21 +1,47 @@
 """Base for interacting with the Censys Search API."""
 
+import datetime
 import os
 import warnings
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from requests.models import Response
 
 from censys.common.base import CensysAPIBase
+from censys.common.concurrency import RateLimiter, bounded_map
 from censys.common.config import DEFAULT, get_config
+from censys.common.documents import LazyDocument, project_document
 from censys.common.exceptions import (
     CensysException,
     CensysExceptionMapper,
+    CensysRateLimitExceededException,
     CensysSearchException,
+    CensysTooManyRequestsException,
 )
+from censys.common.types import Datetime
+from censys.common.utils import split_time_range
 
 INDEX_TO_KEY = {"hosts": "ip", "certificates": "fingerprint_sha256"}
+TAGGED_DOCUMENTS = {
+    "hosts": ("hosts", "hosts", "ip"),
+    "certificates": ("certificates", "certs", "fingerprint"),
+}
+"""Endpoint, result keyword and ID field of the documents carrying a tag."""
+
+TimeWindow = Tuple[Optional[Any], Optional[Any]]
 
 
 class CensysSearchAPIv2(CensysAPIBase):
@@ -198,6 +224,36 @@ class CensysSearchAPIv2(CensysAPIBase):
             """
             return self
 
+        def lazy_documents(self) -> Iterator[LazyDocument]:
+            """Iterates over the hits of the remaining pages as compact documents.
+
+            Each page is decoded once and its hits are converted to
+            ``LazyDocument`` objects, which use a fraction of the memory of
+            nested dictionaries when many results are kept.
+
+            Yields:
+                LazyDocument: One search hit.
+            """
+            for hits in self:
+                for hit in hits:
+                    yield LazyDocument.from_dict(hit)
+
+        def document_ids(self) -> Iterator[str]:
+            """Iterates over the document IDs of the hits of the remaining pages.
+
+            Virtual hosts are identified as ``ip+name``.
+
+            Yields:
+                str: One document ID.
+            """
+            document_key = INDEX_TO_KEY.get(self.api.INDEX_NAME, "ip")
+            while self.page <= self.pages:
+                for hit in self.__call__():
+                    hit_key = hit[document_key]
+                    if "name" in hit and self.api.INDEX_NAME == "hosts":
+                        hit_key += "+" + hit["name"]
+                    yield hit_key
+
         def view_all(self, max_workers: int = 20) -> Dict[str, dict]:
             """View each document returned from query.
 
@@ -211,23 +267,16 @@ class CensysSearchAPIv2(CensysAPIBase):
             """
             results = {}
 
-            document_key = INDEX_TO_KEY.get(self.api.INDEX_NAME, "ip")
-
-            with ThreadPoolExecutor(max_workers) as executor:
-                threads = {}
-                while self.page <= self.pages:
-                    for hit in self.__call__():
-                        hit_key = hit[document_key]
-                        if "name" in hit and self.api.INDEX_NAME == "hosts":
-                            hit_key += "+" + hit["name"]
-                        threads[executor.submit(self.api.view, hit_key)] = hit_key
-
-                for task in as_completed(threads):
-                    document_id = threads[task]
-                    try:
-                        results[document_id] = task.result()
-                    except Exception as e:
-                        results[document_id] = {"error": str(e)}
+            for document_id, task in bounded_map(
+                self.api.view,
+                self.document_ids(),
+                max_workers,
+                executor=self.api.executor,
+            ):
+                try:
+                    results[document_id] = task.result()
+                except Exception as e:
+                    results[document_id] = {"error": str(e)}
 
             return results
 
@@ -426,7 +475,9 @@ class CensysSearchAPIv2(CensysAPIBase):
             **kwargs,
         )
 
-    def view(self, document_id: str, **kwargs: Any) -> dict:
+    def view(
+        self, document_id: str, *, fields: Optional[List[str]] = None, **kwargs: Any
+    ) -> dict:
         """View document from current index.
 
         View the current structured data we have on a specific document.
@@ -434,17 +485,37 @@ class CensysSearchAPIv2(CensysAPIBase):
 
         Args:
             document_id (str): The ID of the document you are requesting.
+            fields (List[str]): Optional; The fields to be returned. Other fields are dropped as soon as the response is decoded. Defaults to all fields.
             **kwargs (Any): Optional; Additional arguments to be passed to the query.
 
         Returns:
             dict: The result set returned.
         """
-        return self._get(self.view_path + document_id, args=kwargs)["result"]
+        result = self._get(self.view_path + document_id, args=kwargs)["result"]
+        if fields:
+            return project_document(result, fields)
+        return result
+
+    def view_lazy(self, document_id: str, **kwargs: Any) -> LazyDocument:
+        """View document from current index as a compact document.
+
+        Accepts the same arguments as ``view``.
+
+        Args:
+            document_id (str): The ID of the document you are requesting.
+            **kwargs (Any): Optional; Additional arguments passed to ``view``.
+
+        Returns:
+            LazyDocument: The result set returned.
+        """
+        return LazyDocument.from_dict(self.view(document_id, **kwargs))
 
     def bulk_view(
         self,
         document_ids: List[str],
         max_workers: int = 20,
+        *,
+        fields: Optional[List[str]] = None,
         **kwargs: Any,
     ) -> Dict[str, dict]:
         """Bulk view documents from current index.
@@ -455,27 +526,101 @@ class CensysSearchAPIv2(CensysAPIBase):
         Args:
             document_ids (List[str]): The IDs of the documents you are requesting.
             max_workers (int): The number of workers to use. Defaults to 20.
+            fields (List[str]): Optional; The fields to be returned. Defaults to all fields.
             **kwargs (Any): Optional; Additional arguments to be passed to the query.
 
         Returns:
             Dict[str, dict]: Dictionary mapping document IDs to that document's result set.
         """
         documents = {}
-        with ThreadPoolExecutor(max_workers) as executor:
-            threads = {
-                executor.submit(self.view, document_id, **kwargs): document_id
-                for document_id in document_ids
-            }
-
-            for task in as_completed(threads):
-                document_id = threads[task]
-                try:
-                    documents[document_id] = task.result()
-                except Exception as e:
-                    documents[document_id] = {"error": str(e)}
+        for document_id, task in bounded_map(
+            lambda document_id: self.view(document_id, fields=fields, **kwargs),
+            document_ids,
+            max_workers,
+            executor=self.executor,
+        ):
+            try:
+                documents[document_id] = task.result()
+            except Exception as e:
+                documents[document_id] = {"error": str(e)}
 
         return documents
 
+    @staticmethod
+    def _time_windows(
+        start_time: Optional[Datetime],
+        end_time: Optional[Datetime],
+        windows: int,
+        reverse: bool = False,
+    ) -> List[TimeWindow]:
+        """Splits a time range into windows fetched in parallel.
+
+        Args:
+            start_time (Datetime): Optional; Start of the range.
+            end_time (Datetime): Optional; End of the range. Defaults to now when splitting.
+            windows (int): Number of windows.
+            reverse (bool): Optional; Whether to order the windows from the latest.
+
+        Raises:
+            ValueError: If the range is split without a start time.
+
+        Returns:
+            List[TimeWindow]: Start and end time of each window.
+        """
+        if windows <= 1:
+            return [(start_time, end_time)]
+        if start_time is None:
+            raise ValueError("A start time is required to split the time range.")
+        split: List[TimeWindow] = list(
+            split_time_range(
+                start_time, end_time or datetime.datetime.utcnow(), windows
+            )
+        )
+        return split[::-1] if reverse else split
+
+    def _fetch_windows(
+        self,
+        fetch: Callable[[str, Any, Any], Iterator[dict]],
+        keys: Iterable[str],
+        windows: Sequence[TimeWindow],
+        max_workers: int,
+    ) -> Iterator[Tuple[str, Union[List[dict], Exception]]]:
+        """Fetches every time window of every key in a bounded pool.
+
+        Args:
+            fetch (Callable[[str, Any, Any], Iterator[dict]]): Function iterating over the items of a key between a start and an end time.
+            keys (Iterable[str]): Document IDs.
+            windows (Sequence[TimeWindow]): Start and end time of each window, in the order to merge them.
+            max_workers (int): The number of workers to use.
+
+        Yields:
+            Tuple[str, Union[List[dict], Exception]]: Each key with the items of all its windows in order, or its first error, as soon as all its windows are done.
+        """
+        pending: Dict[str, List[Optional[List[dict]]]] = {}
+        errors: Dict[str, Exception] = {}
+
+        def fetch_window(task: Tuple[str, int]) -> List[dict]:
+            key, index = task
+            return list(fetch(key, *windows[index]))
+
+        tasks = ((key, index) for key in keys for index in range(len(windows)))
+        for (key, index), future in bounded_map(
+            fetch_window, tasks, max_workers, executor=self.executor
+        ):
+            results = pending.setdefault(key, [None] * len(windows))
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                errors.setdefault(key, e)
+                results[index] = []
+            if any(result is None for result in results):
+                continue
+            del pending[key]
+            if key in errors:
+                yield key, errors.pop(key)
+            else:
+                yield key, [item for result in results for item in result or []]
+
     def aggregate(
         self, query: str, field: str, num_buckets: int = 50, **kwargs: Any
     ) -> dict:
@@ -675,3 +820,187 @@ class CensysSearchAPIv2(CensysAPIBase):
             tag_id (str): The ID of the tag.
         """
         self._delete(self.view_path + document_id + "/tags/" + tag_id)
+
+    # Bulk tags and comments
+
+    def _tagged_document_ids(self, tag_id: str) -> Set[str]:
+        """Lists the IDs of the documents of this index carrying a tag.
+
+        Args:
+            tag_id (str): The ID of the tag.
+
+        Returns:
+            Set[str]: Document IDs.
+        """
+        endpoint, keyword, key = TAGGED_DOCUMENTS[self.INDEX_NAME]
+        return {
+            document[key]
+            for document in self._list_documents_with_tag(tag_id, endpoint, keyword)
+        }
+
+    def _bulk_documents(
+        self,
+        func: Callable[[str], dict],
+        documents: Union[Iterable[str], "CensysSearchAPIv2.Query"],
+        max_workers: int = 10,
+        rate_limit: Optional[float] = None,
+        skip: Optional[Callable[[str], bool]] = None,
+    ) -> Iterator[Tuple[str, dict]]:
+        """Calls a function on many documents in a bounded, rate-aware pool.
+
+        Failed requests are retried by the client, within its ``max_retries``
+        and retry budget. Skipped documents are decided before the rate
+        limiter is consulted, so they use no request tokens.
+
+        Args:
+            func (Callable[[str], dict]): Function called with each document ID.
+            documents (Union[Iterable[str], Query]): Document IDs, or a query whose hits are used.
+            max_workers (int): Optional; The number of workers to use. Defaults to 10.
+            rate_limit (float): Optional; Maximum number of requests per second. Halved when the API rate limit is exceeded.
+            skip (Callable[[str], bool]): Optional; Whether a document ID is reported as skipped without a request.
+
+        Yields:
+            Tuple[str, dict]: Each document ID and its outcome, or ``{"error": ...}`` if it failed.
+        """
+        if isinstance(documents, CensysSearchAPIv2.Query):
+            documents = documents.document_ids()
+        limiter = RateLimiter(rate_limit) if rate_limit else None
+
+        def call(document_id: str) -> dict:
+            if skip is not None and skip(document_id):
+                return {"status": "skipped"}
+            if limiter is None:
+                return func(document_id)
+            limiter.acquire()
+            try:
+                result = func(document_id)
+            except (CensysRateLimitExceededException, CensysTooManyRequestsException):
+                limiter.slow_down()
+                raise
+            limiter.speed_up()
+            return result
+
+        for document_id, task in bounded_map(
+            call, documents, max_workers, executor=self.executor
+        ):
+            try:
+                yield document_id, task.result()
+            except Exception as e:
+                yield document_id, {"error": str(e)}
+
+    def bulk_add_tag(
+        self,
+        documents: Union[Iterable[str], "CensysSearchAPIv2.Query"],
+        tag_id: str,
+        max_workers: int = 10,
+        rate_limit: Optional[float] = None,
+        skip_tagged: bool = True,
+    ) -> Iterator[Tuple[str, dict]]:
+        """Adds a tag to many documents.
+
+        Documents already carrying the tag are listed once up front and
+        skipped, so re-running an interrupted job only tags the rest.
+
+        Args:
+            documents (Union[Iterable[str], Query]): Document IDs, or a query whose hits are tagged.
+            tag_id (str): The ID of the tag.
+            max_workers (int): Optional; The number of workers to use. Defaults to 10.
+            rate_limit (float): Optional; Maximum number of requests per second.
+            skip_tagged (bool): Optional; Whether to skip documents already carrying the tag. Defaults to True.
+
+        Yields:
+            Tuple[str, dict]: Each document ID and ``{"status": "tagged"}``, ``{"status": "skipped"}`` or ``{"error": ...}``.
+        """
+        tagged = self._tagged_document_ids(tag_id) if skip_tagged else set()
+
+        def add_tag(document_id: str) -> dict:
+            self.add_tag_to_document(document_id, tag_id)
+            return {"status": "tagged"}
+
+        yield from self._bulk_documents(
+            add_tag, documents, max_workers, rate_limit, tagged.__contains__
+        )
+
+    def bulk_remove_tag(
+        self,
+        documents: Union[Iterable[str], "CensysSearchAPIv2.Query"],
+        tag_id: str,
+        max_workers: int = 10,
+        rate_limit: Optional[float] = None,
+        skip_untagged: bool = True,
+    ) -> Iterator[Tuple[str, dict]]:
+        """Removes a tag from many documents.
+
+        Documents carrying the tag are listed once up front, and the others
+        are skipped.
+
+        Args:
+            documents (Union[Iterable[str], Query]): Document IDs, or a query whose hits are untagged.
+            tag_id (str): The ID of the tag.
+            max_workers (int): Optional; The number of workers to use. Defaults to 10.
+            rate_limit (float): Optional; Maximum number of requests per second.
+            skip_untagged (bool): Optional; Whether to skip documents not carrying the tag. Defaults to True.
+
+        Yields:
+            Tuple[str, dict]: Each document ID and ``{"status": "untagged"}``, ``{"status": "skipped"}`` or ``{"error": ...}``.
+        """
+        tagged = self._tagged_document_ids(tag_id) if skip_untagged else None
+
+        def untagged(document_id: str) -> bool:
+            return tagged is not None and document_id not in tagged
+
+        def remove_tag(document_id: str) -> dict:
+            self.remove_tag_from_document(document_id, tag_id)
+            return {"status": "untagged"}
+
+        yield from self._bulk_documents(
+            remove_tag, documents, max_workers, rate_limit, untagged
+        )
+
+    def bulk_add_comment(
+        self,
+        documents: Union[Iterable[str], "CensysSearchAPIv2.Query"],
+        contents: str,
+        max_workers: int = 10,
+        rate_limit: Optional[float] = None,
+    ) -> Iterator[Tuple[str, dict]]:
+        """Adds the same comment to many documents.
+
+        Args:
+            documents (Union[Iterable[str], Query]): Document IDs, or a query whose hits are commented.
+            contents (str): The contents of the comment.
+            max_workers (int): Optional; The number of workers to use. Defaults to 10.
+            rate_limit (float): Optional; Maximum number of requests per second.
+
+        Yields:
+            Tuple[str, dict]: Each document ID and its new comment, or ``{"error": ...}``.
+        """
+        yield from self._bulk_documents(
+            lambda document_id: self.add_comment(document_id, contents),
+            documents,
+            max_workers,
+            rate_limit,
+        )
+
+    def bulk_list_tags_on_documents(
+        self,
+        documents: Union[Iterable[str], "CensysSearchAPIv2.Query"],
+        max_workers: int = 10,
+        rate_limit: Optional[float] = None,
+    ) -> Iterator[Tuple[str, dict]]:
+        """Lists the tags of many documents.
+
+        Args:
+            documents (Union[Iterable[str], Query]): Document IDs, or a query whose hits are listed.
+            max_workers (int): Optional; The number of workers to use. Defaults to 10.
+            rate_limit (float): Optional; Maximum number of requests per second.
+
+        Yields:
+            Tuple[str, dict]: Each document ID and ``{"tags": [...]}``, or ``{"error": ...}``.
+        """
+        yield from self._bulk_documents(
+            lambda document_id: {"tags": self.list_tags_on_document(document_id)},
+            documents,
+            max_workers,
+            rate_limit,
+        )
@@ -1,8 +1,10 @@
 """Interact with the Censys Search Cert API."""
 
 import warnings
-from typing import List, Optional, Union
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
+from ...common.concurrency import follow_cursor
+from ...common.documents import project_document
 from ...common.types import Datetime
 from ...common.utils import format_rfc3339
 from .api import CensysSearchAPIv2
@@ -55,47 +57,63 @@ class CensysCerts(CensysSearchAPIv2):
         super().__init__(api_id=api_id, api_secret=api_secret, **kwargs)
         self.bulk_path = f"/v2/{self.INDEX_NAME}/bulk"
 
-    def view(self, document_id: str, **kwargs) -> dict:
+    def view(
+        self, document_id: str, *, fields: Optional[List[str]] = None, **kwargs
+    ) -> dict:
         """Fetches the certificate record for the specified SHA-256 fingerprint.
 
         Args:
             document_id (str): The SHA-256 fingerprint of the requested certificate.
+            fields (List[str]): Optional; The fields to be returned. Defaults to all fields.
             **kwargs: Arbitrary keyword arguments.
 
         Returns:
             dict: Certificate details.
         """
-        return self._get(self.view_path + document_id, args=kwargs)["result"]
-
-    def bulk_post(self, fingerprints: List[str]) -> List[dict]:
+        result = self._get(self.view_path + document_id, args=kwargs)["result"]
+        if fields:
+            return project_document(result, fields)
+        return result
+
+    def bulk_post(
+        self, fingerprints: List[str], fields: Optional[List[str]] = None
+    ) -> List[dict]:
         """Fetches the certificate records for the specified SHA-256 fingerprints.
 
         Using the POST method allows for a larger number of fingerprints to be queried at once.
 
         Args:
             fingerprints (List[str]): List of certificate SHA256 fingerprints.
+            fields (List[str]): Optional; The fields to be returned. Defaults to all fields.
 
         Returns:
             dict: Certificate details.
         """
         data = {"fingerprints": fingerprints}
-        return self._post(self.bulk_path, data=data)["result"]
+        return self._project_all(
+            self._post(self.bulk_path, data=data)["result"], fields
+        )
 
-    def bulk_get(self, fingerprints: List[str]) -> List[dict]:
+    def bulk_get(
+        self, fingerprints: List[str], fields: Optional[List[str]] = None
+    ) -> List[dict]:
         """Fetches the certificate records for the specified SHA-256 fingerprints.
 
         Using the GET method allows for a smaller number of fingerprints to be queried at once.
 
         Args:
             fingerprints (List[str]): List of certificate SHA256 fingerprints.
+            fields (List[str]): Optional; The fields to be returned. Defaults to all fields.
 
         Returns:
             dict: Certificate details.
         """
         args = {"fingerprints": fingerprints}
-        return self._get(self.bulk_path, args=args)["result"]
+        return self._project_all(self._get(self.bulk_path, args=args)["result"], fields)
 
-    def bulk(self, fingerprints: List[str]) -> List[dict]:
+    def bulk(
+        self, fingerprints: List[str], fields: Optional[List[str]] = None
+    ) -> List[dict]:
         """Fetches the certificate records for the specified SHA-256 fingerprints.
 
         By default, this function uses the POST method, which allows for a larger number of fingerprints to be queried at once.
@@ -103,13 +121,16 @@ class CensysCerts(CensysSearchAPIv2):
 
         Args:
             fingerprints (List[str]): List of certificate SHA256 fingerprints.
+            fields (List[str]): Optional; The fields to be returned. Defaults to all fields.
 
         Returns:
             dict: Certificate details.
         """
-        return self.bulk_post(fingerprints)
+        return self.bulk_post(fingerprints, fields)
 
-    def bulk_view(self, fingerprints: List[str]) -> List[dict]:  # type: ignore[override]
+    def bulk_view(  # type: ignore[override]
+        self, fingerprints: List[str], fields: Optional[List[str]] = None
+    ) -> List[dict]:
         """Fetches the certificate records for the specified SHA-256 fingerprints.
 
         By default, this function uses the POST method, which allows for a larger number of fingerprints to be queried at once.
@@ -117,11 +138,21 @@ class CensysCerts(CensysSearchAPIv2):
 
         Args:
             fingerprints (List[str]): List of certificate SHA256 fingerprints.
+            fields (List[str]): Optional; The fields to be returned. Defaults to all fields.
 
         Returns:
             dict: Certificate details.
         """
-        return self.bulk_post(fingerprints)
+        return self.bulk_post(fingerprints, fields)
+
+    @staticmethod
+    def _project_all(results: List[dict], fields: Optional[List[str]]) -> List[dict]:
+        if not fields:
+            return results
+        # Replace each document in place so unneeded fields can be freed early
+        for index, result in enumerate(results):
+            results[index] = project_document(result, fields)
+        return results
 
     def search_post_raw(
         self,
@@ -355,3 +386,102 @@ class CensysCerts(CensysSearchAPIv2):
         if end_time:
             args["end_time"] = format_rfc3339(end_time)
         return self._get(self.view_path + fingerprint + "/observations", args)["result"]
+
+    def _iter_observations(
+        self,
+        fingerprint: str,
+        per_page: int,
+        start_time: Optional[Datetime],
+        end_time: Optional[Datetime],
+        prefetch: bool,
+    ) -> Iterator[dict]:
+        def fetch_page(cursor: Optional[str]) -> Tuple[List[dict], Optional[str]]:
+            res = self.get_observations(
+                fingerprint, per_page, start_time, end_time, cursor
+            )
+            return res.get("observations", []), res.get("links", {}).get("next")
+
+        return follow_cursor(fetch_page, prefetch=prefetch)
+
+    def iter_observations(
+        self,
+        fingerprint: str,
+        per_page: int = 50,
+        start_time: Optional[Datetime] = None,
+        end_time: Optional[Datetime] = None,
+        windows: int = 1,
+        max_workers: int = 4,
+        prefetch: bool = True,
+    ) -> Iterator[dict]:
+        """Iterates over all observations of a certificate, following cursors.
+
+        With more than one window, the time range is split into equal
+        windows that are fetched in parallel and merged back in order.
+
+        Args:
+            fingerprint (str): The SHA-256 fingerprint of the requested certificate.
+            per_page (int): Optional; The number of results to return per page. Defaults to 50.
+            start_time (Datetime): Optional; The start time of the observations. Required with windows.
+            end_time (Datetime): Optional; The end time of the observations. Defaults to now with windows.
+            windows (int): Optional; Number of time windows fetched in parallel. Defaults to 1.
+            max_workers (int): Optional; The number of workers to use with windows. Defaults to 4.
+            prefetch (bool): Optional; Whether to request the next page in advance. Defaults to True.
+
+        Yields:
+            dict: Each observation.
+        """
+        if windows <= 1:
+            yield from self._iter_observations(
+                fingerprint, per_page, start_time, end_time, prefetch
+            )
+            return
+        for _, observations in self._fetch_windows(
+            lambda key, start, end: self._iter_observations(
+                key, per_page, start, end, False
+            ),
+            [fingerprint],
+            self._time_windows(start_time, end_time, windows),
+            max_workers,
+        ):
+            if isinstance(observations, Exception):
+                raise observations
+            yield from observations
+
+    def bulk_observations(
+        self,
+        fingerprints: Iterable[str],
+        per_page: int = 50,
+        start_time: Optional[Datetime] = None,
+        end_time: Optional[Datetime] = None,
+        windows: int = 1,
+        max_workers: int = 10,
+    ) -> Iterator[Tuple[str, dict]]:
+        """Iterates over the observations of many certificates in a bounded pool.
+
+        Observations of a certificate are yielded together once all of its
+        pages and windows have been fetched.
+
+        Args:
+            fingerprints (Iterable[str]): The SHA-256 fingerprints of the requested certificates.
+            per_page (int): Optional; The number of results to return per page. Defaults to 50.
+            start_time (Datetime): Optional; The start time of the observations. Required with windows.
+            end_time (Datetime): Optional; The end time of the observations. Defaults to now with windows.
+            windows (int): Optional; Number of time windows fetched in parallel per certificate. Defaults to 1.
+            max_workers (int): Optional; The number of workers to use. Defaults to 10.
+
+        Yields:
+            Tuple[str, dict]: Each fingerprint and one of its observations, or ``{"error": ...}`` if the certificate failed.
+        """
+        for fingerprint, observations in self._fetch_windows(
+            lambda key, start, end: self._iter_observations(
+                key, per_page, start, end, False
+            ),
+            fingerprints,
+            self._time_windows(start_time, end_time, windows),
+            max_workers,
+        ):
+            if isinstance(observations, Exception):
+                yield fingerprint, {"error": str(observations)}
+                continue
+            for observation in observations:
+                yield fingerprint, observation
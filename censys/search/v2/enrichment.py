@@ -0,0 +1,223 @@
+"""Attach certificates to host documents."""
+
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ...common.concurrency import worker_pool
+from .certs import CensysCerts
+
+CertificateRef = Union[Optional[dict], str, "Future[Dict[str, Optional[dict]]]"]
+
+_QUEUED = "queued"
+"""Placeholder of a fingerprint waiting for its batch to be sent."""
+
+
+class CertificateJoin:
+    """Joins a stream of hosts with the certificates of their services.
+
+    Certificate fingerprints are read from ``services[].certificate``.
+    Fingerprints not fetched yet are collected into batches sent with
+    ``CensysCerts.bulk_post`` in a bounded pool, and fetched certificates are
+    kept in an LRU cache, so every unique certificate is requested once
+    while it stays in the cache. Hosts are yielded in their input order.
+    Bulk requests run on the executor of ``certs`` if it has one.
+
+    Examples:
+        >>> from censys.search import CensysCerts, CensysHosts, CertificateJoin
+        >>> h = CensysHosts()
+        >>> join = CertificateJoin(CensysCerts())
+        >>> query = h.search("services.service_name: HTTP", pages=5)
+        >>> hits = (hit for page in query for hit in page)
+        >>> for host in join.join(hits):
+        ...     for service in host["services"]:
+        ...         print(service.get("certificate_details", {}).get("parsed"))
+    """
+
+    def __init__(
+        self,
+        certs: CensysCerts,
+        batch_size: int = 100,
+        max_workers: int = 4,
+        cache_size: int = 10000,
+        fields: Optional[List[str]] = None,
+    ):
+        """Inits CertificateJoin.
+
+        Args:
+            certs (CensysCerts): Client used to fetch certificates.
+            batch_size (int): Optional; Fingerprints per bulk request. Defaults to 100.
+            max_workers (int): Optional; The number of concurrent bulk requests. Defaults to 4.
+            cache_size (int): Optional; Maximum number of cached certificates. Defaults to 10000.
+            fields (List[str]): Optional; The certificate fields to keep. Defaults to all fields.
+        """
+        self.certs = certs
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.cache_size = cache_size
+        self.fields = fields
+        self.cache: "OrderedDict[str, Optional[dict]]" = OrderedDict()
+        # Bulk requests sent, fingerprints requested and fingerprints reused
+        self.requests = 0
+        self.fetched = 0
+        self.cache_hits = 0
+
+    def _fetch(self, fingerprints: List[str]) -> Dict[str, Optional[dict]]:
+        certificates: Dict[str, Optional[dict]] = dict.fromkeys(fingerprints)
+        fields = self.fields
+        # Results are matched by fingerprint, so it is always requested
+        added = False
+        if fields is not None and "fingerprint_sha256" not in fields:
+            fields = [*fields, "fingerprint_sha256"]
+            added = True
+        for certificate in self.certs.bulk_post(fingerprints, fields):
+            fingerprint = certificate.get("fingerprint_sha256")
+            if fingerprint in certificates:
+                if added:
+                    certificate = {
+                        key: value
+                        for key, value in certificate.items()
+                        if key != "fingerprint_sha256"
+                    }
+                certificates[fingerprint] = certificate
+        return certificates
+
+    def _cache_put(self, certificates: Dict[str, Optional[dict]]):
+        self.cache.update(certificates)
+        for fingerprint in certificates:
+            self.cache.move_to_end(fingerprint)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    @staticmethod
+    def _resolve(fingerprint: str, ref: CertificateRef) -> Optional[dict]:
+        if not isinstance(ref, Future):
+            return ref  # type: ignore[return-value]
+        try:
+            return ref.result()[fingerprint]
+        except Exception as e:
+            return {"error": str(e)}
+
+    @staticmethod
+    def _attach(
+        host: dict, certificates: Dict[str, Optional[dict]], field: str
+    ) -> dict:
+        services = []
+        for service in host.get("services") or []:
+            fingerprint = service.get("certificate")
+            if fingerprint and certificates.get(fingerprint) is not None:
+                service = dict(service, **{field: certificates[fingerprint]})
+            services.append(service)
+        return dict(host, services=services) if "services" in host else host
+
+    def join(
+        self, hosts: Iterable[dict], field: str = "certificate_details"
+    ) -> Iterator[dict]:
+        """Attaches certificates to hosts.
+
+        The hosts are not modified. Each yielded host is a copy whose
+        services with a known certificate carry it under ``field``. A
+        certificate that could not be fetched is attached as ``{"error": ...}``
+        and is not cached.
+
+        Args:
+            hosts (Iterable[dict]): Host documents, such as search hits.
+            field (str): Optional; Service key the certificate is attached to. Defaults to ``certificate_details``.
+
+        Yields:
+            dict: Each host with its certificates.
+        """
+        inflight: Dict[str, "Future[Dict[str, Optional[dict]]]"] = {}
+        batch: List[str] = []
+        pending: Deque[Tuple[dict, Dict[str, CertificateRef]]] = deque()
+        max_pending = self.batch_size * self.max_workers * 2
+
+        with worker_pool(self.max_workers, self.certs.executor) as executor:
+
+            def submit():
+                future = executor.submit(self._fetch, list(batch))
+                self.requests += 1
+                self.fetched += len(batch)
+                for fingerprint in batch:
+                    inflight[fingerprint] = future
+                batch.clear()
+                for _, refs in pending:
+                    for fingerprint, ref in refs.items():
+                        if ref is _QUEUED:
+                            refs[fingerprint] = future
+
+            def collect():
+                done = {f for f in inflight.values() if f.done()}
+                for future in done:
+                    if future.exception() is None:
+                        self._cache_put(future.result())
+                for fingerprint in [f for f, ft in inflight.items() if ft in done]:
+                    del inflight[fingerprint]
+
+            def ready() -> Iterator[dict]:
+                while pending and all(
+                    ref is not _QUEUED and (not isinstance(ref, Future) or ref.done())
+                    for ref in pending[0][1].values()
+                ):
+                    host, refs = pending.popleft()
+                    yield self._attach(
+                        host,
+                        {fp: self._resolve(fp, ref) for fp, ref in refs.items()},
+                        field,
+                    )
+
+            try:
+                for host in hosts:
+                    refs: Dict[str, CertificateRef] = {}
+                    fingerprints = dict.fromkeys(
+                        service["certificate"]
+                        for service in host.get("services") or []
+                        if service.get("certificate")
+                    )
+                    for fingerprint in fingerprints:
+                        if fingerprint in self.cache:
+                            self.cache_hits += 1
+                            self.cache.move_to_end(fingerprint)
+                            refs[fingerprint] = self.cache[fingerprint]
+                        elif fingerprint in inflight:
+                            self.cache_hits += 1
+                            refs[fingerprint] = inflight[fingerprint]
+                        elif fingerprint in batch:
+                            self.cache_hits += 1
+                            refs[fingerprint] = _QUEUED
+                        else:
+                            batch.append(fingerprint)
+                            refs[fingerprint] = _QUEUED
+                    pending.append((host, refs))
+                    # Send partial batches too, so hosts do not wait for long
+                    if len(batch) >= self.batch_size or (
+                        batch and len(pending) >= self.batch_size
+                    ):
+                        submit()
+
+                    collect()
+                    yield from ready()
+                    # Bound the batches in flight and the hosts waiting for them
+                    while inflight and (
+                        len(set(inflight.values())) >= self.max_workers * 2
+                        or len(pending) >= max_pending
+                    ):
+                        wait(set(inflight.values()), return_when=FIRST_COMPLETED)
+                        collect()
+                        yield from ready()
+
+                if batch:
+                    submit()
+                while pending:
+                    wait(
+                        {
+                            ref
+                            for ref in pending[0][1].values()
+                            if isinstance(ref, Future)
+                        }
+                    )
+                    collect()
+                    yield from ready()
+            finally:
+                for future in set(inflight.values()):
+                    future.cancel()
@@ -1,8 +1,9 @@
 """Interact with the Censys Search Host API."""
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from .api import CensysSearchAPIv2
+from censys.common.concurrency import follow_cursor
 from censys.common.types import Datetime
 from censys.common.utils import format_rfc3339
 
@@ -92,6 +93,8 @@ class CensysHosts(CensysSearchAPIv2):
         self,
         document_id: str,
         at_time: Optional[Datetime] = None,
+        *,
+        fields: Optional[List[str]] = None,
         **kwargs: Any,
     ) -> dict:
         """View document from current index.
@@ -103,6 +106,7 @@ class CensysHosts(CensysSearchAPIv2):
             document_id (str): The ID of the document you are requesting.
             at_time ([str, datetime.date, datetime.datetime]):
                 Optional; Fetches a document at a given point in time.
+            fields (List[str]): Optional; The fields to be returned. Defaults to all fields.
             **kwargs (Any): Optional; Additional arguments to be passed to the query.
 
         Returns:
@@ -112,13 +116,15 @@ class CensysHosts(CensysSearchAPIv2):
         if at_time:
             args["at_time"] = format_rfc3339(at_time)
 
-        return super().view(document_id, **args)
+        return super().view(document_id, fields=fields, **args)
 
     def bulk_view(
         self,
         document_ids: List[str],
         max_workers: int = 20,
         at_time: Optional[Datetime] = None,
+        *,
+        fields: Optional[List[str]] = None,
         **kwargs: Any,
     ) -> Dict[str, dict]:
         """Bulk view documents from current index.
@@ -130,6 +136,7 @@ class CensysHosts(CensysSearchAPIv2):
             max_workers (int): Optional; The number of workers to use. Defaults to 20.
             at_time ([str, datetime.date, datetime.datetime]):
                 Optional; Fetches a document at a given point in time.
+            fields (List[str]): Optional; The fields to be returned. Defaults to all fields.
             **kwargs (Any): Optional; Additional arguments to be passed to the query.
 
         Returns:
@@ -137,7 +144,7 @@ class CensysHosts(CensysSearchAPIv2):
         """
         if at_time:
             kwargs["at_time"] = format_rfc3339(at_time)
-        return super().bulk_view(document_ids, max_workers, **kwargs)
+        return super().bulk_view(document_ids, max_workers, fields=fields, **kwargs)
 
     def search(
         self,
@@ -312,6 +319,169 @@ class CensysHosts(CensysSearchAPIv2):
             args["start_time"] = format_rfc3339(start_time)
         return self._get(f"/v2/{self.INDEX_NAME}/{ip}/certificates", args)["result"]
 
+    def _iter_host_events(
+        self,
+        ip: str,
+        start_time: Optional[Datetime],
+        end_time: Optional[Datetime],
+        per_page: Optional[int],
+        reversed: Optional[bool],
+        prefetch: bool,
+    ) -> Iterator[dict]:
+        def fetch_page(cursor: Optional[str]) -> Tuple[List[dict], Optional[str]]:
+            res = self.view_host_events(
+                ip, start_time, end_time, per_page, cursor, reversed
+            )
+            return res.get("events", []), res.get("links", {}).get("next")
+
+        return follow_cursor(fetch_page, prefetch=prefetch)
+
+    def iter_host_events(
+        self,
+        ip: str,
+        start_time: Optional[Datetime] = None,
+        end_time: Optional[Datetime] = None,
+        per_page: Optional[int] = None,
+        reversed: Optional[bool] = None,
+        windows: int = 1,
+        max_workers: int = 4,
+        prefetch: bool = True,
+    ) -> Iterator[dict]:
+        """Iterates over all events of a host, following cursors.
+
+        With more than one window, the time range is split into equal
+        windows that are fetched in parallel and merged back in
+        chronological order (reversed chronological order if ``reversed``).
+
+        Args:
+            ip (str): The IP address of the requested host.
+            start_time (Datetime): Optional; Beginning of the events (inclusive). Required with windows.
+            end_time (Datetime): Optional; End of the events (exclusive). Defaults to now with windows.
+            per_page (int): Optional; The maximum number of events in each response.
+            reversed (bool): Optional; Return events in reversed chronological order.
+            windows (int): Optional; Number of time windows fetched in parallel. Defaults to 1.
+            max_workers (int): Optional; The number of workers to use with windows. Defaults to 4.
+            prefetch (bool): Optional; Whether to request the next page in advance. Defaults to True.
+
+        Yields:
+            dict: Each event.
+        """
+        if windows <= 1:
+            yield from self._iter_host_events(
+                ip, start_time, end_time, per_page, reversed, prefetch
+            )
+            return
+        for _, events in self._fetch_windows(
+            lambda key, start, end: self._iter_host_events(
+                key, start, end, per_page, reversed, False
+            ),
+            [ip],
+            self._time_windows(start_time, end_time, windows, bool(reversed)),
+            max_workers,
+        ):
+            if isinstance(events, Exception):
+                raise events
+            yield from events
+
+    def bulk_host_events(
+        self,
+        ips: Iterable[str],
+        start_time: Optional[Datetime] = None,
+        end_time: Optional[Datetime] = None,
+        per_page: Optional[int] = None,
+        reversed: Optional[bool] = None,
+        windows: int = 1,
+        max_workers: int = 10,
+    ) -> Iterator[Tuple[str, dict]]:
+        """Iterates over the events of many hosts in a bounded pool.
+
+        Events of a host are yielded together, in chronological order
+        (reversed chronological order if ``reversed``), once all of its pages
+        and windows have been fetched.
+
+        Args:
+            ips (Iterable[str]): The IP addresses of the requested hosts.
+            start_time (Datetime): Optional; Beginning of the events (inclusive). Required with windows.
+            end_time (Datetime): Optional; End of the events (exclusive). Defaults to now with windows.
+            per_page (int): Optional; The maximum number of events in each response.
+            reversed (bool): Optional; Return events in reversed chronological order.
+            windows (int): Optional; Number of time windows fetched in parallel per host. Defaults to 1.
+            max_workers (int): Optional; The number of workers to use. Defaults to 10.
+
+        Yields:
+            Tuple[str, dict]: Each IP address and one of its events, or ``{"error": ...}`` if the host failed.
+        """
+        for ip, events in self._fetch_windows(
+            lambda key, start, end: self._iter_host_events(
+                key, start, end, per_page, reversed, False
+            ),
+            ips,
+            self._time_windows(start_time, end_time, windows, bool(reversed)),
+            max_workers,
+        ):
+            if isinstance(events, Exception):
+                yield ip, {"error": str(events)}
+                continue
+            for event in events:
+                yield ip, event
+
+    def iter_host_certificates(
+        self,
+        ip: str,
+        per_page: int = 100,
+        start_time: Optional[Datetime] = None,
+        prefetch: bool = True,
+    ) -> Iterator[dict]:
+        """Iterates over all certificates of a host, following cursors.
+
+        Args:
+            ip (str): The IP address of the requested host.
+            per_page (int): Optional; The number of results to be returned for each page. Defaults to 100.
+            start_time (Datetime): Optional; Beginning of the observations (inclusive).
+            prefetch (bool): Optional; Whether to request the next page in advance. Defaults to True.
+
+        Returns:
+            Iterator[dict]: Each certificate.
+        """
+
+        def fetch_page(cursor: Optional[str]) -> Tuple[List[dict], Optional[str]]:
+            res = self.view_host_certificates(ip, per_page, start_time, cursor)
+            return res.get("certificates", []), res.get("links", {}).get("next")
+
+        return follow_cursor(fetch_page, prefetch=prefetch)
+
+    def bulk_host_certificates(
+        self,
+        ips: Iterable[str],
+        per_page: int = 100,
+        start_time: Optional[Datetime] = None,
+        max_workers: int = 10,
+    ) -> Iterator[Tuple[str, dict]]:
+        """Iterates over the certificates of many hosts in a bounded pool.
+
+        Args:
+            ips (Iterable[str]): The IP addresses of the requested hosts.
+            per_page (int): Optional; The number of results to be returned for each page. Defaults to 100.
+            start_time (Datetime): Optional; Beginning of the observations (inclusive).
+            max_workers (int): Optional; The number of workers to use. Defaults to 10.
+
+        Yields:
+            Tuple[str, dict]: Each IP address and one of its certificates, or ``{"error": ...}`` if the host failed.
+        """
+        for ip, certificates in self._fetch_windows(
+            lambda key, start, _: self.iter_host_certificates(
+                key, per_page, start, prefetch=False
+            ),
+            ips,
+            [(start_time, None)],
+            max_workers,
+        ):
+            if isinstance(certificates, Exception):
+                yield ip, {"error": str(certificates)}
+                continue
+            for certificate in certificates:
+                yield ip, certificate
+
     def list_hosts_with_tag(self, tag_id: str) -> List[str]:
         """Returns a list of hosts which are tagged with the specified tag.
 
@@ -0,0 +1,283 @@
+"""Build the history of a host from point-in-time snapshots."""
+
+import copy
+import datetime
+import hashlib
+import json
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
+
+from ...common.concurrency import bounded_map
+from ...common.exceptions import CensysNotFoundException
+from ...common.types import Datetime
+from ...common.utils import format_rfc3339, parse_datetime
+from .hosts import CensysHosts
+
+VOLATILE_FIELDS = frozenset(
+    ["last_updated_at", "observed_at", "perspective_id", "source_ip"]
+)
+"""Fields that change on every scan and are ignored when comparing snapshots."""
+
+
+def _strip(value: Any, ignore_fields: Iterable[str]) -> Any:
+    ignored = set(ignore_fields)
+    if isinstance(value, dict):
+        return {
+            key: _strip(item, ignored)
+            for key, item in value.items()
+            if key not in ignored
+        }
+    if isinstance(value, list):
+        return [_strip(item, ignored) for item in value]
+    return value
+
+
+def content_hash(
+    host: Optional[dict], ignore_fields: Iterable[str] = VOLATILE_FIELDS
+) -> str:
+    """Hashes the content of a host, ignoring volatile fields.
+
+    Args:
+        host (dict): Optional; Host document, or None if the host did not exist.
+        ignore_fields (Iterable[str]): Optional; Field names ignored at any depth.
+
+    Returns:
+        str: SHA-256 hex digest.
+    """
+    canonical = json.dumps(
+        _strip(host, ignore_fields), sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _flatten(value: Any, prefix: str = "") -> Dict[str, Any]:
+    if not isinstance(value, dict) or not value:
+        return {prefix: value} if prefix else {}
+    flat: Dict[str, Any] = {}
+    for key, item in value.items():
+        flat.update(_flatten(item, f"{prefix}.{key}" if prefix else key))
+    return flat
+
+
+def _diff_fields(a: dict, b: dict) -> Dict[str, Dict[str, Any]]:
+    flat_a = _flatten(a)
+    flat_b = _flatten(b)
+    return {
+        path: {"before": flat_a.get(path), "after": flat_b.get(path)}
+        for path in sorted(set(flat_a) | set(flat_b))
+        if flat_a.get(path) != flat_b.get(path)
+    }
+
+
+def service_key(service: dict) -> Tuple[Any, Any]:
+    """Identifies a service by its port and transport protocol.
+
+    Args:
+        service (dict): Service of a host document.
+
+    Returns:
+        Tuple[Any, Any]: Port and transport protocol.
+    """
+    return service.get("port"), service.get("transport_protocol")
+
+
+def diff_hosts(
+    a: Optional[dict],
+    b: Optional[dict],
+    ignore_fields: Iterable[str] = VOLATILE_FIELDS,
+) -> Dict[str, Any]:
+    """Compares two snapshots of a host locally.
+
+    Services are matched by port and transport protocol. Other fields are
+    compared by their dotted path, and lists are compared as a whole.
+
+    Args:
+        a (dict): Optional; Earlier host document, or None if the host did not exist.
+        b (dict): Optional; Later host document, or None if the host did not exist.
+        ignore_fields (Iterable[str]): Optional; Field names ignored at any depth.
+
+    Returns:
+        Dict[str, Any]: Added, removed and changed services, and changed fields.
+    """
+    a = _strip(a or {}, ignore_fields)
+    b = _strip(b or {}, ignore_fields)
+    services_a = {service_key(s): s for s in a.pop("services", None) or []}
+    services_b = {service_key(s): s for s in b.pop("services", None) or []}
+
+    services_changed = []
+    for key in services_a.keys() & services_b.keys():
+        changes = _diff_fields(services_a[key], services_b[key])
+        if changes:
+            port, transport_protocol = key
+            services_changed.append(
+                {
+                    "port": port,
+                    "transport_protocol": transport_protocol,
+                    "changes": changes,
+                }
+            )
+
+    def by_key(service: dict) -> str:
+        return json.dumps(service_key(service))
+
+    return {
+        "services_added": sorted(
+            (s for k, s in services_b.items() if k not in services_a), key=by_key
+        ),
+        "services_removed": sorted(
+            (s for k, s in services_a.items() if k not in services_b), key=by_key
+        ),
+        "services_changed": sorted(services_changed, key=by_key),
+        "fields_changed": _diff_fields(a, b),
+    }
+
+
+class HostTimeline:
+    """History of hosts built from concurrent point-in-time snapshots.
+
+    Snapshots are fetched with ``CensysHosts.view(ip, at_time=...)`` in a
+    bounded pool and cached, since a past snapshot never changes.
+    Consecutive snapshots with the same content are collapsed, and
+    differences are computed locally, so a timeline of N points costs at
+    most N requests.
+
+    Examples:
+        >>> from censys.search import CensysHosts, HostTimeline
+        >>> timeline = HostTimeline(CensysHosts())
+        >>> times = ["2024-01-01", "2024-02-01", "2024-03-01"]
+        >>> for change in timeline.changes("1.1.1.1", times):
+        ...     print(change["start"], change["diff"]["services_added"])
+    """
+
+    def __init__(
+        self,
+        hosts: CensysHosts,
+        cache: Optional[MutableMapping[str, Optional[dict]]] = None,
+        ignore_fields: Iterable[str] = VOLATILE_FIELDS,
+    ):
+        """Inits HostTimeline.
+
+        Args:
+            hosts (CensysHosts): Client used to fetch snapshots.
+            cache (MutableMapping[str, Optional[dict]]): Optional; Cache of snapshots, such as a ``shelve`` database. Defaults to a dictionary.
+            ignore_fields (Iterable[str]): Optional; Field names ignored when comparing snapshots.
+        """
+        self.hosts = hosts
+        self.cache: MutableMapping[str, Optional[dict]] = {} if cache is None else cache
+        self.ignore_fields = frozenset(ignore_fields)
+
+    def _view(self, ip: str, at_time: str) -> Optional[dict]:
+        try:
+            return self.hosts.view(ip, at_time=at_time)
+        except CensysNotFoundException:
+            return None
+
+    def snapshots(
+        self, ip: str, at_times: Iterable[Datetime], max_workers: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Fetches the snapshots of a host at many points in time.
+
+        Args:
+            ip (str): The IP address of the host.
+            at_times (Iterable[Datetime]): Points in time.
+            max_workers (int): Optional; The number of workers to use. Defaults to 10.
+
+        Raises:
+            CensysSearchException: If a snapshot cannot be fetched. A host that did not exist yet is not an error.
+
+        Returns:
+            List[Dict[str, Any]]: Snapshots in chronological order, each with its ``at_time``, content ``hash`` and ``host`` (None if the host did not exist). Hosts are copies, so changing them does not change the cache.
+        """
+        now = format_rfc3339(datetime.datetime.now(datetime.timezone.utc))
+        times = sorted(
+            {format_rfc3339(parse_datetime(at_time)) for at_time in at_times}
+        )
+        hosts: Dict[str, Optional[dict]] = {}
+        missing = []
+        for at_time in times:
+            key = f"{ip}@{at_time}"
+            if key in self.cache:
+                hosts[at_time] = self.cache[key]
+            else:
+                missing.append(at_time)
+
+        # The cache is only used from this thread, so it does not need to be thread-safe
+        for at_time, task in bounded_map(
+            lambda at_time: self._view(ip, at_time),
+            missing,
+            max_workers,
+            executor=self.hosts.executor,
+        ):
+            hosts[at_time] = task.result()
+            # Only past snapshots are final
+            if at_time < now:
+                self.cache[f"{ip}@{at_time}"] = hosts[at_time]
+
+        snapshots = []
+        for at_time in times:
+            snapshots.append(
+                {
+                    "at_time": at_time,
+                    "hash": content_hash(hosts[at_time], self.ignore_fields),
+                    "host": copy.deepcopy(hosts[at_time]),
+                }
+            )
+        return snapshots
+
+    def timeline(
+        self, ip: str, at_times: Iterable[Datetime], max_workers: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Collapses identical consecutive snapshots of a host.
+
+        Args:
+            ip (str): The IP address of the host.
+            at_times (Iterable[Datetime]): Points in time.
+            max_workers (int): Optional; The number of workers to use. Defaults to 10.
+
+        Returns:
+            List[Dict[str, Any]]: Distinct states in chronological order, each with the ``start`` and ``end`` time it was seen at, its ``hash`` and ``host``.
+        """
+        entries: List[Dict[str, Any]] = []
+        for snapshot in self.snapshots(ip, at_times, max_workers):
+            if entries and entries[-1]["hash"] == snapshot["hash"]:
+                entries[-1]["end"] = snapshot["at_time"]
+                continue
+            entries.append(
+                {
+                    "start": snapshot["at_time"],
+                    "end": snapshot["at_time"],
+                    "hash": snapshot["hash"],
+                    "host": snapshot["host"],
+                }
+            )
+        return entries
+
+    def changes(
+        self, ip: str, at_times: Iterable[Datetime], max_workers: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Computes the differences between consecutive states of a host.
+
+        Args:
+            ip (str): The IP address of the host.
+            at_times (Iterable[Datetime]): Points in time.
+            max_workers (int): Optional; The number of workers to use. Defaults to 10.
+
+        Returns:
+            List[Dict[str, Any]]: Each change with the ``start`` time of the new state, the ``previous`` state's start time and the ``diff``.
+        """
+        entries = self.timeline(ip, at_times, max_workers)
+        return [
+            {
+                "previous": before["start"],
+                "start": after["start"],
+                "diff": diff_hosts(before["host"], after["host"], self.ignore_fields),
+            }
+            for before, after in zip(entries, entries[1:])
+        ]
@@ -0,0 +1,24 @@
+"""Build the timeline of a host."""
+
+import shelve
+from datetime import date
+
+from censys.search import CensysHosts, HostTimeline
+
+h = CensysHosts()
+
+# Snapshots are kept between runs, so each point in time is fetched only once.
+timeline = HostTimeline(h, cache=shelve.open("host-timeline"))
+times = [date(2024, month, 1) for month in range(1, 13)]
+
+# Identical consecutive snapshots are collapsed into one state.
+for state in timeline.timeline("1.1.1.1", times):
+    print(state["start"], state["end"], state["hash"][:8])
+
+# Differences between consecutive states are computed locally.
+for change in timeline.changes("1.1.1.1", times):
+    diff = change["diff"]
+    print(change["start"])
+    print("  added:", [s["port"] for s in diff["services_added"]])
+    print("  removed:", [s["port"] for s in diff["services_removed"]])
+    print("  changed:", [s["port"] for s in diff["services_changed"]])
@@ -0,0 +1,24 @@
+"""Iterate over host events."""
+
+from datetime import date
+
+from censys.search import CensysHosts
+
+h = CensysHosts()
+
+# Follow cursors, requesting the next page while the current one is consumed.
+for event in h.iter_host_events("1.1.1.1", start_time=date(2022, 1, 1)):
+    print(event["timestamp"], event["_event"])
+
+# Split a year into 12 windows fetched in parallel, merged in chronological order.
+events = h.iter_host_events(
+    "1.1.1.1", start_time=date(2022, 1, 1), end_time=date(2023, 1, 1), windows=12
+)
+print(sum(1 for _ in events))
+
+# Fetch the events of many hosts in a bounded pool.
+for ip, event in h.bulk_host_events(["1.1.1.1", "8.8.8.8"], max_workers=10):
+    if "error" in event:
+        print(f"Failed to fetch events of {ip}: {event['error']}")
+    else:
+        print(ip, event["timestamp"])
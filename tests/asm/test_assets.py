@@ -2,6 +2,7 @@ import unittest
 from urllib.parse import quote
 
 import pytest
+import requests
 from parameterized import parameterized_class
 from pytest_mock import MockerFixture
 
@@ -329,3 +330,83 @@ class AssetsUnitTest(unittest.TestCase):
             params={"cursor": "test", "pageSize": None},
             timeout=TEST_TIMEOUT,
         )
+
+    def test_bulk_get_web_entity_instances(self):
+        # Mock
+        mock_request = self.mocker.patch("censys.common.base.requests.Session.get")
+        if self.asset_type != "web_entities":
+            pytest.skip("Only applicable to web entities assets")
+        entities = [self.test_asset_id, "www.example.com:80"]
+        responses = {
+            f"{self.asset_type_url()}/{entity}/instances": MockResponse(
+                TEST_SUCCESS_CODE, "instances"
+            )
+            for entity in entities
+        }
+        mock_request.side_effect = lambda url, **_: responses[url]
+        # Actual call
+        results = list(self.client.web_entities.bulk_get_instances(entities))
+        # Assertions
+        assert mock_request.call_count == 6
+        for entity in entities:
+            instances = [instance for name, instance in results if name == entity]
+            assert instances == RESOURCE_PAGING_RESULTS
+
+    def test_bulk_get_web_entity_instances_retries_page(self):
+        # Mock
+        self.mocker.patch("time.sleep")
+        mock_request = self.mocker.patch("censys.common.base.requests.Session.get")
+        if self.asset_type != "web_entities":
+            pytest.skip("Only applicable to web entities assets")
+        response = MockResponse(TEST_SUCCESS_CODE, "instances")
+        mock_request.side_effect = [
+            response,
+            requests.exceptions.ConnectionError("reset"),
+            response,
+            response,
+        ]
+        self.client.web_entities.max_retries = 2
+        # Actual call
+        results = list(
+            self.client.web_entities.bulk_get_instances([self.test_asset_id])
+        )
+        # Assertions
+        assert results == [
+            (self.test_asset_id, instance) for instance in RESOURCE_PAGING_RESULTS
+        ]
+        # The failed page is requested again from the same cursor
+        assert mock_request.call_args_list[1] == mock_request.call_args_list[2]
+
+    def test_bulk_get_web_entity_instances_failed_entity(self):
+        # Mock
+        self.mocker.patch("time.sleep")
+        mock_request = self.mocker.patch("censys.common.base.requests.Session.get")
+        if self.asset_type != "web_entities":
+            pytest.skip("Only applicable to web entities assets")
+        mock_request.side_effect = requests.exceptions.ConnectionError("reset")
+        self.client.web_entities.max_retries = 2
+        # Actual call
+        results = list(
+            self.client.web_entities.bulk_get_instances([self.test_asset_id])
+        )
+        # Assertions
+        # Pages are only retried by the client, not again on top of it
+        assert mock_request.call_count == 2
+        assert results == [(self.test_asset_id, {"error": "reset"})]
+
+    def test_bulk_get_web_entity_instances_stops_early(self):
+        # Mock
+        mock_request = self.mocker.patch("censys.common.base.requests.Session.get")
+        if self.asset_type != "web_entities":
+            pytest.skip("Only applicable to web entities assets")
+        mock_request.side_effect = lambda url, **_: MockResponse(
+            TEST_SUCCESS_CODE, "instances"
+        )
+        entities = [f"example{i}.com:443" for i in range(50)]
+        # Actual call
+        results = self.client.web_entities.bulk_get_instances(entities, max_workers=2)
+        next(results)
+        results.close()
+        # Assertions
+        # Workers stop once their pages can no longer be queued
+        assert mock_request.call_count < 20
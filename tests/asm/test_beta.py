@@ -1,4 +1,5 @@
 import responses
+from responses import matchers
 
 from ..utils import CensysTestCase
 from .utils import BETA_URL
@@ -150,3 +151,48 @@ class BetaUnitTest(CensysTestCase):
         res = self.client.get_user_workspaces(user_uuid="user_uuid")
         # Assertions
         assert res == TEST_USER_WORKSPACES
+
+    def test_backfill_asset_counts(self):
+        # Setup response
+        self.responses.add(
+            responses.GET,
+            BETA_URL + "/assets/counts",
+            status=200,
+            json=TEST_ASSET_COUNTS,
+            match=[
+                matchers.query_param_matcher(
+                    {"since": "2021-01-01", "environment": "ALL", "assetType": "HOST"}
+                )
+            ],
+        )
+        self.responses.add(
+            responses.GET,
+            BETA_URL + "/assets/hostCountsByCountry",
+            status=200,
+            json=TEST_HOST_COUNTS_BY_COUNTRY,
+            match=[
+                matchers.query_param_matcher(
+                    {"since": "2021-01-01", "environment": "ALL"}
+                )
+            ],
+        )
+        # Actual call
+        series = self.client.backfill_asset_counts(
+            "2021-01-01",
+            "ALL",
+            ["HOST"],
+            end="2021-01-01",
+            include_countries=True,
+        )
+        # Assertions
+        assert series.to_dict() == {
+            "date": ["2021-01-01"],
+            "HOST.string.totalCount": [0],
+            "HOST.string.totalNewCount": [0],
+            "HOST.totalCount": [0],
+            "HOST.totalNewCount": [0],
+            "countries.string.string.totalCount": [0],
+            "countries.string.string.totalNewCount": [0],
+            "countries.totalCount": [0],
+            "countries.totalNewCount": [0],
+        }
@@ -1,3 +1,7 @@
+import datetime
+import math
+
+import pytest
 import responses
 
 from ..utils import CensysTestCase
@@ -84,3 +88,57 @@ class CloudsUnitTest(CensysTestCase):
         res = self.client.clouds.get_unknown_counts()
         # Assertions
         assert res == TEST_COUNT_JSON
+
+    def test_backfill_counts(self):
+        # Setup response
+        for since, count in (("2021-01-01", 1), ("2021-01-02", 2)):
+            self.responses.add(
+                responses.GET,
+                V1_URL + f"/clouds/hostCounts/{since}",
+                status=200,
+                json={
+                    "totalAssetCount": count,
+                    "assetCountByProvider": [
+                        {"cloudProvider": "AWS", "assetCount": count}
+                    ],
+                },
+            )
+        self.responses.add(
+            responses.GET,
+            V1_URL + "/clouds/hostCounts/2021-01-03",
+            status=404,
+            json={"errorCode": 404, "error": "Not found"},
+        )
+        cache: dict = {}
+        # Actual call
+        series = self.client.clouds.backfill_counts(
+            "2021-01-01", "2021-01-03", asset_types=["hosts"], cache=cache
+        )
+        # Assertions
+        assert series.dates[0] == datetime.date(2021, 1, 1)
+        assert series["hosts.totalAssetCount"][:2].tolist() == [1, 2]
+        assert series["hosts.AWS.assetCount"][:2].tolist() == [1, 2]
+        assert math.isnan(series["hosts.totalAssetCount"][2])
+        assert list(series.errors) == ["hosts/2021-01-03"]
+        assert sorted(cache) == [
+            "clouds/hosts/2021-01-01",
+            "clouds/hosts/2021-01-02",
+        ]
+
+    def test_backfill_counts_cached(self):
+        # Setup response
+        cache = {"clouds/hosts/2021-01-01": {"totalAssetCount": 4}}
+        # Actual call
+        series = self.client.clouds.backfill_counts(
+            "2021-01-01", "2021-01-01", asset_types=["hosts"], cache=cache
+        )
+        # Assertions
+        assert series.to_dict() == {
+            "date": ["2021-01-01"],
+            "hosts.totalAssetCount": [4],
+        }
+        assert len(self.responses.calls) == 0
+
+    def test_backfill_counts_invalid_asset_type(self):
+        with pytest.raises(ValueError, match="Unsupported asset type: webs"):
+            self.client.clouds.backfill_counts("2021-01-01", asset_types=["webs"])
@@ -0,0 +1,175 @@
+import os
+import tempfile
+import unittest
+
+import pytest
+from pytest_mock import MockerFixture
+
+from censys.asm import AsmClient, AssetMirror
+from censys.asm.mirror import asset_id, event_asset
+from censys.common.exceptions import CensysException, CensysHostNotFoundException
+
+TEST_API_KEY = "test-api-key"
+TEST_CURSOR = "eyJmaWx0ZXIiOnt9LCJzdGFydCI6MH0"
+TEST_NEXT_CURSOR = "eyJmaWx0ZXIiOnt9LCJzdGFydCI6MjA3MTJ9"
+
+HOSTS = [
+    {"assetId": "1.1.1.1", "tags": [{"name": "prod", "color": "#ffffff"}]},
+    {"assetId": "8.8.8.8", "tags": [], "data": {"asn": 15169}},
+]
+DOMAINS = [{"assetId": "example.com"}]
+CERTIFICATES = [{"assetId": "fb444eb8e684"}]
+SUBDOMAINS = [{"name": "www.example.com"}]
+WEB_ENTITIES = {"hits": [{"web_entity": {"name": "example.com", "port": 443}}]}
+
+
+class AssetMirrorTests(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def __inject_fixtures(self, mocker: MockerFixture):
+        """Injects fixtures into the test case.
+
+        Args:
+            mocker (MockerFixture): pytest-mock fixture.
+        """
+        # Inject mocker fixture
+        self.mocker = mocker
+
+    def setUp(self):
+        self.client = AsmClient(TEST_API_KEY)
+        for name, assets in [
+            ("hosts", HOSTS),
+            ("domains", DOMAINS),
+            ("certificates", CERTIFICATES),
+            ("subdomains", SUBDOMAINS),
+        ]:
+            self.mocker.patch.object(
+                getattr(self.client, name), "get_assets", return_value=iter(assets)
+            )
+        self.mock_search = self.mocker.patch.object(
+            self.client.inventory, "search", return_value=WEB_ENTITIES
+        )
+        self.mock_cursor = self.mocker.patch.object(
+            self.client.logbook,
+            "get_cursor",
+            side_effect=[TEST_CURSOR, TEST_NEXT_CURSOR],
+        )
+        self.mirror = AssetMirror(client=self.client)
+        self.addCleanup(self.mirror.close)
+
+    def test_asset_id(self):
+        assert asset_id(HOSTS[0]) == "1.1.1.1"
+        assert asset_id(SUBDOMAINS[0]) == "www.example.com"
+        assert asset_id(WEB_ENTITIES["hits"][0]) == "example.com:443"
+        assert asset_id({}) is None
+
+    def test_event_asset(self):
+        assert event_asset(
+            {"type": "HOST_PORT", "entity": {"ipAddress": "1.1.1.1"}}
+        ) == ("hosts", "1.1.1.1")
+        assert event_asset(
+            {"type": "DOMAIN_SUBDOMAIN", "entity": {"subdomain": "a.example.com"}}
+        ) == ("subdomains", "a.example.com")
+        assert event_asset({"type": "CERT_RISK", "entity": {"sha256": "ab"}}) == (
+            "certificates",
+            "ab",
+        )
+        assert event_asset({"type": "UNKNOWN", "entity": {}}) is None
+
+    def test_bootstrap(self):
+        counts = self.mirror.bootstrap()
+
+        assert counts == {
+            "hosts": 2,
+            "domains": 1,
+            "certificates": 1,
+            "subdomains": 1,
+            "web-entities": 1,
+        }
+        assert self.mirror.count() == 6
+        assert self.mirror.cursor == TEST_CURSOR
+        assert self.mirror.get("hosts", "1.1.1.1") == HOSTS[0]
+        assert self.mirror.get("hosts", "9.9.9.9") is None
+        assert self.mirror.ids("hosts") == ["1.1.1.1", "8.8.8.8"]
+        assert list(self.mirror.assets("hosts", tag="prod")) == [HOSTS[0]]
+        assert list(self.mirror.find("hosts", "data.asn", 15169)) == [HOSTS[1]]
+        self.mock_search.assert_called_once_with(
+            query="web_entity.name: *", page_size=500, pages=-1
+        )
+
+    def test_sync_requires_bootstrap(self):
+        with pytest.raises(CensysException, match="bootstrapped"):
+            self.mirror.sync()
+
+    def test_sync(self):
+        self.mirror.bootstrap(["hosts", "domains"])
+        events = [
+            {
+                "id": 10,
+                "type": "HOST",
+                "operation": "DISASSOCIATE",
+                "entity": {"ipAddress": "1.1.1.1"},
+            },
+            {
+                "id": 11,
+                "type": "HOST_PORT",
+                "operation": "ADD",
+                "entity": {"ipAddress": "8.8.8.8"},
+            },
+            {
+                "id": 12,
+                "type": "HOST_RISK",
+                "operation": "ADD",
+                "entity": {"ipAddress": "8.8.8.8"},
+            },
+            {
+                "id": 13,
+                "type": "HOST",
+                "operation": "ASSOCIATE",
+                "entity": {"ipAddress": "9.9.9.9"},
+            },
+            {
+                "id": 14,
+                "type": "DOMAIN_RISK",
+                "operation": "ADD",
+                "entity": {"domain": "example.com"},
+            },
+        ]
+        mock_events = self.mocker.patch.object(
+            self.client.logbook, "get_events", return_value=iter(events)
+        )
+        updated_hosts = {
+            "8.8.8.8": {"assetId": "8.8.8.8", "tags": [{"name": "prod"}]},
+            "9.9.9.9": {"assetId": "9.9.9.9"},
+        }
+        mock_host = self.mocker.patch.object(
+            self.client.hosts, "get_asset_by_id", side_effect=updated_hosts.get
+        )
+        self.mocker.patch.object(
+            self.client.domains,
+            "get_asset_by_id",
+            side_effect=CensysHostNotFoundException(404, "Not found"),
+        )
+
+        result = self.mirror.sync()
+
+        assert result == {"events": 5, "updated": 2, "deleted": 2}
+        mock_events.assert_called_once_with(TEST_CURSOR)
+        assert mock_host.call_count == 2
+        self.mock_cursor.assert_called_with(start=15)
+        assert self.mirror.cursor == TEST_NEXT_CURSOR
+        assert self.mirror.last_event_id == 14
+        assert self.mirror.ids("hosts") == ["8.8.8.8", "9.9.9.9"]
+        assert self.mirror.ids("domains") == []
+        assert [asset["assetId"] for asset in self.mirror.assets("hosts", "prod")] == [
+            "8.8.8.8"
+        ]
+
+    def test_persisted_state(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "inventory.db")
+            with AssetMirror(path, client=self.client) as mirror:
+                mirror.bootstrap(["hosts"])
+
+            with AssetMirror(path, client=self.client) as mirror:
+                assert mirror.cursor == TEST_CURSOR
+                assert mirror.count("hosts") == 2
@@ -282,3 +282,83 @@ class RisksTests(CensysTestCase):
         res = self.api.patch_risk_type(TEST_RISK_TYPE, mock_patch)
         # Assertions
         assert res == TEST_PATCH_RISK_TYPE_JSON
+
+    def add_search_page(self, page, risks, total=None, limit=2):
+        result = {"risks": risks}
+        if total is not None:
+            result["total"] = total
+        self.responses.add(
+            responses.POST,
+            V2_URL + "/risk-instances/search",
+            status=200,
+            json=result,
+            match=[
+                matchers.json_params_matcher(
+                    {"query": {"field": "severity"}, "limit": limit, "page": page}
+                )
+            ],
+        )
+
+    @parameterized.expand([(0,), (1,), (3,)])
+    def test_search_all_risk_instances(self, prefetch):
+        # Setup response
+        risks = [{"id": i} for i in range(4)]
+        self.add_search_page(1, risks[:2])
+        self.add_search_page(2, risks[2:])
+        self.add_search_page(3, [])
+        for page in range(4, 7):
+            self.add_search_page(page, [])
+        # Actual call
+        res = list(
+            self.api.search_all_risk_instances(
+                {"query": {"field": "severity"}}, limit=2, prefetch=prefetch
+            )
+        )
+        # Assertions
+        assert res == risks
+
+    @parameterized.expand([(0,), (1,), (3,)])
+    def test_search_all_risk_instances_capped_page_size(self, prefetch):
+        # Setup response
+        risks = [{"id": i} for i in range(5)]
+        for page in range(1, 4):
+            self.add_search_page(
+                page, risks[(page - 1) * 2 : page * 2], total=5, limit=10
+            )
+        # Actual call
+        res = list(
+            self.api.search_all_risk_instances(
+                {"query": {"field": "severity"}}, limit=10, prefetch=prefetch
+            )
+        )
+        # Assertions
+        assert res == risks
+        # Pages past the total are not requested
+        assert len(self.responses.calls) == 3
+
+    def test_bulk_patch_risk_instances(self):
+        # Setup response
+        patches = [{"id": i, "userStatus": "accepted"} for i in range(3)]
+        self.responses.add(
+            responses.PATCH,
+            V2_URL + "/risk-instances",
+            status=200,
+            json=TEST_PATCH_RISK_INSTANCE_JSON,
+            match=[matchers.json_params_matcher(patches[:2])],
+        )
+        self.responses.add(
+            responses.PATCH,
+            V2_URL + "/risk-instances",
+            status=400,
+            json={"errorCode": 400, "error": "Invalid risk instance"},
+            match=[matchers.json_params_matcher(patches[2:])],
+        )
+        # Actual call
+        res = sorted(
+            self.api.bulk_patch_risk_instances(patches, chunk_size=2),
+            key=lambda result: result[0][0]["id"],
+        )
+        # Assertions
+        assert res[0] == (patches[:2], TEST_PATCH_RISK_INSTANCE_JSON)
+        assert res[1][0] == patches[2:]
+        assert "Invalid risk instance" in res[1][1]["error"]
@@ -1,3 +1,5 @@
+import itertools
+
 import responses
 from parameterized import parameterized
 
@@ -209,3 +211,143 @@ class SavedQueriesTests(CensysTestCase):
 
         # Assertions
         assert res == TEST_DELETE_SAVED_QUERY_BY_ID_JSON
+
+    def test_get_all_saved_queries(self):
+        # Setup response
+        queries = [
+            {"queryId": str(i), "queryName": f"query-{i}", "query": f"q{i}"}
+            for i in range(3)
+        ]
+        self.responses.add(
+            responses.GET,
+            SAVED_QUERIES_BASE_PATH + "?pageSize=2&page=1",
+            json={"results": queries[:2], "totalResults": 3},
+            status=200,
+        )
+        self.responses.add(
+            responses.GET,
+            SAVED_QUERIES_BASE_PATH + "?pageSize=2&page=2",
+            json={"results": queries[2:], "totalResults": 3},
+            status=200,
+        )
+
+        # Actual call
+        res = list(self.api.get_all_saved_queries(page_size=2))
+
+        # Assertions
+        assert res == queries
+
+    def test_get_saved_query_by_name(self):
+        # Setup response
+        self.responses.add(
+            responses.GET,
+            SAVED_QUERIES_BASE_PATH + "?pageSize=100&page=1&queryNamePrefix=string",
+            json=TEST_GET_SAVED_QUERIES_JSON,
+            status=200,
+        )
+
+        # Actual call
+        res = self.api.get_saved_query_by_name("string")
+
+        # Assertions
+        assert res == TEST_GET_SAVED_QUERIES_JSON["results"][0]
+        assert len(self.responses.calls) == 1
+
+    def test_get_saved_query_by_name_not_found(self):
+        # Setup response
+        self.responses.add(
+            responses.GET,
+            SAVED_QUERIES_BASE_PATH + "?pageSize=100&page=1&queryNamePrefix=missing",
+            json={"results": [], "totalResults": 0},
+            status=200,
+        )
+
+        # Actual call/Assertions
+        assert self.api.get_saved_query_by_name("missing") is None
+
+    def test_get_saved_query_by_name_cached(self):
+        # Setup response
+        self.responses.add(
+            responses.GET,
+            SAVED_QUERIES_BASE_PATH + "?pageSize=100&page=1",
+            json=TEST_GET_SAVED_QUERIES_JSON,
+            status=200,
+        )
+
+        # Actual call
+        self.api.refresh_saved_query_index()
+        first = self.api.get_saved_query_by_name("string")
+        second = self.api.get_saved_query_by_name("string")
+
+        # Assertions
+        assert first == second == TEST_GET_SAVED_QUERIES_JSON["results"][0]
+        assert len(self.responses.calls) == 1
+
+    def test_get_saved_query_by_name_missing_from_index(self):
+        # Setup response
+        self.responses.add(
+            responses.GET,
+            SAVED_QUERIES_BASE_PATH + "?pageSize=100&page=1",
+            json=TEST_GET_SAVED_QUERIES_JSON,
+            status=200,
+        )
+
+        # Actual call
+        self.api.refresh_saved_query_index()
+        res = self.api.get_saved_query_by_name("new")
+
+        # Assertions
+        # A fresh index lists every saved query, so the name does not exist
+        assert res is None
+        assert len(self.responses.calls) == 1
+
+    def test_get_saved_query_by_name_exact_match(self):
+        # Setup response
+        queries = [
+            {"queryId": "1", "queryName": "string 2", "query": "q1"},
+            {"queryId": "2", "queryName": "string", "query": "q2"},
+        ]
+        self.responses.add(
+            responses.GET,
+            SAVED_QUERIES_BASE_PATH + "?pageSize=100&page=1&queryNamePrefix=string",
+            json={"results": queries, "totalResults": 2},
+            status=200,
+        )
+        self.responses.add(
+            responses.GET,
+            SAVED_QUERIES_BASE_PATH + "?pageSize=100&page=1&queryNamePrefix=str",
+            json={"results": queries, "totalResults": 2},
+            status=200,
+        )
+
+        # Actual call/Assertions
+        assert self.api.get_saved_query_by_name("string") == queries[1]
+        # Names that only start with the name are not used
+        assert self.api.get_saved_query_by_name("str") is None
+
+    def test_get_saved_query_by_name_expired(self):
+        # Setup response
+        self.responses.add(
+            responses.GET,
+            SAVED_QUERIES_BASE_PATH + "?pageSize=100&page=1",
+            json=TEST_GET_SAVED_QUERIES_JSON,
+            status=200,
+        )
+        self.responses.add(
+            responses.GET,
+            SAVED_QUERIES_BASE_PATH + "?pageSize=100&page=1&queryNamePrefix=string",
+            json=TEST_GET_SAVED_QUERIES_JSON,
+            status=200,
+        )
+        self.api.index_ttl = 0
+        mock_time = self.mocker.patch("censys.asm.saved_queries.time.monotonic")
+        # Every call is later than the last, including those made by the client
+        mock_time.side_effect = itertools.count()
+
+        # Actual call
+        self.api.refresh_saved_query_index()
+        res = self.api.get_saved_query_by_name("string")
+
+        # Assertions
+        assert res == TEST_GET_SAVED_QUERIES_JSON["results"][0]
+        assert len(self.responses.calls) == 2
@@ -1,10 +1,12 @@
 import unittest
 
 import pytest
+import requests
 from pytest_mock import MockerFixture
 
 from .utils import TEST_SUCCESS_CODE, TEST_TIMEOUT, V1_URL, MockResponse
 from censys.asm.client import AsmClient
+from censys.asm.seeds import diff_seeds
 
 SEEDS_URL = f"{V1_URL}/seeds"
 SEED_RESOURCE_TYPE = "seeds"
@@ -30,6 +32,15 @@ TEST_SEED_LIST_NO_LABEL = [
 ]
 
 
+CURRENT_SEEDS = [
+    {"id": 1, "type": "ASN", "value": 90002, "label": "seed-test-label"},
+    {"id": 2, "type": "ASN", "value": 90005, "label": "seed-test-label"},
+    {"id": 3, "type": "ASN", "value": 90006, "label": "seed-test-label"},
+    {"id": 4, "type": "ASN", "value": 90007, "label": "other-label"},
+    {"id": 5, "type": "ASN", "value": 90008, "label": ""},
+]
+
+
 class SeedsUnitTests(unittest.TestCase):
     """Unit tests for Seeds API."""
 
@@ -134,6 +145,64 @@ class SeedsUnitTests(unittest.TestCase):
             json={"seeds": TEST_SEED_LIST},
         )
 
+    def test_bulk_add_seeds(self):
+        # Mock
+        mock_request = self.mocker.patch("censys.common.base.requests.Session.post")
+        mock_request.return_value = MockResponse(TEST_SUCCESS_CODE, SEED_RESOURCE_TYPE)
+        # Actual call
+        results = list(
+            self.client.seeds.bulk_add_seeds(
+                iter(TEST_SEED_LIST), chunk_size=2, max_workers=1
+            )
+        )
+        # Assertions
+        assert [chunk for chunk, _ in results] == [
+            TEST_SEED_LIST[:2],
+            TEST_SEED_LIST[2:],
+        ]
+        assert mock_request.call_count == 2
+        mock_request.assert_any_call(
+            SEEDS_URL,
+            params={"force": None},
+            timeout=TEST_TIMEOUT,
+            json={"seeds": TEST_SEED_LIST[:2]},
+        )
+        mock_request.assert_called_with(
+            SEEDS_URL,
+            params={"force": None},
+            timeout=TEST_TIMEOUT,
+            json={"seeds": TEST_SEED_LIST[2:]},
+        )
+
+    def test_bulk_add_seeds_retries_chunk(self):
+        # Mock
+        self.mocker.patch("time.sleep")
+        mock_request = self.mocker.patch("censys.common.base.requests.Session.post")
+        mock_request.side_effect = [
+            requests.exceptions.ConnectionError("reset"),
+            MockResponse(TEST_SUCCESS_CODE, SEED_RESOURCE_TYPE),
+        ]
+        self.client.seeds.max_retries = 2
+        # Actual call
+        results = list(self.client.seeds.bulk_add_seeds(TEST_SEED_LIST))
+        # Assertions
+        assert mock_request.call_count == 2
+        assert len(results) == 1
+        assert "error" not in results[0][1]
+
+    def test_bulk_add_seeds_failed_chunk(self):
+        # Mock
+        self.mocker.patch("time.sleep")
+        mock_request = self.mocker.patch("censys.common.base.requests.Session.post")
+        mock_request.side_effect = requests.exceptions.ConnectionError("reset")
+        self.client.seeds.max_retries = 2
+        # Actual call
+        results = list(self.client.seeds.bulk_add_seeds(TEST_SEED_LIST))
+        # Assertions
+        # Chunks are only retried by the client, not again on top of it
+        assert mock_request.call_count == 2
+        assert results == [(TEST_SEED_LIST, {"error": "reset"})]
+
     def test_replace_seeds_by_label(self):
         # Mock
         mock_request = self.mocker.patch("censys.common.base.requests.Session.put")
@@ -185,3 +254,82 @@ class SeedsUnitTests(unittest.TestCase):
         mock_request.assert_called_with(
             f"{SEEDS_URL}/{TEST_SEED_ID}", params={}, timeout=TEST_TIMEOUT
         )
+
+    def test_diff_seeds_replaces_label(self):
+        # Actual call
+        plan = diff_seeds(CURRENT_SEEDS, TEST_SEED_LIST)
+        # Assertions
+        assert plan["seedsToAdd"] == TEST_SEED_LIST[1:]
+        assert plan["seedsToRemove"] == CURRENT_SEEDS[1:3]
+        assert plan["labelsToReplace"] == {"seed-test-label": TEST_SEED_LIST}
+        assert plan["unchangedCount"] == 1
+        assert plan["apiCalls"] == 1
+
+    def test_diff_seeds_incremental(self):
+        # Actual call
+        plan = diff_seeds(
+            CURRENT_SEEDS,
+            [CURRENT_SEEDS[0], CURRENT_SEEDS[1], TEST_SEED_NO_LABEL],
+        )
+        # Assertions
+        assert plan["seedsToAdd"] == [TEST_SEED_NO_LABEL]
+        assert plan["seedsToRemove"] == [CURRENT_SEEDS[4], CURRENT_SEEDS[2]]
+        assert plan["labelsToReplace"] == {}
+        assert plan["unchangedCount"] == 2
+        assert plan["apiCalls"] == 3
+
+    def test_diff_seeds_empty_label(self):
+        # Actual call
+        plan = diff_seeds(CURRENT_SEEDS, [], labels=["seed-test-label"])
+        # Assertions
+        assert plan["seedsToRemove"] == CURRENT_SEEDS[:3]
+        assert plan["labelsToReplace"] == {"seed-test-label": []}
+        assert plan["apiCalls"] == 1
+
+    def test_sync_dry_run(self):
+        # Mock
+        mock_get = self.mocker.patch.object(
+            self.client.seeds, "get_seeds", return_value=CURRENT_SEEDS
+        )
+        mock_post = self.mocker.patch("censys.common.base.requests.Session.post")
+        # Actual call
+        plan = self.client.seeds.sync(TEST_SEED_LIST, dry_run=True)
+        # Assertions
+        mock_get.assert_called_once_with()
+        mock_post.assert_not_called()
+        assert plan["errors"] == []
+        assert plan["labelsToReplace"] == {"seed-test-label": TEST_SEED_LIST}
+
+    def test_sync(self):
+        # Mock
+        self.mocker.patch.object(
+            self.client.seeds, "get_seeds", return_value=CURRENT_SEEDS
+        )
+        mock_put = self.mocker.patch("censys.common.base.requests.Session.put")
+        mock_put.return_value = MockResponse(TEST_SUCCESS_CODE, SEED_RESOURCE_TYPE)
+        mock_post = self.mocker.patch("censys.common.base.requests.Session.post")
+        mock_post.return_value = MockResponse(TEST_SUCCESS_CODE, SEED_RESOURCE_TYPE)
+        mock_delete = self.mocker.patch("censys.common.base.requests.Session.delete")
+        mock_delete.return_value = MockResponse(TEST_SUCCESS_CODE, SEED_RESOURCE_TYPE)
+        # Actual call
+        plan = self.client.seeds.sync(
+            TEST_SEED_LIST + [TEST_SEED_NO_LABEL, CURRENT_SEEDS[3]],
+            labels=[""],
+        )
+        # Assertions
+        assert plan["errors"] == []
+        mock_put.assert_called_once_with(
+            SEEDS_URL,
+            params={"label": TEST_SEED_LABEL, "force": None},
+            timeout=TEST_TIMEOUT,
+            json={"seeds": TEST_SEED_LIST_NO_LABEL},
+        )
+        mock_post.assert_called_once_with(
+            SEEDS_URL,
+            params={"force": None},
+            timeout=TEST_TIMEOUT,
+            json={"seeds": [TEST_SEED_NO_LABEL]},
+        )
+        mock_delete.assert_called_once_with(
+            f"{SEEDS_URL}/5", params={}, timeout=TEST_TIMEOUT
+        )
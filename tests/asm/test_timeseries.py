@@ -0,0 +1,50 @@
+import datetime
+import math
+import unittest
+from array import array
+
+import pytest
+
+from censys.asm.timeseries import TimeSeries, date_range, flatten_counts
+
+TEST_HOST_COUNTS_BY_COUNTRY = {
+    "environment": "ALL",
+    "totalCount": 5,
+    "totalCountsBySubEnvironment": [
+        {
+            "environment": "CLOUD",
+            "totalCountsByCountry": [
+                {"country": "Germany", "countryCode": "DE", "totalCount": 2}
+            ],
+        }
+    ],
+}
+
+
+class TimeSeriesTests(unittest.TestCase):
+    def test_date_range(self):
+        assert date_range("2024-01-30", datetime.date(2024, 2, 2), step=2) == [
+            datetime.date(2024, 1, 30),
+            datetime.date(2024, 2, 1),
+        ]
+
+    def test_date_range_invalid_step(self):
+        with pytest.raises(ValueError, match="Step must be at least 1 day."):
+            date_range("2024-01-01", "2024-01-02", step=0)
+
+    def test_flatten_counts(self):
+        assert flatten_counts(TEST_HOST_COUNTS_BY_COUNTRY, "countries") == {
+            "countries.totalCount": 5,
+            "countries.CLOUD.DE.totalCount": 2,
+        }
+
+    def test_time_series(self):
+        series = TimeSeries(
+            [datetime.date(2024, 1, 1), datetime.date(2024, 1, 2)],
+            {"hosts.totalAssetCount": array("d", [1, math.nan])},
+        )
+
+        assert len(series) == 2
+        assert series["hosts.totalAssetCount"][0] == 1
+        assert series.to_dict()["date"] == ["2024-01-01", "2024-01-02"]
+        assert [row["hosts.totalAssetCount"] for _, row in series][0] == 1
@@ -13,7 +13,7 @@ from tests.cli.test_config import TEST_CONFIG_PATH
 from tests.utils import CensysTestCase
 
 from censys.cli import main as cli_main
-from censys.cli.commands.asm import get_seeds_from_xml
+from censys.cli.commands.asm import get_seeds_from_xml, iter_seeds_from_xml
 
 SEEDS_JSON = [
     {"value": 0, "type": "ASN"},
@@ -577,6 +577,92 @@ class CensysASMCliTest(CensysTestCase):
         # Assertions
         assert seeds == XML_SEEDS
 
+    def test_iter_seeds_from_xml(self):
+        # Actual call
+        seeds = list(iter_seeds_from_xml(str(TEST_XML_PATH)))
+
+        # Assertions
+        assert seeds == XML_SEEDS
+
+    def test_add_seeds_in_chunks(self):
+        # Mock
+        self.patch_args(
+            [
+                "censys",
+                "asm",
+                "add-seeds",
+                "-v",
+                "--chunk-size",
+                "2",
+                "-j",
+                json.dumps(["1.1.1.1", "1.1.1.2", "1.1.1.3"]),
+            ],
+            asm_auth=True,
+        )
+        for values in [["1.1.1.1", "1.1.1.2"], ["1.1.1.3"]]:
+            seeds = [
+                {"value": value, "type": "IP_ADDRESS", "label": ""} for value in values
+            ]
+            self.responses.add(
+                responses.POST,
+                V1_URL + "/seeds",
+                status=200,
+                json={"addedSeeds": seeds},
+                match=[json_params_matcher({"seeds": seeds})],
+            )
+
+        # Actual call
+        temp_stdout = StringIO()
+        with contextlib.redirect_stdout(temp_stdout):
+            cli_main()
+
+        # Assertions
+        assert "Added 3 seeds" in temp_stdout.getvalue()
+        assert "Processed 3 seeds" in temp_stdout.getvalue()
+
+    def test_add_seeds_failed_chunk(self):
+        # Mock
+        self.patch_args(
+            [
+                "censys",
+                "asm",
+                "add-seeds",
+                "--chunk-size",
+                "1",
+                "-j",
+                json.dumps(["1.1.1.1", "1.1.1.2"]),
+            ],
+            asm_auth=True,
+        )
+        self.responses.add(
+            responses.POST,
+            V1_URL + "/seeds",
+            status=200,
+            json={"addedSeeds": [{"value": "1.1.1.1"}]},
+            match=[
+                json_params_matcher(
+                    {"seeds": [{"value": "1.1.1.1", "type": "IP_ADDRESS", "label": ""}]}
+                )
+            ],
+        )
+        self.responses.add(
+            responses.POST,
+            V1_URL + "/seeds",
+            status=400,
+            json={"errorCode": 10014, "error": "Invalid seed"},
+        )
+
+        # Actual call
+        temp_stdout = StringIO()
+        with pytest.raises(SystemExit, match="1"), contextlib.redirect_stdout(
+            temp_stdout
+        ):
+            cli_main()
+
+        # Assertions
+        assert "Added 1 seeds" in temp_stdout.getvalue()
+        assert "Failed to add 1 seeds" in temp_stdout.getvalue()
+
     def test_add_seeds_from_xml_file(self):
         # Mock
         self.patch_args(
@@ -1270,6 +1356,106 @@ class CensysASMCliTest(CensysTestCase):
             in temp_stdout.getvalue()
         )
 
+    def test_sync_seeds_dry_run(self):
+        # Mock
+        self.patch_args(
+            [
+                "censys",
+                "asm",
+                "sync-seeds",
+                "--label",
+                "Test 2",
+                "--dry-run",
+                "-j",
+                json.dumps(["9.9.9.9"]),
+            ],
+            asm_auth=True,
+        )
+        self.responses.add(
+            responses.GET,
+            V1_URL + "/seeds",
+            status=200,
+            json=GET_SEEDS_JSON,
+        )
+
+        # Actual call
+        temp_stdout = StringIO()
+        with contextlib.redirect_stdout(temp_stdout):
+            cli_main()
+
+        # Assertions
+        output = temp_stdout.getvalue()
+        assert "+ IP_ADDRESS 9.9.9.9 (Test 2)" in output
+        assert "- IP_ADDRESS 5.6.7.8 (Test 2)" in output
+        assert (
+            "Would add 1 seeds and remove 1 seeds (0 unchanged, 1 API calls)." in output
+        )
+
+    def test_sync_seeds(self):
+        # Mock
+        self.patch_args(
+            [
+                "censys",
+                "asm",
+                "sync-seeds",
+                "-j",
+                json.dumps(
+                    [
+                        {"value": "1.2.3.4", "label": "Test"},
+                        {"value": "foo.com", "type": "DOMAIN_NAME", "label": "Test"},
+                        {"value": "9.9.9.9", "label": "Test 2"},
+                    ]
+                ),
+            ],
+            asm_auth=True,
+        )
+        self.responses.add(
+            responses.GET,
+            V1_URL + "/seeds",
+            status=200,
+            json=GET_SEEDS_JSON,
+        )
+        self.responses.add(
+            responses.PUT,
+            V1_URL + "/seeds",
+            status=200,
+            json={"addedSeeds": [], "removedSeeds": [], "skippedReservedSeeds": []},
+            match=[
+                matchers.query_param_matcher({"label": "Test"}),
+                json_params_matcher(
+                    {
+                        "seeds": [
+                            {"value": "1.2.3.4", "type": "IP_ADDRESS"},
+                            {"value": "foo.com", "type": "DOMAIN_NAME"},
+                        ]
+                    }
+                ),
+            ],
+        )
+        self.responses.add(
+            responses.PUT,
+            V1_URL + "/seeds",
+            status=200,
+            json={"addedSeeds": [], "removedSeeds": [], "skippedReservedSeeds": []},
+            match=[
+                matchers.query_param_matcher({"label": "Test 2"}),
+                json_params_matcher(
+                    {"seeds": [{"value": "9.9.9.9", "type": "IP_ADDRESS"}]}
+                ),
+            ],
+        )
+
+        # Actual call
+        temp_stdout = StringIO()
+        with contextlib.redirect_stdout(temp_stdout):
+            cli_main()
+
+        # Assertions
+        assert (
+            "Added 1 seeds and removed 3 seeds (2 unchanged, 2 API calls)."
+            in temp_stdout.getvalue()
+        )
+
     def test_replace_labeled_seeds_without_label(self):
         # Mock
         self.patch_args(
@@ -2000,6 +2186,8 @@ class CensysASMCliTest(CensysTestCase):
         # Assertions
         actual_json = json.loads(temp_stdout.getvalue())
         assert actual_json == SEARCH_JSON
+        # A single name is resolved with one filtered request
+        mock_query.assert_called_once_with("foo domain", 100, 1)
 
     def test_execute_saved_query_by_name_not_found(self):
         # Mock
@@ -2115,6 +2303,107 @@ class CensysASMCliTest(CensysTestCase):
         # Assertions
         assert "page size must be within [0,1000]" in temp_stdout.getvalue()
 
+    def test_execute_saved_queries(self):
+        # Mock
+        mock_request = self.mocker.patch("censys.asm.api.CensysAsmAPI.get_workspace_id")
+        mock_request.return_value = WORKSPACE_ID
+        mock_query = self.mocker.patch("censys.asm.SavedQueries.get_saved_queries")
+        saved_query = {
+            "queryId": "1",
+            "queryName": "foo domain",
+            "query": "domain: foo.com",
+            "createdAt": "2024-01-01T01:00:00.000Z",
+        }
+
+        def get_saved_queries(query_name_prefix=None, page_size=None, page=None):
+            if query_name_prefix and not "foo domain".startswith(query_name_prefix):
+                return {"results": []}
+            return {"results": [saved_query]}
+
+        mock_query.side_effect = get_saved_queries
+        self.patch_args(
+            [
+                "censys",
+                "asm",
+                "execute-saved-queries",
+                "--query-names",
+                "foo domain",
+                "missing",
+            ],
+            asm_auth=True,
+        )
+        self.responses.add(
+            responses.GET,
+            INVENTORY_URL + "/v1",
+            status=200,
+            json=SEARCH_JSON,
+            match=[
+                matchers.query_param_matcher(
+                    {
+                        "workspaces": WORKSPACE_ID,
+                        "query": "domain: foo.com",
+                        "pageSize": 50,
+                    }
+                )
+            ],
+        )
+
+        # Actual call
+        temp_stdout = StringIO()
+        with pytest.raises(SystemExit, match="1"), contextlib.redirect_stdout(
+            temp_stdout
+        ):
+            cli_main()
+
+        # Assertions
+        lines = {
+            line["queryName"]: line
+            for line in map(json.loads, temp_stdout.getvalue().splitlines())
+        }
+        assert lines["foo domain"]["queryId"] == "1"
+        assert lines["foo domain"]["results"] == SEARCH_JSON
+        assert lines["foo domain"]["seconds"] >= 0
+        assert lines["missing"]["error"] == "No saved query found with that name."
+        # The index is listed once, and names missing from it are not found
+        mock_query.assert_called_once_with(None, 100, 1)
+
+    def test_execute_saved_queries_all(self):
+        # Mock
+        mock_request = self.mocker.patch("censys.asm.api.CensysAsmAPI.get_workspace_id")
+        mock_request.return_value = WORKSPACE_ID
+        mock_query = self.mocker.patch("censys.asm.SavedQueries.get_saved_queries")
+        mock_query.return_value = {
+            "results": [
+                {
+                    "queryId": "1",
+                    "queryName": "foo domain",
+                    "query": "domain: foo.com",
+                    "createdAt": "2024-01-01T01:00:00.000Z",
+                }
+            ]
+        }
+        self.patch_args(
+            ["censys", "asm", "execute-saved-queries", "--all"],
+            asm_auth=True,
+        )
+        self.responses.add(
+            responses.GET,
+            INVENTORY_URL + "/v1",
+            status=200,
+            json=SEARCH_JSON,
+        )
+
+        # Actual call
+        temp_stdout = StringIO()
+        with contextlib.redirect_stdout(temp_stdout):
+            cli_main()
+
+        # Assertions
+        lines = [json.loads(line) for line in temp_stdout.getvalue().splitlines()]
+        assert [line["queryName"] for line in lines] == ["foo domain"]
+        assert lines[0]["results"] == SEARCH_JSON
+        assert mock_query.call_count == 1
+
     def test_execute_saved_query_by_id(self):
         # Mock
         mock_request = self.mocker.patch("censys.asm.api.CensysAsmAPI.get_workspace_id")
@@ -1,12 +1,19 @@
 import contextlib
+import os
+import pstats
+import tempfile
 from io import StringIO
 
 import pytest
+import responses
+from rich.console import Console
 
-from tests.utils import CensysTestCase
+from tests.search.v2.test_hosts import SEARCH_HOSTS_JSON
+from tests.utils import V2_URL, CensysTestCase
 
 from censys.cli import main as cli_main
 from censys.cli.commands import __all__ as cli_commands
+from censys.cli.utils import print_stats
 from censys.common import __version__
 
 
@@ -44,3 +51,87 @@ class CensysCliTest(CensysTestCase):
             cli_main()
         # Assertion
         assert __version__ in temp_stdout.getvalue()
+
+
+class CensysCliStatsTest(CensysTestCase):
+    def setUp(self):
+        super().setUp()
+        self.mocker.patch("censys.common.stats.process_stats", None)
+        self.responses.add(
+            responses.POST,
+            V2_URL + "/hosts/search",
+            status=200,
+            json=SEARCH_HOSTS_JSON,
+        )
+
+    def search_args(self, *global_args: str):
+        self.patch_args(
+            [
+                "censys",
+                *global_args,
+                "search",
+                "services.service_name: HTTP",
+                "--pages",
+                "1",
+            ],
+            search_auth=True,
+        )
+
+    def test_stats(self):
+        self.search_args("--stats")
+        mock_print_stats = self.mocker.patch("censys.cli.print_stats")
+
+        with contextlib.redirect_stdout(StringIO()):
+            cli_main()
+
+        summary = mock_print_stats.call_args[0][0]
+        assert summary["requests"] == 1
+        assert summary["retries"] == 0
+        assert summary["latency"]["p50"] is not None
+        assert {"network", "decode", "render"} <= set(summary["phases"])
+
+    def test_no_stats(self):
+        self.search_args()
+        mock_print_stats = self.mocker.patch("censys.cli.print_stats")
+
+        with contextlib.redirect_stdout(StringIO()):
+            cli_main()
+
+        mock_print_stats.assert_not_called()
+
+    def test_print_stats(self):
+        temp_stderr = StringIO()
+        self.mocker.patch(
+            "censys.cli.utils.err_console", Console(file=temp_stderr, width=100)
+        )
+
+        print_stats(
+            {
+                "requests": 3,
+                "wire_bytes": 100,
+                "body_bytes": 400,
+                "compression_ratio": 4.0,
+                "retries": 1,
+                "latency": {"p50": 0.1, "p90": 0.2, "p99": 0.25, "max": None},
+                "phases": {"network": 0.5, "render": 0.01},
+            }
+        )
+
+        stderr = temp_stderr.getvalue()
+        assert "Requests" in stderr
+        assert "Latency p99" in stderr
+        assert "250.0 ms" in stderr
+        assert "Time in render" in stderr
+
+    def test_profile(self):
+        with tempfile.TemporaryDirectory() as directory:
+            profile_path = os.path.join(directory, "search.prof")
+            self.search_args("--profile", profile_path)
+
+            with contextlib.redirect_stdout(StringIO()):
+                cli_main()
+
+            profile = pstats.Stats(profile_path)
+            assert any(
+                function == "cli_search" for _, _, function in profile.stats  # type: ignore[attr-defined]
+            )
@@ -1,7 +1,10 @@
 import contextlib
+import json
+import threading
 from io import StringIO
 from typing import Set
 
+import pytest
 import responses
 from parameterized import parameterized
 
@@ -78,3 +81,122 @@ class CensysCliSubdomainsTest(CensysTestCase):
         mock_cli_response = temp_stdout.getvalue().strip()
         for line in mock_cli_response.split("\n"):
             assert "censys.io" in line
+
+
+def test_domain_trie():
+    trie = subdomains.DomainTrie(["censys.io", "search.censys.io", "github.com"])
+
+    assert trie.match("censys.io") == ["censys.io"]
+    assert trie.match("app.search.censys.io.") == ["censys.io", "search.censys.io"]
+    assert trie.match("*.CENSYS.io") == ["censys.io"]
+    assert trie.match("notcensys.io") == []
+    assert trie.match("io") == []
+
+
+class CensysCliSubdomainsBulkTest(CensysTestCase):
+    def add_search(self, domain: str, names: list, status: int = 200):
+        self.responses.add(
+            responses.POST,
+            V2_URL + "/certificates/search",
+            status=status,
+            json=(
+                {
+                    "result": {
+                        "total": 1,
+                        "hits": [{"names": names}],
+                        "links": {},
+                    },
+                }
+                if status == 200
+                else {"code": status, "status": "Bad Request", "error": "Bad query"}
+            ),
+            match=[
+                responses.matchers.json_params_matcher(
+                    {"per_page": 100, "q": f"names: {domain}"}
+                )
+            ],
+        )
+
+    def test_subdomains_from_stdin(self):
+        self.add_search("censys.io", ["censys.io", "app.censys.io", "fast.github.com"])
+        self.add_search("github.com", ["api.github.com"])
+        self.mocker.patch("sys.stdin", StringIO("censys.io\n# comment\n\ngithub.com\n"))
+        self.mocker.patch(
+            "argparse._sys.argv",
+            ["censys", "subdomains", "-i", "-", "--json", "--workers", "1"]
+            + CensysTestCase.cli_args,
+        )
+
+        temp_stdout = StringIO()
+        with contextlib.redirect_stdout(temp_stdout):
+            cli_main()
+
+        lines = [json.loads(line) for line in temp_stdout.getvalue().splitlines()]
+        assert lines == [
+            {"domain": "censys.io", "subdomain": "app.censys.io"},
+            {"domain": "censys.io", "subdomain": "censys.io"},
+            # Names of other queries are attributed to every matching domain
+            {"domain": "github.com", "subdomain": "fast.github.com"},
+            {"domain": "github.com", "subdomain": "api.github.com"},
+        ]
+
+    def test_subdomains_from_file_with_error(self):
+        self.add_search("censys.io", ["app.censys.io", "www.github.com"])
+        self.add_search("github.com", [], status=400)
+        input_file = self.mocker.mock_open(read_data="censys.io\ngithub.com\n")
+        self.mocker.patch("builtins.open", input_file)
+        self.mocker.patch(
+            "argparse._sys.argv",
+            ["censys", "subdomains", "-i", "domains.txt", "--json"]
+            + CensysTestCase.cli_args,
+        )
+
+        temp_stdout = StringIO()
+        with contextlib.redirect_stdout(temp_stdout), pytest.raises(
+            SystemExit, match="1"
+        ):
+            cli_main()
+
+        lines = [json.loads(line) for line in temp_stdout.getvalue().splitlines()]
+        assert {"domain": "censys.io", "subdomain": "app.censys.io"} in lines
+        assert {
+            "domain": "github.com",
+            "error": "400 (Bad Request): Bad query",
+        } in lines
+        # Names found by other queries are reported as partial results
+        assert lines[-1] == {
+            "domain": "github.com",
+            "partial": True,
+            "subdomains": ["www.github.com"],
+        }
+
+    def test_subdomains_completed_out_of_order(self):
+        censys_done = threading.Event()
+
+        def query(client, domain, pages):
+            if domain == "github.com":
+                # Finishes after the query of censys.io
+                assert censys_done.wait(5)
+                return {"fast.github.com", "late.censys.io"}
+            censys_done.set()
+            return {"censys.io"}
+
+        self.mocker.patch.object(subdomains, "query_certificate_names", query)
+        self.mocker.patch("sys.stdin", StringIO("github.com\ncensys.io\n"))
+        self.mocker.patch(
+            "argparse._sys.argv",
+            ["censys", "subdomains", "-i", "-", "--json", "--workers", "2"]
+            + CensysTestCase.cli_args,
+        )
+
+        temp_stdout = StringIO()
+        with contextlib.redirect_stdout(temp_stdout):
+            cli_main()
+
+        lines = [json.loads(line) for line in temp_stdout.getvalue().splitlines()]
+        # Names found by a later query are streamed for the earlier domain too
+        assert lines == [
+            {"domain": "censys.io", "subdomain": "censys.io"},
+            {"domain": "github.com", "subdomain": "fast.github.com"},
+            {"domain": "censys.io", "subdomain": "late.censys.io"},
+        ]
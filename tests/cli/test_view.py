@@ -8,13 +8,16 @@ import pytest
 import responses
 
 from tests.cli.test_search import WROTE_PREFIX
-from tests.search.v2.test_certs import VIEW_CERT_JSON
+from tests.search.v2.test_certs import BULK_VIEW_CERTS_JSON, VIEW_CERT_JSON
 from tests.search.v2.test_hosts import VIEW_HOST_JSON
 from tests.utils import V2_URL, CensysTestCase
 
 from censys.cli import main as cli_main
 from censys.common.exceptions import CensysCLIException, CensysException
 
+TEST_CERT = BULK_VIEW_CERTS_JSON["result"][0]["fingerprint_sha256"]
+MISSING_CERT = "0" * 64
+
 
 class CensysCliViewTest(CensysTestCase):
     def test_search_help(self):
@@ -319,6 +322,25 @@ class CensysCliViewTest(CensysTestCase):
         # Cleanup
         os.remove(json_path)
 
+    def test_non_hex_fingerprint_uses_certs(self):
+        # Mock
+        document_id = "z" * 64
+        self.patch_args(["censys", "view", document_id], search_auth=True)
+        self.responses.add(
+            responses.GET,
+            V2_URL + f"/certificates/{document_id}",
+            status=200,
+            json=VIEW_CERT_JSON,
+        )
+
+        temp_stdout = StringIO()
+        # Actual call
+        with contextlib.redirect_stdout(temp_stdout):
+            cli_main()
+
+        # Assertions
+        assert len(self.responses.calls) == 1
+
     def test_incorrect_ip_address(self):
         # Mock
         self.patch_args(
@@ -345,3 +367,83 @@ class CensysCliViewTest(CensysTestCase):
             cli_main()
         # Assertions
         mock_open.assert_called_with("https://search.censys.io/hosts/8.8.8.8")
+
+    def test_view_input_file(self):
+        # Mock
+        self.patch_args(
+            ["censys", "view", "--input-file", "-", "--chunk-size", "2"],
+            search_auth=True,
+        )
+        self.mocker.patch(
+            "sys.stdin",
+            StringIO(
+                "\n".join(
+                    [
+                        "8.8.8.8",
+                        TEST_CERT.upper(),
+                        "8.8.8.8",
+                        "1.1.1.1",
+                        MISSING_CERT,
+                        "not-a-document",
+                    ]
+                )
+            ),
+        )
+        self.responses.add(
+            responses.GET,
+            V2_URL + "/hosts/8.8.8.8",
+            status=200,
+            json=VIEW_HOST_JSON,
+        )
+        self.responses.add(
+            responses.GET,
+            V2_URL + "/hosts/1.1.1.1",
+            status=404,
+            json={"code": 404, "status": "Not Found", "error": "Host not found"},
+        )
+        self.responses.add(
+            responses.POST,
+            V2_URL + "/certificates/bulk",
+            status=200,
+            json=BULK_VIEW_CERTS_JSON,
+            match=[
+                responses.matchers.json_params_matcher(
+                    {"fingerprints": [TEST_CERT, MISSING_CERT]}
+                )
+            ],
+        )
+
+        temp_stdout = StringIO()
+        # Actual call
+        with contextlib.redirect_stdout(temp_stdout), pytest.raises(
+            SystemExit, match="1"
+        ):
+            cli_main()
+
+        # Assertions
+        lines = {
+            line["document_id"]: line
+            for line in map(json.loads, temp_stdout.getvalue().splitlines())
+        }
+        assert len(lines) == 5
+        assert lines["8.8.8.8"]["result"] == VIEW_HOST_JSON["result"]
+        assert lines[TEST_CERT] == {
+            "document_id": TEST_CERT,
+            "index": "certificates",
+            "result": BULK_VIEW_CERTS_JSON["result"][0],
+        }
+        assert lines[MISSING_CERT]["error"] == "Certificate not found"
+        assert lines["1.1.1.1"]["error"] == "404 (Not Found): Host not found"
+        assert lines["not-a-document"]["index"] is None
+        assert "Invalid document ID" in lines["not-a-document"]["error"]
+
+    def test_view_input_file_open(self):
+        # Mock
+        self.patch_args(
+            ["censys", "view", "--input-file", "ids.txt", "--open"],
+            search_auth=True,
+        )
+
+        # Actual call
+        with pytest.raises(CensysCLIException, match="--open"):
+            cli_main()
@@ -217,6 +217,16 @@ class TestCerts(CensysTestCase):
         result = self.api.view(TEST_CERT)
         assert result == VIEW_CERT_JSON["result"]
 
+    def test_view_fields(self):
+        self.responses.add(
+            responses.GET,
+            f"{V2_URL}/certificates/{TEST_CERT}",
+            status=200,
+            json=VIEW_CERT_JSON,
+        )
+        result = self.api.view(TEST_CERT, fields=["parsed.issuer.common_name"])
+        assert result == {"parsed": {"issuer": {"common_name": ["R3"]}}}
+
     @parameterized.expand(
         [
             ("bulk_post"),
@@ -235,6 +245,32 @@ class TestCerts(CensysTestCase):
         result = method([TEST_CERT, ALTERNATE_CERT])
         assert result == BULK_VIEW_CERTS_JSON["result"]
 
+    @parameterized.expand(
+        [
+            ("bulk_post"),
+            ("bulk"),
+            ("bulk_view"),
+        ]
+    )
+    def test_bulk_post_fields(self, method_name: str):
+        self.responses.add(
+            responses.POST,
+            f"{V2_URL}/certificates/bulk",
+            status=200,
+            json=BULK_VIEW_CERTS_JSON,
+        )
+        method = getattr(self.api, method_name)
+        result = method(
+            [TEST_CERT, ALTERNATE_CERT],
+            fields=["fingerprint_sha256", "parsed.subject_dn"],
+        )
+        assert result == [
+            {
+                "fingerprint_sha256": EXAMPLE_CERT_JSON["fingerprint_sha256"],
+                "parsed": {"subject_dn": "CN=www.kgcontracting.co"},
+            }
+        ]
+
     def test_bulk_get(self):
         certs = [TEST_CERT, ALTERNATE_CERT]
         params = {"fingerprints": certs}
@@ -441,3 +477,67 @@ class TestCerts(CensysTestCase):
             end_time=datetime(2024, 10, 17, 18, 13, 23, 554000),
         )
         assert result == OBSERVATIONS_CERT_JSON["result"]
+
+    def add_observations_page(self, fingerprint, params, observations, cursor=None):
+        self.responses.add(
+            responses.GET,
+            f"{V2_URL}/certificates/{fingerprint}/observations",
+            status=200,
+            json={
+                "code": 200,
+                "status": "OK",
+                "result": {
+                    "fingerprint": fingerprint,
+                    "observations": observations,
+                    "links": {"next": cursor},
+                },
+            },
+            match=[matchers.query_param_matcher({"per_page": "50", **params})],
+        )
+
+    def test_iter_observations(self):
+        self.add_observations_page(TEST_CERT, {}, [{"port": 443}], "nextCursorToken")
+        self.add_observations_page(
+            TEST_CERT, {"cursor": "nextCursorToken"}, [{"port": 8443}]
+        )
+
+        results = list(self.api.iter_observations(TEST_CERT))
+
+        assert results == [{"port": 443}, {"port": 8443}]
+
+    def test_iter_observations_windows(self):
+        for port, start, end in [
+            (443, "2024-10-14T00", "2024-10-15T12"),
+            (8443, "2024-10-15T12", "2024-10-17T00"),
+        ]:
+            self.add_observations_page(
+                TEST_CERT,
+                {
+                    "start_time": f"{start}:00:00.000000Z",
+                    "end_time": f"{end}:00:00.000000Z",
+                },
+                [{"port": port}],
+            )
+
+        results = list(
+            self.api.iter_observations(
+                TEST_CERT,
+                start_time="2024-10-14T00:00:00Z",
+                end_time="2024-10-17T00:00:00Z",
+                windows=2,
+            )
+        )
+
+        assert results == [{"port": 443}, {"port": 8443}]
+
+    def test_bulk_observations(self):
+        other_cert = "a" * 64
+        self.add_observations_page(TEST_CERT, {}, [{"port": 443}])
+        self.add_observations_page(other_cert, {}, [{"port": 8443}])
+
+        results = list(self.api.bulk_observations([TEST_CERT, other_cert]))
+
+        assert sorted(results, key=lambda result: result[1]["port"]) == [
+            (TEST_CERT, {"port": 443}),
+            (other_cert, {"port": 8443}),
+        ]
@@ -116,3 +116,29 @@ class CensysCommentsTests(CensysTestCase):
         )
         results = self.api.update_comment(self.document_id, "comment-id", TEST_COMMENT)
         assert results == {"code": 200, "status": "OK"}
+
+    def test_bulk_add_comment(self):
+        self.responses.add(
+            responses.POST,
+            f"{V2_URL}/{self.index}/{self.document_id}/comments",
+            status=200,
+            json=ADD_COMMENTS_RESPONSE,
+            match=[responses.json_params_matcher({"contents": TEST_COMMENT})],
+        )
+        self.responses.add(
+            responses.POST,
+            f"{V2_URL}/{self.index}/missing/comments",
+            status=429,
+            json={"code": 429, "status": "Too Many Requests", "error": "Slow down"},
+        )
+
+        self.api.max_retries = 1
+
+        results = dict(
+            self.api.bulk_add_comment(
+                [self.document_id, "missing"], TEST_COMMENT, rate_limit=100
+            )
+        )
+
+        assert results[self.document_id] == ADD_COMMENTS_RESPONSE["result"]
+        assert "Slow down" in results["missing"]["error"]
@@ -0,0 +1,127 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import responses
+from responses import matchers
+
+from tests.utils import V2_URL, CensysTestCase
+
+from censys.search import CensysCerts, CertificateJoin
+
+CERT_A = "a" * 64
+CERT_B = "b" * 64
+CERT_C = "c" * 64
+MISSING_CERT = "0" * 64
+
+
+def host(ip: str, *fingerprints: str) -> dict:
+    return {
+        "ip": ip,
+        "services": [
+            {"port": 443 + index, "certificate": fingerprint}
+            for index, fingerprint in enumerate(fingerprints)
+        ]
+        + [{"port": 22}],
+    }
+
+
+def cert(fingerprint: str) -> dict:
+    return {"fingerprint_sha256": fingerprint, "parsed": {"subject_dn": fingerprint}}
+
+
+class TestCertificateJoin(CensysTestCase):
+    def setUp(self):
+        super().setUp()
+        self.setUpApi(CensysCerts(self.api_id, self.api_secret))
+
+    def add_bulk(self, fingerprints: list, found: list, status: int = 200):
+        self.responses.add(
+            responses.POST,
+            f"{V2_URL}/certificates/bulk",
+            status=status,
+            json=(
+                {"code": 200, "status": "OK", "result": [cert(f) for f in found]}
+                if status == 200
+                else {"code": status, "status": "Bad Request", "error": "Bad input"}
+            ),
+            match=[matchers.json_params_matcher({"fingerprints": fingerprints})],
+        )
+
+    def test_join(self):
+        self.add_bulk([CERT_A, CERT_B], [CERT_A, CERT_B])
+        self.add_bulk([CERT_C, MISSING_CERT], [CERT_C])
+        hosts = [
+            host("1.1.1.1", CERT_A),
+            host("1.0.0.1", CERT_A, CERT_B),
+            host("8.8.8.8"),
+            host("8.8.4.4", CERT_C, MISSING_CERT),
+            host("9.9.9.9", CERT_B, CERT_C),
+        ]
+        join = CertificateJoin(self.api, batch_size=2, max_workers=1)
+        results = list(join.join(hosts))
+
+        assert [result["ip"] for result in results] == [h["ip"] for h in hosts]
+        assert results[1]["services"][0]["certificate_details"] == cert(CERT_A)
+        assert results[1]["services"][1]["certificate_details"] == cert(CERT_B)
+        assert "certificate_details" not in results[1]["services"][2]
+        assert "certificate_details" not in results[3]["services"][1]
+        assert results[4]["services"][1]["certificate_details"] == cert(CERT_C)
+        # Inputs are not modified
+        assert "certificate_details" not in hosts[0]["services"][0]
+        assert join.requests == 2
+        assert join.fetched == 4
+        assert join.cache_hits == 3
+
+    def test_join_cache(self):
+        self.add_bulk([CERT_A], [CERT_A])
+        join = CertificateJoin(self.api, cache_size=1)
+
+        list(join.join([host("1.1.1.1", CERT_A)]))
+        results = list(join.join([host("1.0.0.1", CERT_A)]))
+
+        assert results[0]["services"][0]["certificate_details"] == cert(CERT_A)
+        assert len(self.responses.calls) == 1
+
+    def test_join_fields(self):
+        self.add_bulk([CERT_A], [CERT_A])
+        join = CertificateJoin(self.api, fields=["parsed.subject_dn"])
+
+        results = list(join.join([host("1.1.1.1", CERT_A)]))
+
+        assert results[0]["services"][0]["certificate_details"] == {
+            "parsed": {"subject_dn": CERT_A}
+        }
+
+    def test_join_error(self):
+        self.add_bulk([CERT_A], [], status=400)
+        join = CertificateJoin(self.api)
+
+        results = list(join.join([host("1.1.1.1", CERT_A)]))
+
+        assert results[0]["services"][0]["certificate_details"] == {
+            "error": "400 (Bad Request): Bad input"
+        }
+        assert join.cache == {}
+
+    def test_join_shared_executor(self):
+        self.add_bulk([CERT_A], [CERT_A])
+        with ThreadPoolExecutor(2) as executor:
+            self.api.executor = executor
+            submit = self.mocker.spy(executor, "submit")
+            join = CertificateJoin(self.api)
+
+            results = list(join.join([host("1.1.1.1", CERT_A)]))
+
+        assert results[0]["services"][0]["certificate_details"] == cert(CERT_A)
+        assert submit.call_count == 1
+
+    def test_join_partial_batch(self):
+        self.add_bulk([CERT_A], [CERT_A])
+        join = CertificateJoin(self.api, batch_size=2)
+        emitted = []
+
+        for result in join.join([host("1.1.1.1", CERT_A), host("8.8.8.8")]):
+            # The partial batch is sent once enough hosts are waiting
+            emitted.append(result["ip"])
+
+        assert emitted == ["1.1.1.1", "8.8.8.8"]
+        assert join.requests == 1
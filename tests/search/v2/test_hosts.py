@@ -1,5 +1,6 @@
 import datetime
 import json
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from typing import Any, Dict, List, Optional
 
@@ -211,6 +212,53 @@ class TestHosts(CensysTestCase):
 
         assert res == VIEW_HOST_JSON["result"]
 
+    def test_view_fields(self):
+        self.responses.add(
+            responses.GET,
+            f"{V2_URL}/hosts/{TEST_HOST}",
+            status=200,
+            json=VIEW_HOST_JSON,
+        )
+
+        res = self.api.view(TEST_HOST, fields=["ip", "services.port", "location"])
+
+        assert res == {
+            "ip": "8.8.8.8",
+            "services": [{"port": 53}],
+            "location": VIEW_HOST_JSON["result"]["location"],
+        }
+
+    def test_bulk_view_fields(self):
+        ips = ["1.1.1.1", "1.1.1.2"]
+        for ip in ips:
+            host_json = deepcopy(VIEW_HOST_JSON)
+            host_json["result"]["ip"] = ip
+            self.responses.add(
+                responses.GET,
+                f"{V2_URL}/hosts/{ip}",
+                status=200,
+                json=host_json,
+            )
+
+        results = self.api.bulk_view(ips, fields=["ip", "services.service_name"])
+
+        assert results == {
+            ip: {"ip": ip, "services": [{"service_name": "DNS"}]} for ip in ips
+        }
+
+    def test_view_lazy(self):
+        self.responses.add(
+            responses.GET,
+            f"{V2_URL}/hosts/{TEST_HOST}",
+            status=200,
+            json=VIEW_HOST_JSON,
+        )
+
+        res = self.api.view_lazy(TEST_HOST)
+
+        assert res.to_dict() == VIEW_HOST_JSON["result"]
+        assert res.get_field("services.port") == [53]
+
     def test_bulk_view(self):
         ips = ["1.1.1.1", "1.1.1.2", "1.1.1.3"]
         expected = {}
@@ -344,6 +392,21 @@ class TestHosts(CensysTestCase):
         )
         assert next(query) == SEARCH_HOSTS_JSON["result"]["hits"]
 
+    def test_search_lazy_documents(self):
+        self.responses.add(
+            responses.POST,
+            f"{V2_URL}/hosts/search",
+            status=200,
+            json=SEARCH_HOSTS_JSON,
+        )
+        query = self.api.search(TEST_SEARCH_QUERY)
+
+        documents = list(query.lazy_documents())
+
+        assert [document.to_dict() for document in documents] == SEARCH_HOSTS_JSON[
+            "result"
+        ]["hits"]
+
     def test_search_per_page(self):
         test_per_page = 50
         self.responses.add(
@@ -886,3 +949,113 @@ class TestHosts(CensysTestCase):
         )
         results = self.api.view_host_certificates(TEST_HOST, **kwargs)
         assert results == VIEW_HOST_EVENTS_JSON["result"]
+
+    def add_events_page(self, ip, params, events, next_cursor=None):
+        self.responses.add(
+            responses.GET,
+            f"{V2_URL}/experimental/hosts/{ip}/events",
+            status=200,
+            json={
+                "code": 200,
+                "status": "OK",
+                "result": {
+                    "ip": ip,
+                    "events": events,
+                    "links": {"next": next_cursor},
+                },
+            },
+            match=[matchers.query_param_matcher(params)],
+        )
+
+    def test_iter_host_events(self):
+        self.add_events_page(TEST_HOST, {}, [{"id": 1}], "nextCursor")
+        self.add_events_page(TEST_HOST, {"cursor": "nextCursor"}, [{"id": 2}])
+
+        results = list(self.api.iter_host_events(TEST_HOST))
+
+        assert results == [{"id": 1}, {"id": 2}]
+
+    @parameterized.expand([(False, [1, 2]), (True, [2, 1])])
+    def test_iter_host_events_windows(self, reversed: bool, expected: List[int]):
+        reversed_params = {"reversed": "True"} if reversed else {}
+        for event_id, start, end in [
+            (1, "2021-01-01", "2021-01-02"),
+            (2, "2021-01-02", "2021-01-03"),
+        ]:
+            self.add_events_page(
+                TEST_HOST,
+                {
+                    "start_time": f"{start}T00:00:00.000000Z",
+                    "end_time": f"{end}T00:00:00.000000Z",
+                    **reversed_params,
+                },
+                [{"id": event_id}],
+            )
+
+        results = self.api.iter_host_events(
+            TEST_HOST,
+            start_time="2021-01-01",
+            end_time="2021-01-03",
+            reversed=reversed or None,
+            windows=2,
+        )
+
+        assert [event["id"] for event in results] == expected
+
+    def test_iter_host_events_windows_requires_start_time(self):
+        with pytest.raises(ValueError, match="A start time is required"):
+            list(self.api.iter_host_events(TEST_HOST, windows=2))
+
+    def test_bulk_host_events(self):
+        self.add_events_page(TEST_HOST, {}, [{"id": 1}, {"id": 2}])
+        self.responses.add(
+            responses.GET,
+            f"{V2_URL}/experimental/hosts/1.1.1.1/events",
+            status=404,
+            json={"code": 404, "status": "Not Found", "error": "Host not found"},
+        )
+
+        results = list(self.api.bulk_host_events([TEST_HOST, "1.1.1.1"]))
+
+        assert [(ip, event["id"]) for ip, event in results if ip == TEST_HOST] == [
+            (TEST_HOST, 1),
+            (TEST_HOST, 2),
+        ]
+        assert ("1.1.1.1", {"error": "404 (Not Found): Host not found"}) in results
+
+    def test_bulk_host_events_shared_executor(self):
+        self.add_events_page(TEST_HOST, {}, [{"id": 1}])
+        with ThreadPoolExecutor(2) as executor:
+            self.api.executor = executor
+            submit = self.mocker.spy(executor, "submit")
+
+            results = list(self.api.bulk_host_events([TEST_HOST]))
+
+        assert results == [(TEST_HOST, {"id": 1})]
+        assert submit.call_count == 1
+
+    def test_iter_host_certificates(self):
+        for cursor, next_cursor in [(None, "nextCursor"), ("nextCursor", None)]:
+            params = {"per_page": "100"}
+            if cursor:
+                params["cursor"] = cursor
+            self.responses.add(
+                responses.GET,
+                f"{V2_URL}/hosts/{TEST_HOST}/certificates",
+                status=200,
+                json={
+                    "code": 200,
+                    "status": "OK",
+                    "result": {
+                        "certificates": [{"fingerprint": cursor or "first"}],
+                        "links": {"next": next_cursor},
+                    },
+                },
+                match=[matchers.query_param_matcher(params)],
+            )
+
+        results = list(self.api.iter_host_certificates(TEST_HOST))
+        bulk_results = list(self.api.bulk_host_certificates([TEST_HOST]))
+
+        assert [cert["fingerprint"] for cert in results] == ["first", "nextCursor"]
+        assert bulk_results == [(TEST_HOST, cert) for cert in results]
@@ -59,11 +59,21 @@ LIST_CERTS_RESPONSE = {
 
 @parameterized_class(
     [
-        {"index": "hosts", "index_cls": CensysHosts, "document_id": "1.0.0.0"},
+        {
+            "index": "hosts",
+            "index_cls": CensysHosts,
+            "document_id": "1.0.0.0",
+            "tagged_id": "1.1.1.1",
+            "tagged_path": "hosts",
+            "tagged_response": LIST_HOSTS_RESPONSE,
+        },
         {
             "index": "certificates",
             "index_cls": CensysCerts,
             "document_id": "fb444eb8e68437bae06232b9f5091bccff62a768ca09e92eb5c9c2cf9d17c426",
+            "tagged_id": "e58e89a726d80bb0219b218c3ab9d818b4be75d77959508400d660ebe1c1be3d",
+            "tagged_path": "certificates",
+            "tagged_response": LIST_CERTS_RESPONSE,
         },
     ]
 )
@@ -71,6 +81,9 @@ class CensysTagsTests(CensysTestCase):
     index: str
     index_cls: CensysSearchAPIv2
     document_id: str
+    tagged_id: str
+    tagged_path: str
+    tagged_response: dict
     api: CensysSearchAPIv2
 
     def setUp(self):
@@ -189,3 +202,107 @@ class CensysTagsTests(CensysTestCase):
         )
         results = self.api.list_certs_with_tag(TEST_TAG_ID)
         assert results == LIST_CERTS_RESPONSE["result"]["certs"]
+
+    def add_tagged_documents(self):
+        self.responses.add(
+            responses.GET,
+            f"{BASE_URL}{self.api.tags_path}/{TEST_TAG_ID}/{self.tagged_path}",
+            status=200,
+            json=self.tagged_response,
+        )
+
+    def test_bulk_add_tag(self):
+        self.add_tagged_documents()
+        self.responses.add(
+            responses.PUT,
+            f"{BASE_URL}{self.api.view_path}{self.document_id}/tags/{TEST_TAG_ID}",
+            status=200,
+        )
+        self.responses.add(
+            responses.PUT,
+            f"{BASE_URL}{self.api.view_path}missing/tags/{TEST_TAG_ID}",
+            status=404,
+            json={"code": 404, "status": "Not Found", "error": "Not found"},
+        )
+
+        results = dict(
+            self.api.bulk_add_tag(
+                [self.document_id, self.tagged_id, "missing"],
+                TEST_TAG_ID,
+                max_workers=2,
+                rate_limit=100,
+            )
+        )
+
+        assert results == {
+            self.document_id: {"status": "tagged"},
+            self.tagged_id: {"status": "skipped"},
+            "missing": {"error": "404 (Not Found): Not found"},
+        }
+        # Listing the tagged documents, one tag and one failure
+        assert len(self.responses.calls) == 3
+
+    def test_bulk_add_tag_from_query(self):
+        key = "ip" if self.index == "hosts" else "fingerprint_sha256"
+        self.responses.add(
+            responses.POST,
+            f"{BASE_URL}{self.api.search_path}",
+            status=200,
+            json={
+                "code": 200,
+                "status": "OK",
+                "result": {
+                    "total": 1,
+                    "hits": [{key: self.document_id}],
+                    "links": {"next": ""},
+                },
+            },
+        )
+        self.responses.add(
+            responses.PUT,
+            f"{BASE_URL}{self.api.view_path}{self.document_id}/tags/{TEST_TAG_ID}",
+            status=200,
+        )
+
+        results = list(
+            self.api.bulk_add_tag(
+                self.api.search("test", pages=-1), TEST_TAG_ID, skip_tagged=False
+            )
+        )
+
+        assert results == [(self.document_id, {"status": "tagged"})]
+
+    def test_bulk_remove_tag(self):
+        self.add_tagged_documents()
+        self.responses.add(
+            responses.DELETE,
+            f"{BASE_URL}{self.api.view_path}{self.tagged_id}/tags/{TEST_TAG_ID}",
+            status=200,
+        )
+
+        results = dict(
+            self.api.bulk_remove_tag(
+                [self.document_id, self.tagged_id], TEST_TAG_ID, rate_limit=100
+            )
+        )
+
+        assert results == {
+            self.document_id: {"status": "skipped"},
+            self.tagged_id: {"status": "untagged"},
+        }
+        # Listing the tagged documents and one untag
+        assert len(self.responses.calls) == 2
+
+    def test_bulk_list_tags_on_documents(self):
+        self.responses.add(
+            responses.GET,
+            BASE_URL + self.api.view_path + self.document_id + "/tags",
+            status=200,
+            json=LIST_TAGS_RESPONSE,
+        )
+
+        results = list(self.api.bulk_list_tags_on_documents([self.document_id]))
+
+        assert results == [
+            (self.document_id, {"tags": LIST_TAGS_RESPONSE["result"]["tags"]})
+        ]
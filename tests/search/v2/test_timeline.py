@@ -0,0 +1,166 @@
+import datetime
+
+import pytest
+import responses
+
+from tests.utils import V2_URL, CensysTestCase
+
+from censys.common.exceptions import CensysInternalServerException
+from censys.search import CensysHosts, HostTimeline
+from censys.search.v2.timeline import content_hash, diff_hosts
+
+TEST_HOST = "8.8.8.8"
+
+DNS_SERVICE = {
+    "port": 53,
+    "transport_protocol": "UDP",
+    "service_name": "DNS",
+    "observed_at": "2021-04-01T13:40:03.755876935Z",
+    "dns": {"server_type": "FORWARDING"},
+}
+HTTP_SERVICE = {
+    "port": 80,
+    "transport_protocol": "TCP",
+    "service_name": "HTTP",
+    "observed_at": "2021-04-01T13:40:03.755876935Z",
+}
+
+
+def host(*services: dict, observed_at: str = "2021-04-01T00:00:00Z") -> dict:
+    return {
+        "ip": TEST_HOST,
+        "last_updated_at": observed_at,
+        "services": [dict(service, observed_at=observed_at) for service in services],
+    }
+
+
+class TestDiffHosts:
+    def test_identical_hosts(self):
+        a = host(DNS_SERVICE, observed_at="2021-01-01T00:00:00Z")
+        b = host(DNS_SERVICE, observed_at="2021-02-01T00:00:00Z")
+
+        assert content_hash(a) == content_hash(b)
+        assert diff_hosts(a, b) == {
+            "services_added": [],
+            "services_removed": [],
+            "services_changed": [],
+            "fields_changed": {},
+        }
+
+    def test_services(self):
+        changed = dict(DNS_SERVICE, dns={"server_type": "RECURSIVE_RESOLVER"})
+
+        diff = diff_hosts(host(DNS_SERVICE), host(changed, HTTP_SERVICE))
+
+        assert content_hash(host(DNS_SERVICE)) != content_hash(host(changed))
+        assert [s["port"] for s in diff["services_added"]] == [80]
+        assert diff["services_removed"] == []
+        assert diff["services_changed"] == [
+            {
+                "port": 53,
+                "transport_protocol": "UDP",
+                "changes": {
+                    "dns.server_type": {
+                        "before": "FORWARDING",
+                        "after": "RECURSIVE_RESOLVER",
+                    }
+                },
+            }
+        ]
+
+    def test_fields(self):
+        a = dict(host(), location={"country": "US"})
+        b = dict(host(), autonomous_system={"asn": 15169})
+
+        assert diff_hosts(a, b)["fields_changed"] == {
+            "autonomous_system.asn": {"before": None, "after": 15169},
+            "location.country": {"before": "US", "after": None},
+        }
+
+    def test_missing_host(self):
+        diff = diff_hosts(None, host(DNS_SERVICE))
+
+        assert [s["port"] for s in diff["services_added"]] == [53]
+        assert diff["fields_changed"] == {"ip": {"before": None, "after": TEST_HOST}}
+
+
+class TestHostTimeline(CensysTestCase):
+    def setUp(self):
+        super().setUp()
+        self.setUpApi(CensysHosts(self.api_id, self.api_secret))
+        self.timeline = HostTimeline(self.api, cache={})
+
+    def add_snapshot(self, date: str, result: dict, status: int = 200):
+        self.responses.add(
+            responses.GET,
+            f"{V2_URL}/hosts/{TEST_HOST}?at_time={date}T00:00:00.000000Z",
+            status=status,
+            json={"code": status, "status": "OK", "result": result},
+        )
+
+    def test_timeline(self):
+        self.responses.add(
+            responses.GET,
+            f"{V2_URL}/hosts/{TEST_HOST}?at_time=2021-01-01T00:00:00.000000Z",
+            status=404,
+            json={"code": 404, "status": "Not Found", "error": "Host not found"},
+        )
+        self.add_snapshot("2021-02-01", host(DNS_SERVICE, observed_at="2021-02-01"))
+        self.add_snapshot("2021-03-01", host(DNS_SERVICE, observed_at="2021-03-01"))
+        self.add_snapshot("2021-04-01", host(HTTP_SERVICE))
+        times = [
+            datetime.date(2021, 4, 1),
+            "2021-02-01T00:00:00Z",
+            datetime.date(2021, 1, 1),
+            datetime.datetime(2021, 3, 1),
+        ]
+
+        entries = self.timeline.timeline(TEST_HOST, times, max_workers=2)
+
+        assert [(e["start"], e["end"]) for e in entries] == [
+            ("2021-01-01T00:00:00.000000Z", "2021-01-01T00:00:00.000000Z"),
+            ("2021-02-01T00:00:00.000000Z", "2021-03-01T00:00:00.000000Z"),
+            ("2021-04-01T00:00:00.000000Z", "2021-04-01T00:00:00.000000Z"),
+        ]
+        assert entries[0]["host"] is None
+        assert len(self.timeline.cache) == 4
+
+    def test_changes_use_cache(self):
+        self.add_snapshot("2021-02-01", host(DNS_SERVICE))
+        self.add_snapshot("2021-03-01", host(DNS_SERVICE, HTTP_SERVICE))
+        times = ["2021-02-01", "2021-03-01"]
+
+        first = self.timeline.changes(TEST_HOST, times)
+        second = self.timeline.changes(TEST_HOST, times)
+
+        assert first == second
+        assert len(self.responses.calls) == 2
+        assert first[0]["previous"] == "2021-02-01T00:00:00.000000Z"
+        assert first[0]["start"] == "2021-03-01T00:00:00.000000Z"
+        assert [s["port"] for s in first[0]["diff"]["services_added"]] == [80]
+
+    def test_snapshots_are_copies(self):
+        self.add_snapshot("2021-02-01", host(DNS_SERVICE))
+
+        snapshot = self.timeline.snapshots(TEST_HOST, ["2021-02-01"])[0]
+        snapshot["host"]["services"].clear()
+        again = self.timeline.snapshots(TEST_HOST, ["2021-02-01"])[0]
+
+        assert len(self.responses.calls) == 1
+        assert [s["port"] for s in again["host"]["services"]] == [53]
+        assert again["hash"] == snapshot["hash"]
+
+    def test_future_snapshots_not_cached(self):
+        tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+        self.add_snapshot(tomorrow.isoformat(), host(DNS_SERVICE))
+
+        snapshots = self.timeline.snapshots(TEST_HOST, [tomorrow])
+
+        assert len(snapshots) == 1
+        assert self.timeline.cache == {}
+
+    def test_error(self):
+        self.add_snapshot("2021-02-01", {}, status=500)
+
+        with pytest.raises(CensysInternalServerException):
+            self.timeline.snapshots(TEST_HOST, ["2021-02-01"])
@@ -1,4 +1,11 @@
-from .utils import CensysTestCase
+from concurrent.futures import ThreadPoolExecutor
+
+import responses
+
+from .search.v2.test_hosts import VIEW_HOST_JSON
+from .utils import V2_URL, CensysTestCase
+from censys.common.retry import Hedger
+from censys.common.transport import RequestsTransport
 from censys.search import SearchClient
 
 ALL_INDEXES = {
@@ -29,3 +36,55 @@ class CensysSearchClientTest(CensysTestCase):
             for index in indexes:
                 # Assertions
                 assert getattr(v, index)._session.auth == self.expected_auth
+
+    def test_shared_connections_and_executor(self):
+        client = SearchClient(self.api_id, self.api_secret, max_workers=4)
+        indexes = [client.v1.data, client.v2.hosts, client.v2.certs]
+        adapters = {index._session.get_adapter(V2_URL) for index in indexes}
+        assert len(adapters) == 1
+        assert adapters.pop()._pool_maxsize == 4  # type: ignore[attr-defined]
+        assert len({id(index._session) for index in indexes}) == 3
+        for index in indexes:
+            assert index.executor is client.executor
+        assert client.executor._max_workers == 4  # type: ignore[attr-defined]
+        client.close()
+
+    def test_request_id_per_index(self):
+        with SearchClient(self.api_id, self.api_secret) as client:
+            client.v2.hosts.request_id = "hosts-job"
+
+            assert client.v2.hosts.request_id == "hosts-job"
+            assert client.v2.certs.request_id is None
+            assert client.v1.data.request_id is None
+
+    def test_close_closes_hedger(self):
+        hedger = Hedger()
+        close = self.mocker.spy(hedger, "close")
+        with SearchClient(self.api_id, self.api_secret, hedger=hedger) as client:
+            assert client.v2.hosts.hedger is hedger
+        close.assert_called_once_with()
+
+    def test_bulk_view_reuses_executor(self):
+        self.responses.add(
+            responses.GET, f"{V2_URL}/hosts/1.1.1.1", status=200, json=VIEW_HOST_JSON
+        )
+        with SearchClient(self.api_id, self.api_secret) as client:
+            submit = self.mocker.spy(client.executor, "submit")
+            for _ in range(2):
+                results = client.v2.hosts.bulk_view(["1.1.1.1"])
+                assert results == {"1.1.1.1": VIEW_HOST_JSON["result"]}
+            assert submit.call_count == 2
+
+        assert client.executor._shutdown  # type: ignore[attr-defined]
+
+    def test_close_keeps_resources_passed_in(self):
+        transport = RequestsTransport()
+        close = self.mocker.spy(transport, "close")
+        with ThreadPoolExecutor(2) as executor:
+            with SearchClient(
+                self.api_id, self.api_secret, transport=transport, executor=executor
+            ) as client:
+                assert client.v2.hosts.executor is executor
+                assert client.v2.hosts._transport is transport
+            assert executor.submit(lambda: 1).result() == 1
+        close.assert_not_called()
@@ -0,0 +1,165 @@
+import threading
+import unittest
+import unittest.mock
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from censys.common.concurrency import (
+    RateLimiter,
+    bounded_map,
+    chunked,
+    follow_cursor,
+)
+
+
+class ConcurrencyTests(unittest.TestCase):
+    def test_chunked(self):
+        assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(chunked([], 2)) == []
+
+    def test_chunked_invalid_size(self):
+        with pytest.raises(ValueError, match="at least 1"):
+            list(chunked(range(5), 0))
+
+    def test_bounded_map(self):
+        results = {
+            item: future.result()
+            for item, future in bounded_map(lambda x: x * 2, range(10), max_workers=3)
+        }
+        assert results == {item: item * 2 for item in range(10)}
+
+    def test_bounded_map_reads_lazily(self):
+        read = []
+        release = threading.Event()
+
+        def items():
+            for item in range(100):
+                read.append(item)
+                yield item
+
+        def wait(item):
+            release.wait(5)
+            return item
+
+        results = bounded_map(wait, items(), max_workers=2, max_pending=4)
+        release.set()
+        first, _ = next(results)
+        assert first in range(4)
+        assert len(read) <= 5
+        assert sorted([first] + [item for item, _ in results]) == list(range(100))
+
+    def test_bounded_map_shared_executor(self):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def track(item):
+            with lock:
+                running.append(item)
+                peak.append(len(running))
+            threading.Event().wait(0.01)
+            with lock:
+                running.remove(item)
+            return threading.current_thread().name
+
+        with ThreadPoolExecutor(8, thread_name_prefix="shared") as executor:
+            for _ in range(2):
+                names = [
+                    future.result()
+                    for _, future in bounded_map(
+                        track, range(10), max_workers=2, executor=executor
+                    )
+                ]
+                assert all(name.startswith("shared") for name in names)
+            # The shared executor is still running
+            assert executor.submit(lambda: 1).result() == 1
+        assert max(peak) <= 2
+
+    def test_bounded_map_nested_on_shared_executor(self):
+        with ThreadPoolExecutor(1) as executor:
+
+            def outer(item):
+                # Waiting on the only thread of the executor would block
+                return [
+                    future.result()
+                    for _, future in bounded_map(
+                        lambda x: x * item, range(3), executor=executor
+                    )
+                ]
+
+            results = [
+                future.result(timeout=5)
+                for _, future in bounded_map(outer, [1, 2], executor=executor)
+            ]
+        assert sorted(map(sorted, results)) == [[0, 1, 2], [0, 2, 4]]
+
+    def test_bounded_map_errors(self):
+        def fail(item):
+            if item == 2:
+                raise RuntimeError("boom")
+            return item
+
+        errors = []
+        for item, future in bounded_map(fail, range(4)):
+            if future.exception():
+                errors.append((item, str(future.exception())))
+        assert errors == [(2, "boom")]
+
+    def test_follow_cursor(self):
+        pages = {None: ([1, 2], "a"), "a": ([3], "b"), "b": ([], None)}
+        for prefetch in (True, False):
+            assert list(follow_cursor(pages.__getitem__, prefetch=prefetch)) == [
+                1,
+                2,
+                3,
+            ]
+
+    def test_follow_cursor_prefetches_next_page(self):
+        requested = []
+        second_page = threading.Event()
+
+        def fetch_page(cursor):
+            requested.append(cursor)
+            if cursor == "a":
+                second_page.set()
+                return [2], None
+            return [1], "a"
+
+        items = follow_cursor(fetch_page)
+        assert next(items) == 1
+        # The second page is requested before the first one is consumed
+        assert second_page.wait(1)
+        assert list(items) == [2]
+        assert requested == [None, "a"]
+
+    def test_rate_limiter(self):
+        clock = [0.0]
+        sleeps = []
+
+        def sleep(seconds: float):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        with unittest.mock.patch(
+            "time.monotonic", lambda: clock[0]
+        ), unittest.mock.patch("time.sleep", sleep):
+            limiter = RateLimiter(2, burst=1)
+            limiter.acquire()
+            limiter.acquire()
+            assert sleeps == [0.5]
+
+            limiter.slow_down()
+            assert limiter.rate == 1
+            limiter.acquire()
+            assert sleeps == [0.5, 1.0]
+
+            limiter.speed_up()
+            assert limiter.rate == 1.2
+            for _ in range(10):
+                limiter.speed_up()
+            assert limiter.rate == 2
+
+    def test_rate_limiter_invalid_rate(self):
+        with pytest.raises(ValueError, match="positive"):
+            RateLimiter(0)
@@ -0,0 +1,139 @@
+import json
+
+import responses
+from responses import matchers
+
+from .utils import CensysTestCase
+from censys.common.base import CensysAPIBase
+from censys.common.conditional import ConditionalCache
+
+TEST_URL = "https://url"
+TEST_ENDPOINT = "/v2/metadata/hosts"
+TEST_BODY = {"result": {"services": ["HTTP", "SSH"]}}
+TEST_ETAG = '"abc123"'
+TEST_LAST_MODIFIED = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+
+class ConditionalCacheTests(CensysTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = ConditionalCache()
+        self.base = CensysAPIBase(TEST_URL, conditional_cache=self.cache)
+
+    def test_revalidates_stored_response(self):
+        self.responses.add(
+            responses.GET,
+            TEST_URL + TEST_ENDPOINT,
+            json=TEST_BODY,
+            headers={"ETag": TEST_ETAG, "Last-Modified": TEST_LAST_MODIFIED},
+        )
+        self.responses.add(
+            responses.GET,
+            TEST_URL + TEST_ENDPOINT,
+            status=304,
+            match=[
+                matchers.header_matcher(
+                    {
+                        "If-None-Match": TEST_ETAG,
+                        "If-Modified-Since": TEST_LAST_MODIFIED,
+                    }
+                )
+            ],
+        )
+
+        first = self.base._get(TEST_ENDPOINT)
+        second = self.base._get(TEST_ENDPOINT)
+
+        assert first == second == TEST_BODY
+        assert self.cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "bytes_saved": len(json.dumps(TEST_BODY)),
+        }
+
+    def test_resends_when_entry_is_gone(self):
+        def respond(request):
+            if "If-None-Match" not in request.headers:
+                return 200, {"ETag": TEST_ETAG}, json.dumps(TEST_BODY)
+            # The entry is removed while the request is in flight
+            self.cache.clear()
+            return 304, {}, ""
+
+        self.responses.add_callback(
+            responses.GET, TEST_URL + TEST_ENDPOINT, callback=respond
+        )
+
+        self.base._get(TEST_ENDPOINT)
+        second = self.base._get(TEST_ENDPOINT)
+
+        assert second == TEST_BODY
+        assert len(self.responses.calls) == 3
+        assert "If-None-Match" in self.responses.calls[1].request.headers
+        assert "If-None-Match" not in self.responses.calls[2].request.headers
+
+    def test_changed_response_is_stored_again(self):
+        new_body = {"result": {"services": ["HTTP"]}}
+        self.responses.add(
+            responses.GET,
+            TEST_URL + TEST_ENDPOINT,
+            json=TEST_BODY,
+            headers={"ETag": TEST_ETAG},
+        )
+        self.responses.add(
+            responses.GET,
+            TEST_URL + TEST_ENDPOINT,
+            json=new_body,
+            headers={"ETag": '"def456"'},
+        )
+
+        self.base._get(TEST_ENDPOINT)
+        res = self.base._get(TEST_ENDPOINT)
+
+        assert res == new_body
+        assert self.cache.request_headers(next(iter(self.cache.storage))) == {
+            "If-None-Match": '"def456"'
+        }
+
+    def test_response_without_validators_is_not_stored(self):
+        self.responses.add(responses.GET, TEST_URL + TEST_ENDPOINT, json=TEST_BODY)
+
+        self.base._get(TEST_ENDPOINT)
+        self.base._get(TEST_ENDPOINT)
+
+        assert self.cache.storage == {}
+        assert "If-None-Match" not in self.responses.calls[1].request.headers
+
+    def test_keys_depend_on_params_and_credentials(self):
+        other = CensysAPIBase(TEST_URL, conditional_cache=self.cache)
+        other._session.auth = ("other-id", "other-secret")
+        url = TEST_URL + TEST_ENDPOINT
+        for page in (1, 2):
+            self.responses.add(
+                responses.GET,
+                f"{url}?page={page}",
+                json=TEST_BODY,
+                headers={"ETag": TEST_ETAG},
+            )
+
+        self.base._get(TEST_ENDPOINT, args={"page": 1})
+        self.base._get(TEST_ENDPOINT, args={"page": 2})
+        other._get(TEST_ENDPOINT, args={"page": 1})
+
+        assert len(self.cache.storage) == 3
+        assert self.cache.stats()["hits"] == 0
+
+    def test_post_is_not_cached(self):
+        self.responses.add(
+            responses.POST,
+            TEST_URL + TEST_ENDPOINT,
+            json=TEST_BODY,
+            headers={"ETag": TEST_ETAG},
+        )
+
+        self.base._post(TEST_ENDPOINT, data={"q": "test"})
+
+        assert self.cache.storage == {}
+
+    def test_disabled_by_default(self):
+        base = CensysAPIBase(TEST_URL)
+        assert base.conditional_cache is None
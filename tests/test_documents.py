@@ -0,0 +1,90 @@
+import pickle
+import unittest
+
+from parameterized import parameterized
+
+from censys.common.documents import LazyDocument, get_field, project_document
+
+DOCUMENT = {
+    "ip": "8.8.8.8",
+    "services": [
+        {"port": 53, "service_name": "DNS"},
+        {"port": 443, "service_name": "HTTP", "http": {"title": "Google"}},
+    ],
+    "autonomous_system": {"asn": 15169, "name": "GOOGLE"},
+    "labels": [],
+}
+
+
+class DocumentsTests(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("ip", "8.8.8.8"),
+            ("autonomous_system.asn", 15169),
+            ("services.port", [53, 443]),
+            ("services.http.title", ["Google"]),
+            ("location.country", None),
+            ("ip.version", None),
+        ]
+    )
+    def test_get_field(self, path, expected):
+        assert get_field(DOCUMENT, path) == expected
+        assert LazyDocument.from_dict(DOCUMENT).get_field(path) == expected
+
+    def test_mapping(self):
+        document = LazyDocument.from_dict(DOCUMENT)
+
+        assert document == DOCUMENT
+        assert document.to_dict() == DOCUMENT
+        assert list(document) == list(DOCUMENT)
+        assert len(document) == len(DOCUMENT)
+        assert "ip" in document
+        assert "location" not in document
+        assert document["services"] == DOCUMENT["services"]
+        assert document.get("location", "missing") == "missing"
+        with self.assertRaises(KeyError):
+            document["location"]
+
+    def test_compact(self):
+        first = LazyDocument.from_dict(DOCUMENT)
+        second = LazyDocument.from_dict({**DOCUMENT, "ip": "8.8.4.4"})
+
+        assert not hasattr(first, "__dict__")
+        assert first._keys is second._keys
+        assert first.nbytes < len(repr(DOCUMENT))
+        assert LazyDocument.from_dict(first) is first
+
+    def test_from_json(self):
+        document = LazyDocument.from_json(b'{"ip": "1.1.1.1", "name": "\\u00e9"}')
+
+        assert document.to_dict() == {"ip": "1.1.1.1", "name": "é"}
+
+    def test_pickle(self):
+        document = LazyDocument.from_dict(DOCUMENT)
+
+        restored = pickle.loads(pickle.dumps(document))
+
+        assert restored.to_dict() == DOCUMENT
+        assert restored._keys is document._keys
+
+    @parameterized.expand(
+        [
+            (["ip"], {"ip": "8.8.8.8"}),
+            (
+                ["services.port", "autonomous_system.asn"],
+                {
+                    "services": [{"port": 53}, {"port": 443}],
+                    "autonomous_system": {"asn": 15169},
+                },
+            ),
+            (["services.http.title"], {"services": [{"http": {"title": "Google"}}]}),
+            (
+                ["autonomous_system", "autonomous_system.asn"],
+                {"autonomous_system": DOCUMENT["autonomous_system"]},
+            ),
+            (["labels.value"], {"labels": []}),
+            (["location.country", "ip.version"], {}),
+        ]
+    )
+    def test_project_document(self, fields, expected):
+        assert project_document(DOCUMENT, fields) == expected
@@ -0,0 +1,112 @@
+import ipaddress
+import os
+import tempfile
+import unittest
+
+import pytest
+
+from censys.common.exceptions import CensysException
+from censys.common.ipset import IPSet
+
+
+class IPSetTests(unittest.TestCase):
+    def setUp(self):
+        self.ip_set = IPSet(
+            [
+                "10.0.0.0/8",
+                "10.0.0.5",
+                "12.0.0.0",
+                "12.0.0.1",
+                3232235777,
+                ipaddress.ip_network("2001:db8::/32"),
+                "::1",
+            ]
+        )
+
+    def test_merges_ranges(self):
+        assert list(self.ip_set.ranges(4)) == [
+            (
+                int(ipaddress.ip_address("10.0.0.0")),
+                int(ipaddress.ip_address("10.255.255.255")),
+            ),
+            (
+                int(ipaddress.ip_address("12.0.0.0")),
+                int(ipaddress.ip_address("12.0.0.1")),
+            ),
+            (3232235777, 3232235777),
+        ]
+        assert list(self.ip_set) == [
+            ipaddress.ip_network("10.0.0.0/8"),
+            ipaddress.ip_network("12.0.0.0/31"),
+            ipaddress.ip_network("192.168.1.1/32"),
+            ipaddress.ip_network("::1/128"),
+            ipaddress.ip_network("2001:db8::/32"),
+        ]
+        assert self.ip_set.num_addresses == 2**24 + 3 + 2**96 + 1
+        # Adjacent ranges are merged
+        assert list(IPSet(["10.0.0.0/8", "11.0.0.0/8"])) == [
+            ipaddress.ip_network("10.0.0.0/7")
+        ]
+
+    def test_contains(self):
+        assert "10.1.2.3" in self.ip_set
+        assert "10.0.0.0/9" in self.ip_set
+        assert "2001:db8:ffff::1" in self.ip_set
+        assert ipaddress.ip_address("192.168.1.1") in self.ip_set
+        assert "9.255.255.255" not in self.ip_set
+        assert "12.0.0.0/30" not in self.ip_set
+        assert "2001:db9::" not in self.ip_set
+        assert "not-an-ip" not in self.ip_set
+        assert not IPSet()
+
+    def test_set_operations(self):
+        other = IPSet(["10.128.0.0/9", "12.0.0.1", "13.0.0.0", "2001:db8::/33"])
+
+        assert list(self.ip_set - other) == [
+            ipaddress.ip_network("10.0.0.0/9"),
+            ipaddress.ip_network("12.0.0.0/32"),
+            ipaddress.ip_network("192.168.1.1/32"),
+            ipaddress.ip_network("::1/128"),
+            ipaddress.ip_network("2001:db8:8000::/33"),
+        ]
+        assert list(self.ip_set & other) == [
+            ipaddress.ip_network("10.128.0.0/9"),
+            ipaddress.ip_network("12.0.0.1/32"),
+            ipaddress.ip_network("2001:db8::/33"),
+        ]
+        assert (self.ip_set | other) - IPSet(["13.0.0.0"]) == self.ip_set
+        assert self.ip_set - self.ip_set == IPSet()
+
+    def test_filter(self):
+        hits = [{"ip": "8.8.8.8"}, {"ip": "10.0.0.1"}]
+
+        assert list(self.ip_set.filter(hits, key=lambda hit: hit["ip"])) == [
+            {"ip": "10.0.0.1"}
+        ]
+        assert list(
+            self.ip_set.filter(hits, key=lambda hit: hit["ip"], exclude=True)
+        ) == [{"ip": "8.8.8.8"}]
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "ips.bin")
+            self.ip_set.save(file_path)
+
+            loaded = IPSet.load(file_path)
+
+            assert loaded == self.ip_set
+            assert "2001:db8::1" in loaded
+            assert "10.0.0.1" in loaded
+            assert list(loaded - IPSet(["10.0.0.0/8"]))[0] == ipaddress.ip_network(
+                "12.0.0.0/31"
+            )
+            del loaded
+
+    def test_load_invalid_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "ips.bin")
+            with open(file_path, "wb") as file:
+                file.write(b"not an ip set file, but long enough")
+
+            with pytest.raises(CensysException, match="not an IP set"):
+                IPSet.load(file_path)
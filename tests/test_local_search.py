@@ -0,0 +1,135 @@
+import json
+import os
+import tempfile
+import unittest
+
+import pytest
+from parameterized import parameterized
+
+from censys.common.conditional import ConditionalCache
+from censys.common.exceptions import CensysQuerySyntaxException
+from censys.common.local_search import (
+    LocalIndex,
+    documents_from_cache,
+    filter_documents,
+    parse_query,
+    read_ndjson,
+)
+
+DOCUMENTS = [
+    {
+        "ip": "10.0.0.1",
+        "services": [
+            {"port": 8443, "service_name": "HTTP"},
+            {"port": 22, "service_name": "SSH"},
+        ],
+        "location": {"country_code": "DE"},
+        "last_updated_at": "2024-01-02T00:00:00Z",
+    },
+    {
+        "ip": "8.8.8.8",
+        "services": [{"port": 53, "service_name": "DNS"}],
+        "location": {"country_code": "US"},
+        "last_updated_at": "2023-05-01T00:00:00Z",
+    },
+    {
+        "ip": "1.1.1.1",
+        "services": [{"port": 443, "service_name": "HTTP", "tls": True}],
+        "location": {"country_code": "DE"},
+        "dns": {"names": ["one.one.one.one"]},
+    },
+]
+INDEXED_FIELDS = [
+    "ip",
+    "services.port",
+    "services.service_name",
+    "services.tls",
+    "location.country_code",
+    "dns.names",
+    "last_updated_at",
+]
+
+
+class LocalSearchTests(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("services.port: 8443 and location.country_code: de", ["10.0.0.1"]),
+            ("services.port: 8443 location.country_code: US", []),
+            ("services.port: [443 to 8443}", ["1.1.1.1"]),
+            ("services.port: {* to 53]", ["10.0.0.1", "8.8.8.8"]),
+            ("services.port > 1000", ["10.0.0.1"]),
+            ("services.port: <= 53", ["10.0.0.1", "8.8.8.8"]),
+            ("services.service_name: ht*", ["10.0.0.1", "1.1.1.1"]),
+            ("services.service_name: ?NS", ["8.8.8.8"]),
+            ("not services.service_name: HTTP", ["8.8.8.8"]),
+            ("-services.service_name: HTTP", ["8.8.8.8"]),
+            ("ip: 10.0.0.0/8 or ip: 1.1.1.1", ["10.0.0.1", "1.1.1.1"]),
+            ("services.port: (53 or 22)", ["10.0.0.1", "8.8.8.8"]),
+            ("last_updated_at: >= 2024-01-01", ["10.0.0.1"]),
+            ("dns.names: *", ["1.1.1.1"]),
+            ("services.tls: true", ["1.1.1.1"]),
+            ('"one.one.one.one"', ["1.1.1.1"]),
+            (
+                "(services.port: 53 or location.country_code: DE) and not ip: 1.1.1.1",
+                ["10.0.0.1", "8.8.8.8"],
+            ),
+            ("", ["10.0.0.1", "8.8.8.8", "1.1.1.1"]),
+        ]
+    )
+    def test_search(self, query: str, expected: list):
+        index = LocalIndex(DOCUMENTS)
+        assert [d["ip"] for d in filter_documents(DOCUMENTS, query)] == expected
+        assert [d["ip"] for d in index.search(query)["hits"]] == expected
+
+        # Indexed fields give the same results
+        index.add_index(*INDEXED_FIELDS)
+        result = index.search(query)
+        assert [d["ip"] for d in result["hits"]] == expected
+        assert result["total"] == len(expected)
+
+    def test_search_limit_and_timing(self):
+        ticks = iter([1.0, 1.25])
+        index = LocalIndex(DOCUMENTS)
+
+        result = index.search(
+            "location.country_code: DE", limit=1, timer=lambda: next(ticks)
+        )
+
+        assert result == {"total": 2, "seconds": 0.25, "hits": [DOCUMENTS[0]]}
+
+    def test_index_lookup(self):
+        index = LocalIndex(DOCUMENTS)
+        index.add_index("services.port")
+
+        assert list(index.indexes["services.port"][53.0]) == [1]
+        assert len(index) == 3
+
+    @parameterized.expand(
+        [("services.port: [1 to",), ("(ip: 1.1.1.1",), ("ip: 1.1.1.1 )",), ("port: >",)]
+    )
+    def test_syntax_error(self, query: str):
+        with pytest.raises(CensysQuerySyntaxException):
+            parse_query(query)
+
+    def test_read_ndjson(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "hosts.ndjson")
+            with open(file_path, "w") as file:
+                for document in DOCUMENTS:
+                    file.write(json.dumps(document) + "\n\n")
+
+            assert list(read_ndjson(file_path)) == DOCUMENTS
+
+    def test_documents_from_cache(self):
+        cache = ConditionalCache()
+        cache.storage["view"] = {
+            "validators": {},
+            "body": json.dumps({"result": DOCUMENTS[0]}).encode(),
+        }
+        cache.storage["search"] = {
+            "validators": {},
+            "body": json.dumps({"result": {"hits": DOCUMENTS[1:]}}).encode(),
+        }
+        cache.storage["invalid"] = {"validators": {}, "body": b"not json"}
+
+        assert list(documents_from_cache(cache.storage)) == DOCUMENTS
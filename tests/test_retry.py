@@ -0,0 +1,325 @@
+import threading
+
+import pytest
+import responses
+
+from .utils import CensysTestCase
+from censys.common.base import CensysAPIBase
+from censys.common.exceptions import (
+    CensysAPIException,
+    CensysCircuitOpenException,
+    CensysInternalServerException,
+    CensysNotFoundException,
+)
+from censys.common.retry import (
+    CircuitBreaker,
+    Hedger,
+    RetryBudget,
+    is_server_failure,
+)
+
+TEST_URL = "https://url"
+TEST_ENDPOINT = "/endpoint"
+
+
+class ServerErrorAPI(CensysAPIBase):
+    @staticmethod
+    def _get_exception_class(_):
+        return CensysInternalServerException
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CircuitBreakerTests(CensysTestCase):
+    def setUp(self):
+        super().setUp()
+        self.clock = FakeClock()
+        self.mocker.patch("censys.common.retry.time.monotonic", self.clock)
+
+    def test_is_server_failure(self):
+        assert is_server_failure(CensysInternalServerException(500, "error"))
+        assert is_server_failure(CensysAPIException(503, "unavailable"))
+        assert not is_server_failure(CensysNotFoundException(404, "missing"))
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+        error = CensysInternalServerException(500, "error")
+
+        breaker.record_failure(error)
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.record_failure(error)
+        assert breaker.state == CircuitBreaker.OPEN
+
+        with pytest.raises(CensysCircuitOpenException):
+            breaker.before_call()
+
+    def test_client_errors_do_not_trip(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure(CensysNotFoundException(404, "missing"))
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_recovery(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        breaker.record_failure(CensysInternalServerException(500, "error"))
+
+        self.clock.now += 10
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        breaker.before_call()
+        # Only one trial call is let through
+        with pytest.raises(CensysCircuitOpenException):
+            breaker.before_call()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_failure_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10)
+        for _ in range(3):
+            breaker.record_failure(CensysInternalServerException(500, "error"))
+
+        self.clock.now += 10
+        breaker.before_call()
+        breaker.record_failure(CensysInternalServerException(500, "error"))
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_interrupted_trial_frees_slot(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        breaker.record_failure(CensysInternalServerException(500, "error"))
+        self.clock.now += 10
+
+        def interrupted():
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            breaker.call(interrupted)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        # The slot is free for another trial call
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_client_fails_fast_when_open(self):
+        self.responses.add(
+            responses.GET, TEST_URL + TEST_ENDPOINT, status=500, json={"error": "down"}
+        )
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+        base = ServerErrorAPI(TEST_URL, circuit_breaker=breaker)
+
+        with pytest.raises(CensysCircuitOpenException):
+            base._get(TEST_ENDPOINT)
+
+        # The breaker opened after two attempts and stopped the retries
+        assert len(self.responses.calls) == 2
+        assert breaker.state == CircuitBreaker.OPEN
+
+
+class RetryBudgetTests(CensysTestCase):
+    def test_budget_accounting(self):
+        budget = RetryBudget(ratio=0.5, capacity=1)
+        assert budget.can_retry()
+        budget.record_retry()
+        assert not budget.can_retry()
+
+        budget.record_request()
+        budget.record_request()
+        assert budget.balance == 1
+        assert budget.can_retry()
+        assert budget.exhausted == 1
+
+    def test_try_acquire(self):
+        budget = RetryBudget(ratio=0.5, capacity=1)
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+        assert budget.retries == 1
+        assert budget.exhausted == 1
+        assert budget.balance == 0
+
+    def test_try_acquire_concurrent(self):
+        budget = RetryBudget(ratio=0.1, capacity=5)
+        barrier = threading.Barrier(20)
+        acquired = []
+
+        def acquire():
+            barrier.wait()
+            acquired.append(budget.try_acquire())
+
+        threads = [threading.Thread(target=acquire) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Each token is spent exactly once
+        assert acquired.count(True) == 5
+        assert budget.balance == 0
+        assert budget.retries == 5
+
+    def test_client_stops_retrying_when_exhausted(self):
+        self.responses.add(
+            responses.GET, TEST_URL + TEST_ENDPOINT, status=500, json={"error": "down"}
+        )
+        budget = RetryBudget(ratio=0.1, capacity=2)
+        base = ServerErrorAPI(TEST_URL, retry_budget=budget)
+
+        with pytest.raises(CensysAPIException):
+            base._get(TEST_ENDPOINT)
+
+        # One request plus the two banked retries
+        assert len(self.responses.calls) == 3
+        assert budget.retries == 2
+        assert budget.requests == 1
+
+
+class HedgerTests(CensysTestCase):
+    def setUp(self):
+        super().setUp()
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def slow_first(self, value):
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+        if call == 1:
+            self.release.wait(5)
+            return f"slow {value}"
+        return f"fast {value}"
+
+    def test_fast_request_is_not_hedged(self):
+        hedger = Hedger(initial_delay=5)
+        self.addCleanup(hedger.close)
+
+        assert hedger.call("/endpoint", lambda: "ok") == "ok"
+        assert hedger.stats() == {
+            "requests": 1,
+            "hedges": 0,
+            "hedge_wins": 0,
+            "exhausted": 0,
+            "win_rate": None,
+        }
+
+    def test_slow_request_is_hedged(self):
+        hedger = Hedger(initial_delay=0.01)
+        self.addCleanup(hedger.close)
+
+        assert hedger.call("/endpoint", self.slow_first, "a") == "fast a"
+        assert self.calls == 2
+        stats = hedger.stats()
+        assert stats["hedges"] == 1
+        assert stats["hedge_wins"] == 1
+        assert stats["win_rate"] == 1.0
+        self.release.set()
+
+    def test_budget_exhausted(self):
+        hedger = Hedger(initial_delay=0.01, ratio=0, capacity=0)
+        self.addCleanup(hedger.close)
+        threading.Timer(0.05, self.release.set).start()
+
+        assert hedger.call("/endpoint", self.slow_first, "a") == "slow a"
+        assert self.calls == 1
+        assert hedger.stats()["exhausted"] == 1
+        assert hedger.stats()["hedges"] == 0
+
+    def test_failed_attempt_waits_for_hedge(self):
+        def fail_first():
+            with self.lock:
+                self.calls += 1
+                call = self.calls
+            if call == 1:
+                self.release.wait(5)
+                raise CensysInternalServerException(500, "error")
+            self.release.set()
+            threading.Event().wait(0.05)
+            return "ok"
+
+        hedger = Hedger(initial_delay=0.01)
+        self.addCleanup(hedger.close)
+        assert hedger.call("/endpoint", fail_first) == "ok"
+        assert hedger.stats()["hedge_wins"] == 1
+
+    def test_all_attempts_failed(self):
+        def fail():
+            raise CensysNotFoundException(404, "not found")
+
+        hedger = Hedger(initial_delay=5)
+        self.addCleanup(hedger.close)
+        with pytest.raises(CensysNotFoundException):
+            hedger.call("/endpoint", fail)
+
+    def test_delay_from_percentile(self):
+        hedger = Hedger(percentile=90, initial_delay=2, min_delay=0.05, min_samples=10)
+        for latency in range(1, 10):
+            hedger.record_latency("/a", latency / 100)
+        assert hedger.delay("/a") == 2
+        hedger.record_latency("/a", 0.1)
+        assert hedger.delay("/a") == 0.09
+        assert hedger.delay("/b") == 2
+
+        hedger = Hedger(min_delay=0.05, min_samples=1)
+        hedger.record_latency("/a", 0.001)
+        assert hedger.delay("/a") == 0.05
+
+    def test_client_hedges_get_requests(self):
+        self.responses.add(
+            responses.GET, TEST_URL + "/v2/hosts/1.1.1.1", json={"result": "ok"}
+        )
+        self.responses.add(responses.POST, TEST_URL + TEST_ENDPOINT, json={"a": 1})
+        hedger = Hedger(initial_delay=5, min_samples=1)
+        self.addCleanup(hedger.close)
+        base = CensysAPIBase(TEST_URL, hedger=hedger)
+
+        assert base._get("/v2/hosts/1.1.1.1") == {"result": "ok"}
+        assert base._post(TEST_ENDPOINT) == {"a": 1}
+        assert hedger.stats()["requests"] == 1
+        assert hedger.delay("/v2/hosts/{id}") < 5
+
+    def test_concurrent_requests_are_not_capped(self):
+        callers = 30
+        # Each attempt waits until every caller's attempt has started
+        barrier = threading.Barrier(callers, timeout=5)
+        hedger = Hedger(initial_delay=10)
+        self.addCleanup(hedger.close)
+        results = []
+
+        def call():
+            results.append(hedger.call("/endpoint", barrier.wait))
+
+        threads = [threading.Thread(target=call) for _ in range(callers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == callers
+        assert hedger.stats()["hedges"] == 0
+
+    def test_client_hedges_each_send_below_retries(self):
+        self.responses.add(
+            responses.GET,
+            TEST_URL + "/v2/hosts/1.1.1.1",
+            status=500,
+            json={"error": "error"},
+        )
+        self.responses.add(
+            responses.GET, TEST_URL + "/v2/hosts/1.1.1.1", json={"result": "ok"}
+        )
+        hedger = Hedger(initial_delay=5)
+        self.addCleanup(hedger.close)
+        budget = RetryBudget()
+        base = ServerErrorAPI(
+            TEST_URL, hedger=hedger, retry_budget=budget, max_retries=2
+        )
+        self.mocker.patch("backoff._sync.time.sleep")
+
+        assert base._get("/v2/hosts/1.1.1.1") == {"result": "ok"}
+        # One hedged send per attempt, and one request and retry in the budget
+        assert hedger.stats()["requests"] == 2
+        assert budget.requests == 1
+        assert budget.retries == 1
@@ -0,0 +1,126 @@
+import gzip
+import json
+
+import requests
+import responses
+from parameterized import parameterized
+from urllib3.util.request import ACCEPT_ENCODING
+
+from .utils import CensysTestCase
+from censys.common.base import CensysAPIBase
+from censys.common.stats import (
+    RequestStats,
+    enable_process_stats,
+    endpoint_template,
+    percentile,
+    timed_phase,
+)
+
+TEST_URL = "https://url"
+
+
+class RequestStatsTests(CensysTestCase):
+    @parameterized.expand(
+        [
+            ("/v2/hosts/1.1.1.1", "/v2/hosts/{id}"),
+            ("/v2/hosts/2001:db8::1/names", "/v2/hosts/{id}/names"),
+            ("/v2/certificates/fb444eb8e684", "/v2/certificates/{id}"),
+            ("/v1/seeds/6", "/v1/seeds/{id}"),
+            ("/v1/clouds/hostCounts/2021-01-01", "/v1/clouds/hostCounts/{id}"),
+            ("/v2/hosts/search", "/v2/hosts/search"),
+            ("/inventory/v1/saved-query", "/inventory/v1/saved-query"),
+        ]
+    )
+    def test_endpoint_template(self, endpoint, expected):
+        assert endpoint_template(endpoint) == expected
+
+    def test_accept_encoding(self):
+        base = CensysAPIBase(TEST_URL)
+        assert base._session.headers["Accept-Encoding"] == ACCEPT_ENCODING
+
+    def test_records_compressed_and_decoded_bytes(self):
+        body = json.dumps({"result": "a" * 4096}).encode()
+        compressed = gzip.compress(body)
+        for ip in ["1.1.1.1", "8.8.8.8"]:
+            self.responses.add(
+                responses.GET,
+                f"{TEST_URL}/v2/hosts/{ip}",
+                body=compressed,
+                headers={"Content-Encoding": "gzip"},
+            )
+        base = CensysAPIBase(TEST_URL)
+
+        base._get("/v2/hosts/1.1.1.1")
+        base._get("/v2/hosts/8.8.8.8")
+
+        stats = base.stats.snapshot()["/v2/hosts/{id}"]
+        assert stats["requests"] == 2
+        assert stats["wire_bytes"] == 2 * len(compressed)
+        assert stats["body_bytes"] == 2 * len(body)
+        assert stats["compression_ratio"] > 1
+        assert base.stats.totals()["requests"] == 2
+
+    def test_reset(self):
+        stats = RequestStats()
+        stats.record_response("/endpoint", object())
+        assert stats.snapshot() == {
+            "/endpoint": {
+                "requests": 1,
+                "wire_bytes": 0,
+                "body_bytes": 0,
+                "compression_ratio": None,
+            }
+        }
+        stats.reset()
+        assert stats.snapshot() == {}
+
+    @parameterized.expand(
+        [
+            ([], 50, None),
+            ([1.0], 99, 1.0),
+            ([1.0, 2.0, 3.0, 4.0], 50, 2.0),
+            ([float(i) for i in range(1, 101)], 90, 90.0),
+            ([float(i) for i in range(1, 101)], 99, 99.0),
+        ]
+    )
+    def test_percentile(self, values, q, expected):
+        assert percentile(values, q) == expected
+
+    def test_summary(self):
+        self.mocker.patch("censys.common.stats.process_stats", None)
+        parent = enable_process_stats()
+        self.responses.add(
+            responses.GET, f"{TEST_URL}/v2/hosts/1.1.1.1", json={"result": {}}
+        )
+        self.responses.add(
+            responses.GET,
+            f"{TEST_URL}/v2/hosts/8.8.8.8",
+            body=requests.exceptions.ConnectionError(),
+        )
+        self.responses.add(
+            responses.GET, f"{TEST_URL}/v2/hosts/8.8.8.8", json={"result": {}}
+        )
+        base = CensysAPIBase(TEST_URL)
+
+        base._get("/v2/hosts/1.1.1.1")
+        base._get("/v2/hosts/8.8.8.8")
+        with base.stats.phase("render"):
+            pass
+
+        for stats in (base.stats, parent):
+            summary = stats.summary()
+            assert summary["requests"] == 2
+            assert summary["retries"] == 1
+            assert summary["latency"]["p50"] >= 0
+            assert summary["latency"]["max"] >= summary["latency"]["p50"]
+            assert set(summary["phases"]) == {"network", "decode", "render"}
+
+        base.stats.reset()
+        assert base.stats.summary()["latency"]["p50"] is None
+        assert base.stats.phases() == {}
+
+    def test_process_stats_disabled(self):
+        self.mocker.patch("censys.common.stats.process_stats", None)
+        with timed_phase("render"):
+            pass
+        assert CensysAPIBase(TEST_URL).stats.parent is None
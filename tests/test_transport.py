@@ -0,0 +1,175 @@
+import gzip
+import json
+import os
+import tempfile
+
+import pytest
+import responses
+from requests.models import Response
+
+from .utils import CensysTestCase
+from censys.common.base import CensysAPIBase
+from censys.common.exceptions import CensysAPIException, CensysException
+from censys.common.transport import (
+    HTTPXTransport,
+    RecordingTransport,
+    ReplayTransport,
+    RequestsTransport,
+    Transport,
+    request_key,
+)
+
+TEST_URL = "https://url"
+TEST_ENDPOINT = "/endpoint"
+
+
+class StaticTransport(Transport):
+    def __init__(self, body: dict):
+        super().__init__()
+        self.body = body
+        self.calls: list = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        res = Response()
+        res.status_code = 200
+        res._content = json.dumps(self.body).encode()
+        res.url = url
+        return res
+
+
+class TransportTests(CensysTestCase):
+    def test_default_transport(self):
+        self.responses.add(
+            responses.GET, TEST_URL + TEST_ENDPOINT, status=200, json={"ok": True}
+        )
+        base = CensysAPIBase(TEST_URL)
+
+        assert isinstance(base._transport, RequestsTransport)
+        assert base._session is base._transport.session
+        assert base._get(TEST_ENDPOINT) == {"ok": True}
+
+    def test_custom_transport(self):
+        transport = StaticTransport({"result": "test"})
+        base = CensysAPIBase(TEST_URL, transport=transport, user_agent="test")
+
+        assert base._post(TEST_ENDPOINT, data={"a": 1}) == {"result": "test"}
+        assert transport.calls == [
+            (
+                "POST",
+                TEST_URL + TEST_ENDPOINT,
+                {"params": {}, "timeout": 30, "json": {"a": 1}},
+            )
+        ]
+        assert transport.session.headers["User-Agent"].endswith(" test")
+
+    def test_base_transport_not_implemented(self):
+        with pytest.raises(NotImplementedError):
+            Transport().get(TEST_URL)
+
+    def test_httpx_not_installed(self):
+        self.mocker.patch.dict("sys.modules", {"httpx": None})
+        with pytest.raises(CensysException, match="requires httpx"):
+            HTTPXTransport()
+
+
+class RecordReplayTests(CensysTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = self.tmp.name
+
+    def record(self):
+        self.responses.add(
+            responses.GET,
+            TEST_URL + TEST_ENDPOINT,
+            status=200,
+            json={"page": 1},
+            match=[responses.matchers.query_param_matcher({"q": "a"})],
+        )
+        self.responses.add(
+            responses.GET,
+            TEST_URL + TEST_ENDPOINT,
+            status=200,
+            json={"page": 2},
+            match=[responses.matchers.query_param_matcher({"q": "a"})],
+        )
+        self.responses.add(
+            responses.POST,
+            TEST_URL + TEST_ENDPOINT,
+            status=404,
+            json={"error": "Not found", "status": "Not Found"},
+        )
+        base = CensysAPIBase(TEST_URL, transport=RecordingTransport(self.path))
+        assert base._get(TEST_ENDPOINT, {"q": "a"}) == {"page": 1}
+        assert base._get(TEST_ENDPOINT, {"q": "a", "cursor": None}) == {"page": 2}
+        with pytest.raises(CensysAPIException, match="Not found"):
+            base._post(TEST_ENDPOINT, data={"ids": ["a"]})
+
+    def test_record_and_replay(self):
+        self.record()
+        self.responses.reset()
+
+        transport = ReplayTransport(self.path)
+        base = CensysAPIBase(TEST_URL, transport=transport)
+        assert base._get(TEST_ENDPOINT, {"q": "a"}) == {"page": 1}
+        assert base._get(TEST_ENDPOINT, {"q": "a"}) == {"page": 2}
+        # The last response is repeated
+        assert base._get(TEST_ENDPOINT, {"q": "a"}) == {"page": 2}
+        with pytest.raises(CensysAPIException, match="Not found"):
+            base._post(TEST_ENDPOINT, data={"ids": ["a"]})
+        assert transport.replayed == 4
+
+        transport.reset()
+        assert base._get(TEST_ENDPOINT, {"q": "a"}) == {"page": 1}
+
+    def test_cassette_layout(self):
+        self.record()
+
+        requests_dir = os.path.join(self.path, "requests")
+        bodies_dir = os.path.join(self.path, "bodies")
+        assert len(os.listdir(requests_dir)) == 2
+        assert len(os.listdir(bodies_dir)) == 3
+        key = request_key("GET", TEST_URL + TEST_ENDPOINT, params={"q": "a"})
+        with gzip.open(os.path.join(requests_dir, f"{key}.json.gz")) as file:
+            entry = json.loads(file.read())
+        assert entry["method"] == "GET"
+        assert [r["status_code"] for r in entry["responses"]] == [200, 200]
+
+    def test_request_key(self):
+        url = TEST_URL + TEST_ENDPOINT
+        assert request_key("get", url, params={"a": 1, "b": None}) == request_key(
+            "GET", url, params={"a": 1}, timeout=30, headers={"x": "y"}
+        )
+        assert request_key("POST", url, json={"a": 1}) != request_key(
+            "POST", url, json={"a": 2}
+        )
+
+    def test_replay_unrecorded_request(self):
+        self.record()
+        base = CensysAPIBase(TEST_URL, transport=ReplayTransport(self.path))
+        with pytest.raises(CensysException, match="No recorded response"):
+            base._get("/other")
+
+    def test_replay_missing_cassette(self):
+        with pytest.raises(CensysException, match="does not exist"):
+            ReplayTransport(os.path.join(self.path, "missing"))
+
+    def test_replay_latency(self):
+        self.record()
+        sleep = self.mocker.patch("censys.common.transport.time.sleep")
+        transport = ReplayTransport(self.path, latency=2.0)
+        with gzip.open(
+            os.path.join(
+                self.path,
+                "requests",
+                request_key("GET", TEST_URL + TEST_ENDPOINT, params={"q": "a"})
+                + ".json.gz",
+            )
+        ) as file:
+            elapsed = json.loads(file.read())["responses"][0]["elapsed"]
+
+        res = transport.get(TEST_URL + TEST_ENDPOINT, params={"q": "a"})
+        sleep.assert_called_once_with(elapsed * 2.0)
+        assert res.elapsed.total_seconds() == elapsed
@@ -1,9 +1,15 @@
 import datetime
 import unittest
 
+import pytest
 from parameterized import parameterized
 
-from censys.common.utils import format_iso8601, format_rfc3339
+from censys.common.utils import (
+    format_iso8601,
+    format_rfc3339,
+    parse_datetime,
+    split_time_range,
+)
 
 
 class UtilsTest(unittest.TestCase):
@@ -29,3 +35,29 @@ class UtilsTest(unittest.TestCase):
     )
     def test_format_iso8601(self, since, actual):
         assert format_iso8601(since) == actual
+
+    @parameterized.expand(
+        [
+            ["2021-01-01", datetime.datetime(2021, 1, 1)],
+            [datetime.date(2021, 1, 1), datetime.datetime(2021, 1, 1)],
+            [
+                "2021-04-01T13:40:03.755876935Z",
+                datetime.datetime(2021, 4, 1, 13, 40, 3, 755876),
+            ],
+            ["2021-01-01T02:00:00+02:00", datetime.datetime(2021, 1, 1)],
+        ]
+    )
+    def test_parse_datetime(self, time, actual):
+        assert parse_datetime(time) == actual
+
+    def test_split_time_range(self):
+        assert split_time_range("2021-01-01", "2021-01-02", 2) == [
+            (datetime.datetime(2021, 1, 1), datetime.datetime(2021, 1, 1, 12)),
+            (datetime.datetime(2021, 1, 1, 12), datetime.datetime(2021, 1, 2)),
+        ]
+
+    def test_split_time_range_invalid(self):
+        with pytest.raises(ValueError, match="at least 1"):
+            split_time_range("2021-01-01", "2021-01-02", 0)
+        with pytest.raises(ValueError, match="End time must be after start time."):
+            split_time_range("2021-01-02", "2021-01-01", 2)